@@ -0,0 +1,111 @@
+import argparse
+import threading
+import time
+from typing import Callable, List, Union
+
+from src.core.contracts.clock import Clock
+from src.core.contracts.read_only_clock import ReadOnlyClock
+from src.core.time.thread_safe_clock import ThreadSafeClock
+
+
+class DoubleLockClock(Clock):
+    """
+    Baseline reproducing the previous ThreadSafeClock: now() takes the clock's
+    lock, and its read-only view takes a second lock around that call.
+    """
+
+    def __init__(self) -> None:
+        self._time = 0
+        self._lock = threading.Lock()
+
+    def tick(self) -> int:
+        with self._lock:
+            self._time += 1
+            return self._time
+
+    def now(self) -> int:
+        with self._lock:
+            return self._time
+
+    def restore(self, time: int) -> None:
+        with self._lock:
+            self._time = time
+
+    def as_read_only(self) -> ReadOnlyClock:
+        return _DoubleLockReadOnlyClock(self)
+
+
+class _DoubleLockReadOnlyClock(ReadOnlyClock):
+    def __init__(self, clock: Clock) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def now(self) -> int:
+        with self._lock:
+            return self._clock.now()
+
+
+def measure(
+    clock: Union[DoubleLockClock, ThreadSafeClock], threads: int, reads: int, ticks: int
+) -> float:
+    """
+    Run `threads` reader threads through the read-only view while one thread ticks.
+    Returns:
+        Total reads per second across all reader threads.
+    """
+    read_only_clock = clock.as_read_only()
+    barrier = threading.Barrier(threads + 2)
+
+    def reader() -> None:
+        now = read_only_clock.now
+        barrier.wait()
+        for _ in range(reads):
+            now()
+
+    def ticker() -> None:
+        tick = clock.tick
+        barrier.wait()
+        for _ in range(ticks):
+            tick()
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=reader) for _ in range(threads)
+    ]
+    workers.append(threading.Thread(target=ticker))
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    return threads * reads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the read throughput of ThreadSafeClock with the"
+        " previous double-lock implementation."
+    )
+    parser.add_argument("--reads", type=int, default=50000)
+    parser.add_argument("--ticks", type=int, default=50000)
+    parser.add_argument("--max-threads", type=int, default=32)
+    args = parser.parse_args()
+
+    clocks: List[Callable[[], Union[DoubleLockClock, ThreadSafeClock]]] = [
+        DoubleLockClock,
+        ThreadSafeClock,
+    ]
+
+    print(f"{'threads':>8}" + "".join(f"{make.__name__:>20}" for make in clocks))
+    threads = 1
+    while threads <= args.max_threads:
+        rates = [measure(make(), threads, args.reads, args.ticks) for make in clocks]
+        print(f"{threads:>8}" + "".join(f"{rate:>16.0f} r/s" for rate in rates))
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import pickle
+import timeit
+
+from src.core.codec.event_codec_registry import default_event_codecs
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.fibonacci_number import FibonacciNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+
+
+def report(label: str, seconds: float, count: int) -> None:
+    print(f"{label:<40}{seconds / count * 1e9:>12.0f} ns/event")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare Event.to_dict with the precompiled event codecs."
+    )
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    events = [
+        CounterNumber(timestamp=0, producer_id="CounterProducer_0", value=42),
+        FibonacciNumber(timestamp=1, producer_id="FibonacciProducer_1", value=2**90),
+        RandomNumber(timestamp=2, producer_id="SeededRandomProducer_2", value=0.5),
+    ]
+
+    for event in events:
+        name = type(event).__name__
+        codec = default_event_codecs.codec_for(type(event))
+        encoded = codec.encode(event)
+        pickled = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+
+        print(
+            f"\n--- {name} ({len(encoded)} bytes encoded, {len(pickled)} pickled) ---"
+        )
+        report(
+            "Event.to_dict", timeit.timeit(event.to_dict, number=args.count), args.count
+        )
+        report(
+            "EventCodec.to_dict",
+            timeit.timeit(lambda: codec.to_dict(event), number=args.count),
+            args.count,
+        )
+        report(
+            "EventCodec.encode",
+            timeit.timeit(lambda: codec.encode(event), number=args.count),
+            args.count,
+        )
+        report(
+            "EventCodec.decode",
+            timeit.timeit(lambda: codec.decode(encoded, 0), number=args.count),
+            args.count,
+        )
+        report(
+            "pickle.dumps",
+            timeit.timeit(
+                lambda: pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL),
+                number=args.count,
+            ),
+            args.count,
+        )
+        report(
+            "pickle.loads",
+            timeit.timeit(lambda: pickle.loads(pickled), number=args.count),
+            args.count,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import timeit
+import tracemalloc
+from abc import ABC
+from dataclasses import dataclass
+from typing import Callable, List
+
+from src.core.contracts.event import Event
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.event_factory import compile_event_factory
+
+
+@dataclass(frozen=True)
+class DictEvent(ABC):
+    """Replica of the previous, unslotted Event layout."""
+
+    timestamp: int
+    producer_id: str
+
+
+@dataclass(frozen=True)
+class DictCounterNumber(DictEvent):
+    value: int
+
+
+def bytes_per_event(build: Callable[[int], object], count: int) -> float:
+    """Measure the memory retained per event while holding `count` events."""
+    tracemalloc.start()
+    events: List[object] = [build(i) for i in range(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return retained / count
+
+
+def report(label: str, build: Callable[[int], object], count: int) -> None:
+    seconds = timeit.timeit(lambda: build(1), number=count)
+    memory = bytes_per_event(build, count)
+    print(f"{label:<34}{seconds / count * 1e9:>12.0f}{memory:>16.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the unslotted and slotted event layouts."
+    )
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    make_counter: Callable[..., Event] = compile_event_factory(CounterNumber, "p")
+
+    print(f"{'layout':<34}{'ns/event':>12}{'bytes/event':>16}")
+    report(
+        "frozen dataclass (__dict__)",
+        lambda i: DictCounterNumber(timestamp=i, producer_id="p", value=i),
+        args.count,
+    )
+    report(
+        "frozen dataclass (slots)",
+        lambda i: CounterNumber(timestamp=i, producer_id="p", value=i),
+        args.count,
+    )
+    report("slots + compiled event factory", lambda i: make_counter(i, i), args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import os
+import time
+
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.contracts.read_only_clock import ReadOnlyClock
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.execution.parallel_runner import ParallelRunner
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.time.simple_clock import SimpleClock
+from src.producers.base.base_producer import BaseProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+
+
+class BusyProducer(BaseProducer):
+    """
+    CPU-bound producer standing in for an algorithm simulation.
+    """
+
+    def __init__(self, *, clock: ReadOnlyClock, limit: int, work: int) -> None:
+        super().__init__(clock=clock)
+        self._limit = limit
+        self._work = work
+
+    def _on_start(self) -> None:
+        self._index = 0
+
+    def _step(self, timestamp: int) -> CounterNumber:
+        total = 0
+        for i in range(self._work):
+            total += i * i
+        event = CounterNumber(
+            timestamp=timestamp, producer_id=self._producer_id, value=total
+        )
+
+        self._index += 1
+        if self._index >= self._limit:
+            self._finished = True
+
+        return event
+
+
+class CountingConsumer(SynchronousConsumer):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _handle(self, event: Event) -> None:
+        self.count += 1
+
+
+async def run_once(
+    runner_cls, producers: int, steps: int, work: int, **kwargs
+) -> float:
+    """
+    Run a set of BusyProducers to completion and return the elapsed seconds.
+    """
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    transport = InMemoryTransport()
+    consumer = CountingConsumer()
+    transport.subscribe(consumer)
+
+    runner = runner_cls(
+        clock=clock,
+        producers=[
+            BusyProducer(clock=read_only_clock, limit=steps, work=work)
+            for _ in range(producers)
+        ],
+        transport=transport,
+        **kwargs,
+    )
+
+    started = time.perf_counter()
+    await runner.run()
+    await transport.shutdown()
+    elapsed = time.perf_counter() - started
+
+    assert consumer.count == producers * steps
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare SimpleRunner with ParallelRunner on 1 to N cores."
+    )
+    parser.add_argument("--producers", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--work", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    baseline = await run_once(SimpleRunner, args.producers, args.steps, args.work)
+    print(f"{'runner':<22}{'seconds':>10}{'speedup':>10}")
+    print(f"{'SimpleRunner':<22}{baseline:>10.3f}{1.0:>10.2f}")
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 < args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if args.max_workers > 1:
+        worker_counts.append(args.max_workers)
+
+    for workers in worker_counts:
+        elapsed = await run_once(
+            ParallelRunner,
+            args.producers,
+            args.steps,
+            args.work,
+            number_of_workers=workers,
+        )
+        label = f"ParallelRunner x{workers}"
+        print(f"{label:<22}{elapsed:>10.3f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.time.simple_clock import SimpleClock
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.producers.examples.counter_producer import CounterProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+
+
+class CountingConsumer(SynchronousConsumer):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _handle(self, event: Event) -> None:
+        self.count += 1
+
+
+async def run_once(producers: int, steps: int, fused: bool, traced: bool) -> float:
+    """
+    Run CounterProducers to completion and return the elapsed seconds, either
+    through run() or by calling step() in a loop.
+    """
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    transport = InMemoryTransport()
+    consumer = CountingConsumer()
+    transport.subscribe(consumer)
+    tracer: Optional[SimpleRunnerTracer] = SimpleRunnerTracer() if traced else None
+
+    runner = SimpleRunner(
+        clock=clock,
+        producers=[
+            CounterProducer(clock=read_only_clock, limit=steps)
+            for _ in range(producers)
+        ],
+        transport=transport,
+        tracer=tracer,
+    )
+
+    started = time.perf_counter()
+    if fused:
+        await runner.run()
+    else:
+        await runner.start()
+        while not runner.is_finished():
+            await runner.step()
+    await transport.shutdown()
+    elapsed = time.perf_counter() - started
+
+    assert consumer.count == producers * steps
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare stepping SimpleRunner in a loop with the fused run()."
+    )
+    parser.add_argument("--producers", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    events = args.producers * args.steps
+    print(f"{'mode':<28}{'seconds':>10}{'ns/event':>12}{'speedup':>10}")
+    for traced in (False, True):
+        baseline = await run_once(args.producers, args.steps, False, traced)
+        fused = await run_once(args.producers, args.steps, True, traced)
+        suffix = "with tracer" if traced else "no tracer"
+        for label, elapsed in (("step() loop", baseline), ("fused run()", fused)):
+            print(
+                f"{label + ', ' + suffix:<28}{elapsed:>10.3f}"
+                f"{elapsed / events * 1e9:>12.0f}{baseline / elapsed:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
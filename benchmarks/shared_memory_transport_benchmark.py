@@ -0,0 +1,156 @@
+import argparse
+import asyncio
+import multiprocessing
+import queue
+import statistics
+import time
+from typing import Any, List, Optional, Union
+
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.events.counter.counter_number import CounterNumber
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from src.transport.shared_memory.shared_memory_transport import SharedMemoryTransport
+
+
+class ProbeConsumer(SynchronousConsumer):
+    """
+    Consumer reporting the delivery latency of every event, whose value carries
+    its publish time in perf_counter_ns(). CLOCK_MONOTONIC is shared by every
+    process on Linux, so latencies measured in consumer processes are comparable.
+    Warm-up events, with a negative timestamp, are not measured.
+    """
+
+    def __init__(self, samples: Optional[Any] = None) -> None:
+        self._samples = samples
+
+    def _handle(self, event: Event) -> None:
+        if (
+            self._samples is not None
+            and isinstance(event, CounterNumber)
+            and event.timestamp >= 0
+        ):
+            self._samples.put(time.perf_counter_ns() - event.value)
+
+
+def make_transport(
+    kind: str,
+    consumers: int,
+    start_method: Optional[str],
+    samples: Optional[Any] = None,
+) -> Union[InMemoryTransport, SharedMemoryTransport]:
+    transport: Union[InMemoryTransport, SharedMemoryTransport]
+    if kind == "in-memory":
+        transport = InMemoryTransport()
+    else:
+        transport = SharedMemoryTransport(start_method=start_method)
+    for _ in range(consumers):
+        transport.subscribe(ProbeConsumer(samples))
+    return transport
+
+
+async def warm_up(transport: Union[InMemoryTransport, SharedMemoryTransport]) -> None:
+    """Wait until every consumer is running, so process start-up is not measured."""
+    await transport.publish(
+        CounterNumber(timestamp=-1, producer_id="CounterProducer_0", value=0)
+    )
+    await transport.flush()
+
+
+async def measure_throughput(
+    kind: str, consumers: int, events: int, start_method: Optional[str]
+) -> float:
+    """
+    Publish `events` events in batches and return the events per second
+    delivered to every consumer.
+    """
+    transport = make_transport(kind, consumers, start_method)
+    await transport.start()
+    await warm_up(transport)
+    batch = [
+        CounterNumber(timestamp=i, producer_id="CounterProducer_0", value=0)
+        for i in range(256)
+    ]
+
+    started = time.perf_counter()
+    for _ in range(events // len(batch)):
+        await transport.publish_many(batch)
+    await transport.flush()
+    elapsed = time.perf_counter() - started
+
+    await transport.shutdown()
+    return (events // len(batch)) * len(batch) / elapsed
+
+
+async def measure_latency(
+    kind: str, consumers: int, rounds: int, start_method: Optional[str]
+) -> List[float]:
+    """
+    Publish one event at a time, waiting for every consumer to handle it, and
+    return the delivery latencies in microseconds.
+    """
+    samples: Any = (
+        queue.SimpleQueue()
+        if kind == "in-memory"
+        else multiprocessing.get_context(start_method).SimpleQueue()
+    )
+    transport = make_transport(kind, consumers, start_method, samples)
+    await transport.start()
+    await warm_up(transport)
+
+    for i in range(rounds):
+        await transport.publish(
+            CounterNumber(
+                timestamp=i,
+                producer_id="CounterProducer_0",
+                value=time.perf_counter_ns(),
+            )
+        )
+        await transport.flush()
+    await transport.shutdown()
+
+    return [samples.get() / 1000 for _ in range(rounds * consumers)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare InMemoryTransport with SharedMemoryTransport "
+        "for 1 to 8 consumers."
+    )
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--max-consumers", type=int, default=8)
+    parser.add_argument(
+        "--start-method",
+        choices=multiprocessing.get_all_start_methods(),
+        default=None,
+        help="multiprocessing start method, defaults to the platform's",
+    )
+    args = parser.parse_args()
+
+    consumer_counts = [1]
+    while consumer_counts[-1] * 2 <= args.max_consumers:
+        consumer_counts.append(consumer_counts[-1] * 2)
+
+    print(
+        f"{'transport':<20}{'consumers':>10}{'events/s':>14}"
+        f"{'p50 us':>10}{'p99 us':>10}"
+    )
+    for kind in ("in-memory", "shared-memory"):
+        for consumers in consumer_counts:
+            throughput = await measure_throughput(
+                kind, consumers, args.events, args.start_method
+            )
+            latencies = sorted(
+                await measure_latency(kind, consumers, args.rounds, args.start_method)
+            )
+            p50 = statistics.median(latencies)
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{kind:<20}{consumers:>10}{throughput:>14,.0f}"
+                f"{p50:>10.1f}{p99:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
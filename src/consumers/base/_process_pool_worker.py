@@ -0,0 +1,31 @@
+from typing import Any, Callable, List, Sequence, Union
+
+from src.core.codec.event_codec_registry import default_event_codecs
+from src.core.contracts.event import Event
+
+# A batch shipped to a ProcessPoolConsumer worker: codec-encoded bytes, or a
+# list of events pickled by the executor when a type has no registered codec
+Payload = Union[bytes, List[Event]]
+
+
+def encode_batch(events: Sequence[Event]) -> Payload:
+    """
+    Encode a batch with the default event codecs when every event type is
+    registered, and fall back to shipping the events themselves otherwise.
+    """
+    is_registered = default_event_codecs.is_registered
+    if all(is_registered(type(event)) for event in events):
+        return default_event_codecs.encode_many(events)
+    return list(events)
+
+
+def decode_batch(payload: Payload) -> List[Event]:
+    """Rebuild a batch produced by encode_batch() inside the worker process."""
+    if isinstance(payload, bytes):
+        return default_event_codecs.decode_many(payload)
+    return payload
+
+
+def run_batch(process_batch: Callable[[List[Event]], Any], payload: Payload) -> Any:
+    """Entry point of a ProcessPoolConsumer task, run in a worker process."""
+    return process_batch(decode_batch(payload))
@@ -1,5 +1,6 @@
 import logging
 from abc import abstractmethod
+from typing import Sequence
 
 from src.core.contracts.consumer import Consumer
 from src.core.contracts.event import Event
@@ -26,6 +27,20 @@ class AsynchronousConsumer(Consumer):
                 extra={"consumer": self.__class__.__name__, "event": event},
             )
 
+    async def on_events(self, events: Sequence[Event]) -> None:
+        """
+        Handles a batch of events emitted by producers asynchronously.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        try:
+            await self._handle_batch(events)
+        except Exception:
+            logger.exception(
+                "AsynchronousConsumer failed to process batch",
+                extra={"consumer": self.__class__.__name__, "batch_size": len(events)},
+            )
+
     @abstractmethod
     async def _handle(self, event: Event) -> None:
         """
@@ -35,6 +50,29 @@ class AsynchronousConsumer(Consumer):
         """
         pass
 
+    async def _handle_batch(self, events: Sequence[Event]) -> None:
+        """
+        Internal method to handle a batch of events. Subclasses can override this
+        method to process the whole batch at once (e.g. a bulk insert).
+        By default each event is passed to _handle() in order, and a failing event
+        is logged with its position in the batch without affecting the others.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        for index, event in enumerate(events):
+            try:
+                await self._handle(event)
+            except Exception:
+                logger.exception(
+                    "AsynchronousConsumer failed to process event in batch",
+                    extra={
+                        "consumer": self.__class__.__name__,
+                        "event": event,
+                        "batch_index": index,
+                        "batch_size": len(events),
+                    },
+                )
+
     @property
     def consumer_id(self) -> str:
         """
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.contracts.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSynchronousConsumer(SynchronousConsumer):
+    """
+    A synchronous consumer whose blocking _handle() runs off the event loop.
+
+    - Events are handed to `max_workers` single-threaded executor lanes. Every
+      producer is pinned to one lane, so each producer's events are handled in
+      the order they were received; events of different producers may interleave.
+    - on_event()/on_events() return once the work is submitted. At most
+      `max_in_flight` events are submitted but not yet handled, beyond that they
+      wait, which pushes back on the transport worker calling them.
+    - Call drain() to wait for submitted events, and close() to drain and stop
+      the executor threads.
+    """
+
+    def __init__(self, max_workers: int = 4, max_in_flight: int = 1024) -> None:
+        """
+        Args:
+            max_workers (int): Number of executor lanes, each backed by one thread.
+            max_in_flight (int): Maximum number of submitted events not yet handled.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        self._max_in_flight = max_in_flight
+        self._lanes = [
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.consumer_id}-lane-{index}"
+            )
+            for index in range(max_workers)
+        ]
+        self._lane_of: Dict[str, int] = {}
+        self._lane_depths = [0] * max_workers
+        self._in_flight = 0
+        self._completed = 0
+        self._pending: Set[asyncio.Future] = set()
+        self._slot_freed = asyncio.Event()
+
+    async def on_event(self, event: Event) -> None:
+        """
+        Submits a single event to its producer's lane.
+        Args:
+            event (Event): The event to be handled
+        """
+        await self._reserve(1)
+        self._submit(self._lane_for(event.producer_id), self.handle_event, event, 1)
+
+    async def on_events(self, events: Sequence[Event]) -> None:
+        """
+        Splits a batch by lane and submits each part as one task, keeping the
+        batch order within every lane.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        if not events:
+            return
+
+        parts: Dict[int, List[Event]] = {}
+        for event in events:
+            parts.setdefault(self._lane_for(event.producer_id), []).append(event)
+
+        for lane, part in parts.items():
+            await self._reserve(len(part))
+            self._submit(lane, self.handle_events, part, len(part))
+
+    async def drain(self) -> None:
+        """
+        Wait until every submitted event has been handled.
+        """
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+
+    async def close(self) -> None:
+        """
+        Drain the submitted events and stop the executor threads.
+        """
+        await self.drain()
+        for lane in self._lanes:
+            lane.shutdown(wait=True)
+
+    @property
+    def in_flight_events(self) -> int:
+        """Number of submitted events that have not been handled yet."""
+        return self._in_flight
+
+    @property
+    def completed_events(self) -> int:
+        """Number of submitted events that have been handled."""
+        return self._completed
+
+    @property
+    def lane_depths(self) -> List[int]:
+        """Number of events queued or running on each executor lane."""
+        return self._lane_depths.copy()
+
+    def _lane_for(self, producer_id: str) -> int:
+        """Pin producers to lanes round-robin, in order of first appearance."""
+        lane = self._lane_of.get(producer_id)
+        if lane is None:
+            lane = len(self._lane_of) % len(self._lanes)
+            self._lane_of[producer_id] = lane
+        return lane
+
+    async def _reserve(self, count: int) -> None:
+        """
+        Wait until `count` more events fit within the in-flight limit. A part
+        larger than the limit is admitted once nothing else is in flight.
+        """
+        while self._in_flight and self._in_flight + count > self._max_in_flight:
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+        self._in_flight += count
+
+    def _submit(
+        self, lane: int, handler: Callable[[Any], None], payload: Any, count: int
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._lanes[lane], handler, payload)
+        self._lane_depths[lane] += count
+        self._pending.add(future)
+        future.add_done_callback(partial(self._on_done, lane, count))
+
+    def _on_done(self, lane: int, count: int, future: asyncio.Future) -> None:
+        """Runs on the event loop once a submitted task finishes."""
+        self._pending.discard(future)
+        self._lane_depths[lane] -= count
+        self._in_flight -= count
+        self._completed += count
+        self._slot_freed.set()
+
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(
+                "ExecutorSynchronousConsumer task failed",
+                exc_info=future.exception(),
+                extra={"consumer": self.__class__.__name__, "batch_size": count},
+            )
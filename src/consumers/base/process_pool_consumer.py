@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import multiprocessing
+from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Set
+
+from src.consumers.base._process_pool_worker import encode_batch, run_batch
+from src.core.contracts.consumer import Consumer
+from src.core.contracts.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPoolConsumer(Consumer):
+    """
+    A consumer that analyses batches of events in worker processes.
+
+    - Each delivered batch is encoded with the default event codecs (or pickled
+      when an event type has no registered codec) and handed to a
+      ProcessPoolExecutor, where _process_batch() runs outside the GIL of the
+      event loop's process.
+    - Results come back to the event loop through _on_result(), in the order
+      the batches were delivered.
+    - on_event()/on_events() return once the batch is submitted. At most
+      `max_in_flight_batches` batches are in flight, beyond that they wait,
+      which pushes back on the transport worker calling them.
+    - Call drain() to wait for submitted batches, and close() to drain and stop
+      the worker processes.
+
+    Subclasses must be defined at module level so that _process_batch() can be
+    pickled, and custom event types should be registered on
+    default_event_codecs at import time so workers can decode them.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_in_flight_batches: int = 16,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            max_workers (Optional[int]): Number of worker processes, defaults to the CPU count.
+            max_in_flight_batches (int): Maximum number of submitted batches without a result.
+            start_method (Optional[str]): multiprocessing start method, defaults to the platform's.
+        """
+        if max_in_flight_batches < 1:
+            raise ValueError("max_in_flight_batches must be at least 1.")
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        self._slots = asyncio.Semaphore(max_in_flight_batches)
+        self._last: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+        self._processed_events = 0
+
+    async def on_event(self, event: Event) -> None:
+        """
+        Submits a single event as a batch of one.
+        Args:
+            event (Event): The event to be handled
+        """
+        await self.on_events([event])
+
+    async def on_events(self, events: Sequence[Event]) -> None:
+        """
+        Submits a batch of events to the worker processes.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        if not events:
+            return
+
+        await self._slots.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._executor,
+                run_batch,
+                type(self)._process_batch,
+                encode_batch(events),
+            )
+        except Exception:
+            self._slots.release()
+            raise
+
+        task = asyncio.create_task(self._complete(future, self._last, events))
+        self._last = task
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """
+        Wait until every submitted batch has been processed and its result handled.
+        """
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+
+    async def close(self) -> None:
+        """
+        Drain the submitted batches and stop the worker processes.
+        """
+        await self.drain()
+        self._executor.shutdown(wait=True)
+
+    @property
+    def processed_events(self) -> int:
+        """Number of events whose batch has been processed and its result handled."""
+        return self._processed_events
+
+    @staticmethod
+    @abstractmethod
+    def _process_batch(events: List[Event]) -> Any:
+        """
+        Analyse a batch of events. Runs in a worker process, so it cannot touch
+        the consumer's state; whatever it returns is passed to _on_result().
+        Args:
+            events (List[Event]): The decoded events of one delivered batch
+        """
+        pass
+
+    async def _on_result(self, result: Any, events: Sequence[Event]) -> None:
+        """
+        Handle the result of a processed batch on the event loop. Subclasses can
+        override this method to aggregate results; by default it does nothing.
+        Args:
+            result (Any): The value returned by _process_batch()
+            events (Sequence[Event]): The batch the result was computed from
+        """
+        pass
+
+    async def _complete(
+        self,
+        future: "asyncio.Future[Any]",
+        previous: Optional[asyncio.Task],
+        events: Sequence[Event],
+    ) -> None:
+        """
+        Wait for a batch's result and hand it to _on_result() once the results
+        of every earlier batch have been handled.
+        """
+        try:
+            try:
+                result = await future
+            except Exception:
+                logger.exception(
+                    "ProcessPoolConsumer failed to process batch",
+                    extra={
+                        "consumer": self.__class__.__name__,
+                        "batch_size": len(events),
+                    },
+                )
+                return
+            finally:
+                if previous is not None:
+                    await asyncio.wait([previous])
+
+            try:
+                await self._on_result(result, events)
+            except Exception:
+                logger.exception(
+                    "ProcessPoolConsumer failed to handle batch result",
+                    extra={
+                        "consumer": self.__class__.__name__,
+                        "batch_size": len(events),
+                    },
+                )
+            self._processed_events += len(events)
+        finally:
+            self._slots.release()
+
+    @property
+    def consumer_id(self) -> str:
+        """
+        Unique identifier for the consumer, defaulting to the class name.
+        Returns:
+            str: The unique consumer ID
+        """
+        return self.__class__.__name__
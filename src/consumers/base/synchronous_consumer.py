@@ -1,5 +1,6 @@
 import logging
 from abc import abstractmethod
+from typing import Sequence
 
 from src.core.contracts.consumer import Consumer
 from src.core.contracts.event import Event
@@ -18,6 +19,38 @@ class SynchronousConsumer(Consumer):
         Args:
             event (Event): The event to be handled
         """
+        self.handle_event(event)
+
+    async def on_events(self, events: Sequence[Event]) -> None:
+        """
+        Handles a batch of events by calling _handle() for each one in order.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        self.handle_events(events)
+
+    @property
+    def is_synchronous(self) -> bool:
+        """
+        Synchronous consumers that keep the default on_event()/on_events() can be
+        called inline. Subclasses overriding them, e.g. to hand events to a thread
+        pool, are awaited like asynchronous consumers.
+        Returns:
+            bool: True if on_event() and on_events() are not overridden
+        """
+        consumer_type = type(self)
+        return (
+            consumer_type.on_event is SynchronousConsumer.on_event
+            and consumer_type.on_events is SynchronousConsumer.on_events
+        )
+
+    def handle_event(self, event: Event) -> None:
+        """
+        Handles a single event without creating a coroutine.
+        Transports use this to call synchronous consumers inline.
+        Args:
+            event (Event): The event to be handled
+        """
         try:
             self._handle(event)
         except Exception:
@@ -26,6 +59,28 @@ class SynchronousConsumer(Consumer):
                 extra={"consumer": self.__class__.__name__, "event": event},
             )
 
+    def handle_events(self, events: Sequence[Event]) -> None:
+        """
+        Handles a batch of events without creating a coroutine.
+        A failing event is logged with its position in the batch and does not
+        prevent the remaining events from being handled.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        for index, event in enumerate(events):
+            try:
+                self._handle(event)
+            except Exception:
+                logger.exception(
+                    "SynchronousConsumer failed to process event in batch",
+                    extra={
+                        "consumer": self.__class__.__name__,
+                        "event": event,
+                        "batch_index": index,
+                        "batch_size": len(events),
+                    },
+                )
+
     @abstractmethod
     def _handle(self, event: Event) -> None:
         """
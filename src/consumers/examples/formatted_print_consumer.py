@@ -1,6 +1,7 @@
 from pprint import pprint
 
 from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.codec.event_codec_registry import default_event_codecs
 from src.core.contracts.event import Event
 
 
@@ -16,5 +17,5 @@ class FormattedPrintConsumer(SynchronousConsumer):
         Args:
             event (Event): The event to be handled
         """
-        pprint(event.to_dict())
+        pprint(default_event_codecs.to_dict(event))
         print()
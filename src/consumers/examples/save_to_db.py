@@ -1,6 +1,8 @@
 import asyncio
+from typing import Sequence
 
 from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.core.contracts.event import Event
 
 
 class SaveToDBConsumer(AsynchronousConsumer):
@@ -10,3 +12,9 @@ class SaveToDBConsumer(AsynchronousConsumer):
         print("Saving event to the database...")
         await asyncio.sleep(1)  # Simulate I/O delay
         print(f"Event {event} saved to the database.")
+
+    async def _handle_batch(self, events: Sequence[Event]) -> None:
+        # Simulate a bulk insert, one round trip for the whole batch
+        print(f"Saving {len(events)} events to the database...")
+        await asyncio.sleep(1)  # Simulate I/O delay
+        print(f"{len(events)} events saved to the database.")
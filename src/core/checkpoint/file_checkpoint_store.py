@@ -0,0 +1,73 @@
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional, Union
+
+from src.core.contracts.checkpoint_store import CheckpointStore
+from src.core.contracts.runner_checkpoint import RunnerCheckpoint
+
+CHECKPOINT_SUFFIX = ".ckpt"
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Stores runner checkpoints as pickle files in a directory.
+    - Each checkpoint is written to a temporary file and atomically renamed,
+      so a crash while saving leaves the previous checkpoints intact
+    - Only the `keep` most recent checkpoints are retained
+    """
+
+    def __init__(self, directory: Union[str, Path], *, keep: int = 3) -> None:
+        """
+        Args:
+            directory (Union[str, Path]): Directory holding the checkpoint files.
+            keep (int): Number of most recent checkpoints to retain.
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1.")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._keep = keep
+
+    def save(self, checkpoint: RunnerCheckpoint) -> None:
+        """
+        Write a checkpoint and prune older ones.
+        Args:
+            checkpoint (RunnerCheckpoint): The checkpoint to save
+        """
+        path = (
+            self._directory / f"checkpoint-{checkpoint.steps:012d}{CHECKPOINT_SUFFIX}"
+        )
+        temporary = path.with_suffix(".tmp")
+
+        with open(temporary, "wb") as checkpoint_file:
+            pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary, path)
+
+        for stale in self._checkpoints()[: -self._keep]:
+            stale.unlink()
+
+    def load_latest(self) -> Optional[RunnerCheckpoint]:
+        """
+        Load the checkpoint with the highest step count.
+        Returns:
+            The latest checkpoint, or None if the directory holds none.
+        """
+        checkpoints = self._checkpoints()
+        if not checkpoints:
+            return None
+
+        with open(checkpoints[-1], "rb") as checkpoint_file:
+            return pickle.load(checkpoint_file)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the checkpoint files."""
+        return self._directory
+
+    def _checkpoints(self) -> List[Path]:
+        """Checkpoint files, oldest first."""
+        return sorted(self._directory.glob(f"checkpoint-*{CHECKPOINT_SUFFIX}"))
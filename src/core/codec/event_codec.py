@@ -0,0 +1,176 @@
+import struct
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Tuple, Type, get_type_hints
+
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError
+
+# Binary layout of an encoded event:
+#   header: type id (uint16), timestamp (int64), producer id length (uint16),
+#           fixed-width fields in declaration order, then the byte length of
+#           every variable-width field in declaration order
+#   body:   producer id (utf-8), then every variable-width field in declaration order
+#
+# Integers are variable-width (signed little-endian, as many bytes as needed) so
+# that arbitrarily large values such as Fibonacci numbers round-trip exactly.
+_FIXED_FORMATS = {float: "d", bool: "?"}
+_LENGTH_FORMATS = {int: "H", str: "I", bytes: "I"}
+
+_BASE_FIELDS = ("timestamp", "producer_id")
+
+TYPE_ID = struct.Struct("<H")
+
+
+class EventCodec:
+    """
+    Precompiled serializer for a single Event subclass.
+
+    - to_dict()/from_dict() produce the same dictionaries as Event.to_dict()
+      without the recursive copy of dataclasses.asdict()
+    - encode()/decode() use a compact binary format with a fixed header per type
+
+    The per-field encoders are generated once, when the codec is created, so
+    encoding an event does not inspect its fields again.
+    """
+
+    def __init__(self, event_type: Type[Event], type_id: int) -> None:
+        """
+        Args:
+            event_type (Type[Event]): The event class handled by this codec.
+            type_id (int): Identifier written in front of every encoded event.
+        Raises:
+            InvalidEventError: if a field has a type the binary format cannot encode.
+        """
+        if not 0 <= type_id <= 0xFFFF:
+            raise InvalidEventError("Codec type ids must fit in 16 bits.")
+
+        self.event_type = event_type
+        self.type_id = type_id
+
+        hints = get_type_hints(event_type)
+        self.field_names: Tuple[str, ...] = tuple(
+            field.name for field in fields(event_type) if field.init
+        )
+        payload_fields = [name for name in self.field_names if name not in _BASE_FIELDS]
+
+        fixed: List[Tuple[str, str]] = []
+        variable: List[Tuple[str, type]] = []
+        for name in payload_fields:
+            field_type = hints.get(name)
+            if field_type in _FIXED_FORMATS:
+                fixed.append((name, _FIXED_FORMATS[field_type]))
+            elif field_type in _LENGTH_FORMATS:
+                variable.append((name, field_type))
+            else:
+                raise InvalidEventError(
+                    f"{event_type.__name__}.{name} has unsupported type {field_type!r}."
+                )
+
+        header_format = "<HqH" + "".join(code for _, code in fixed)
+        header_format += "".join(_LENGTH_FORMATS[kind] for _, kind in variable)
+        self._header = struct.Struct(header_format)
+
+        namespace: Dict[str, Any] = {
+            "_event_type": event_type,
+            "_pack": self._header.pack,
+            "_unpack_from": self._header.unpack_from,
+            "_header_size": self._header.size,
+            "_type_id": type_id,
+            "_type_name": event_type.__name__,
+        }
+        self.to_dict: Callable[[Event], Dict[str, Any]] = _compile(
+            "to_dict", _to_dict_source(self.field_names), namespace
+        )
+        self.from_dict: Callable[[Dict[str, Any]], Event] = _compile(
+            "from_dict", _from_dict_source(self.field_names), namespace
+        )
+        self.encode: Callable[[Event], bytes] = _compile(
+            "encode", _encode_source(fixed, variable), namespace
+        )
+        self.decode: Callable[[Any, int], Tuple[Event, int]] = _compile(
+            "decode", _decode_source(fixed, variable), namespace
+        )
+
+
+def _compile(name: str, source: str, namespace: Dict[str, Any]) -> Any:
+    """Compile a generated function and return it."""
+    local_namespace: Dict[str, Any] = {}
+    exec(source, namespace, local_namespace)
+    return local_namespace[name]
+
+
+def _to_dict_source(field_names: Tuple[str, ...]) -> str:
+    items = "".join(f"{name!r}: event.{name}, " for name in field_names)
+    return "def to_dict(event):\n" f"    return {{{items}'event_type': _type_name}}\n"
+
+
+def _from_dict_source(field_names: Tuple[str, ...]) -> str:
+    arguments = ", ".join(f"{name}=data[{name!r}]" for name in field_names)
+    return f"def from_dict(data):\n    return _event_type({arguments})\n"
+
+
+def _encode_source(
+    fixed: List[Tuple[str, str]], variable: List[Tuple[str, type]]
+) -> str:
+    lines = [
+        "def encode(event):",
+        "    producer = event.producer_id.encode('utf-8')",
+    ]
+    lengths = []
+    parts = ["producer"]
+    for index, (name, kind) in enumerate(variable):
+        if kind is int:
+            lines.append(f"    value_{index} = event.{name}")
+            lines.append(
+                f"    part_{index} = value_{index}.to_bytes("
+                f"(value_{index}.bit_length() + 8) // 8, 'little', signed=True)"
+            )
+        elif kind is str:
+            lines.append(f"    part_{index} = event.{name}.encode('utf-8')")
+        else:
+            lines.append(f"    part_{index} = event.{name}")
+        lengths.append(f"len(part_{index})")
+        parts.append(f"part_{index}")
+
+    header_values = ["_type_id", "event.timestamp", "len(producer)"]
+    header_values += [f"event.{name}" for name, _ in fixed]
+    header_values += lengths
+    lines.append(
+        f"    return b''.join((_pack({', '.join(header_values)}), {', '.join(parts)}))"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _decode_source(
+    fixed: List[Tuple[str, str]], variable: List[Tuple[str, type]]
+) -> str:
+    header_names = ["_", "timestamp", "producer_length"]
+    header_names += [f"fixed_{index}" for index in range(len(fixed))]
+    header_names += [f"length_{index}" for index in range(len(variable))]
+
+    lines = [
+        "def decode(buffer, offset):",
+        f"    {', '.join(header_names)}, = _unpack_from(buffer, offset)",
+        "    position = offset + _header_size",
+        "    end = position + producer_length",
+        "    producer_id = str(buffer[position:end], 'utf-8')",
+    ]
+    for index, (_, kind) in enumerate(variable):
+        lines.append(f"    position, end = end, end + length_{index}")
+        if kind is int:
+            lines.append(
+                f"    variable_{index} = int.from_bytes("
+                "buffer[position:end], 'little', signed=True)"
+            )
+        elif kind is str:
+            lines.append(f"    variable_{index} = str(buffer[position:end], 'utf-8')")
+        else:
+            lines.append(f"    variable_{index} = bytes(buffer[position:end])")
+
+    arguments = ", ".join(
+        ["timestamp=timestamp", "producer_id=producer_id"]
+        + [f"{name}=fixed_{index}" for index, (name, _) in enumerate(fixed)]
+        + [f"{name}=variable_{index}" for index, (name, _) in enumerate(variable)]
+    )
+    lines.append(f"    return _event_type({arguments}), end")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,156 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from src.core.codec.event_codec import TYPE_ID, EventCodec
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.fibonacci_number import FibonacciNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+
+
+class EventCodecRegistry:
+    """
+    Registry of EventCodecs keyed by Event subclass.
+
+    - Serializes registered events through their precompiled codec
+    - Falls back to Event.to_dict() for unregistered events on the dict path
+    - Decodes binary records by the type id written in front of each event
+    """
+
+    def __init__(self) -> None:
+        self._by_type: Dict[Type[Event], EventCodec] = {}
+        self._by_id: Dict[int, EventCodec] = {}
+        self._by_name: Dict[str, EventCodec] = {}
+
+    def register(
+        self, event_type: Type[Event], type_id: Optional[int] = None
+    ) -> EventCodec:
+        """
+        Compile and register a codec for an event type.
+        Args:
+            event_type (Type[Event]): The event class to register
+            type_id (Optional[int]): Binary type id, defaults to the next free id
+        Returns:
+            The compiled EventCodec.
+        Raises:
+            InvalidEventError: if the type, its name or the type id is already
+            registered, or a field cannot be encoded.
+        """
+        if type_id is None:
+            type_id = max(self._by_id, default=0) + 1
+
+        if event_type in self._by_type:
+            raise InvalidEventError(f"{event_type.__name__} is already registered.")
+        if type_id in self._by_id:
+            raise InvalidEventError(f"Codec type id {type_id} is already registered.")
+        if event_type.__name__ in self._by_name:
+            raise InvalidEventError(
+                f"An event type named {event_type.__name__} is already registered."
+            )
+
+        codec = EventCodec(event_type, type_id)
+        self._by_type[event_type] = codec
+        self._by_id[type_id] = codec
+        self._by_name[event_type.__name__] = codec
+        return codec
+
+    def codec_for(self, event_type: Type[Event]) -> EventCodec:
+        """
+        Get the codec registered for an event type.
+        Raises:
+            InvalidEventError: if the event type is not registered.
+        """
+        codec = self._by_type.get(event_type)
+        if codec is None:
+            raise InvalidEventError(f"No codec registered for {event_type.__name__}.")
+        return codec
+
+    def is_registered(self, event_type: Type[Event]) -> bool:
+        """Check if a codec is registered for an event type."""
+        return event_type in self._by_type
+
+    def to_dict(self, event: Event) -> Dict[str, Any]:
+        """
+        Serialize an event to the same dictionary as Event.to_dict().
+        Unregistered events fall back to Event.to_dict().
+        """
+        codec = self._by_type.get(type(event))
+        if codec is None:
+            return event.to_dict()
+        return codec.to_dict(event)
+
+    def from_dict(self, data: Dict[str, Any]) -> Event:
+        """
+        Rebuild an event from a dictionary produced by to_dict().
+        Raises:
+            InvalidEventError: if the event type is not registered.
+        """
+        codec = self._by_name.get(data.get("event_type", ""))
+        if codec is None:
+            raise InvalidEventError(
+                f"No codec registered for event type {data.get('event_type')!r}."
+            )
+        return codec.from_dict(data)
+
+    def encode(self, event: Event) -> bytes:
+        """
+        Encode an event to the compact binary format.
+        Raises:
+            InvalidEventError: if the event type is not registered.
+        """
+        return self.codec_for(type(event)).encode(event)
+
+    def encode_many(self, events: Iterable[Event]) -> bytes:
+        """
+        Encode a sequence of events back to back.
+        Raises:
+            InvalidEventError: if an event type is not registered.
+        """
+        by_type = self._by_type
+        parts = []
+        for event in events:
+            codec = by_type.get(type(event))
+            if codec is None:
+                raise InvalidEventError(
+                    f"No codec registered for {type(event).__name__}."
+                )
+            parts.append(codec.encode(event))
+        return b"".join(parts)
+
+    def decode(self, buffer: Any, offset: int = 0) -> Tuple[Event, int]:
+        """
+        Decode the event starting at an offset of a bytes-like buffer.
+        Returns:
+            The event and the offset right after it.
+        Raises:
+            InvalidEventError: if the type id is not registered.
+        """
+        (type_id,) = TYPE_ID.unpack_from(buffer, offset)
+        codec = self._by_id.get(type_id)
+        if codec is None:
+            raise InvalidEventError(f"No codec registered for type id {type_id}.")
+        return codec.decode(buffer, offset)
+
+    def decode_many(self, buffer: Any) -> List[Event]:
+        """
+        Decode every event of a buffer produced by encode_many().
+        """
+        view = memoryview(buffer)
+        events = []
+        offset = 0
+        while offset < len(view):
+            event, offset = self.decode(view, offset)
+            events.append(event)
+        return events
+
+
+def _build_default_registry() -> EventCodecRegistry:
+    registry = EventCodecRegistry()
+    registry.register(CounterNumber, type_id=1)
+    registry.register(FibonacciNumber, type_id=2)
+    registry.register(RandomNumber, type_id=3)
+    return registry
+
+
+# Shared registry with the built-in events; register custom events on it at import time
+default_event_codecs = _build_default_registry()
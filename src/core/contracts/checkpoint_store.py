@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.contracts.runner_checkpoint import RunnerCheckpoint
+
+
+class CheckpointStore(ABC):
+    """
+    Abstract base class for storage of runner checkpoints
+
+    - Persists the checkpoints a runner takes while it executes
+    - Hands back the most recent one to resume a run
+
+    """
+
+    @abstractmethod
+    def save(self, checkpoint: RunnerCheckpoint) -> None:
+        """
+        Persist a checkpoint
+        Args:
+            checkpoint (RunnerCheckpoint): The checkpoint to save
+        """
+        pass
+
+    @abstractmethod
+    def load_latest(self) -> Optional[RunnerCheckpoint]:
+        """
+        Load the most recently saved checkpoint
+        Returns:
+            The latest checkpoint, or None if none was saved
+        """
+        pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from src.core.errors import ContractViolationError
+
 
 class Clock(ABC):
     """
@@ -29,3 +31,14 @@ class Clock(ABC):
             The current time
         """
         pass
+
+    def restore(self, time: int) -> None:
+        """
+        Set the clock back (or forward) to a time saved in a checkpoint
+        Args:
+            time (int): The time to restore
+
+        Raises:
+            ContractViolationError: if the clock cannot be restored
+        """
+        raise ContractViolationError(f"{type(self).__name__} cannot be restored.")
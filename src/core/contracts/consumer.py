@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from .event import Event
 
@@ -21,6 +22,45 @@ class Consumer(ABC):
         """
         pass
 
+    async def on_events(self, events: Sequence[Event]) -> None:
+        """
+        Handles a batch of events emitted by producers, in order.
+        Transports call this when delivering batches. Consumers can override it
+        to process a batch at once, by default each event goes through on_event().
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        for event in events:
+            await self.on_event(event)
+
+    @property
+    def is_synchronous(self) -> bool:
+        """
+        Whether transports can call the consumer inline through handle_event()
+        and handle_events() instead of awaiting on_event() and on_events().
+        Returns:
+            bool: False by default
+        """
+        return False
+
+    def handle_event(self, event: Event) -> None:
+        """
+        Handles a single event without creating a coroutine.
+        Only called by transports on consumers whose is_synchronous is True.
+        Args:
+            event (Event): The event to be handled
+        """
+        raise NotImplementedError
+
+    def handle_events(self, events: Sequence[Event]) -> None:
+        """
+        Handles a batch of events without creating a coroutine, in order.
+        Only called by transports on consumers whose is_synchronous is True.
+        Args:
+            events (Sequence[Event]): The events to be handled
+        """
+        raise NotImplementedError
+
     @property
     @abstractmethod
     def consumer_id(self) -> str:
@@ -3,12 +3,14 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event(ABC):
     """
     Base class for all events emitted by producers
 
     - Events are immutable
+    - Events are slotted, subclasses should also use
+      @dataclass(frozen=True, slots=True) to avoid a per-instance __dict__
     - Events are serializable
     - Events represent a single meaningful occurrence
     - Contains all relevant data for the consumer to interpret the event
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List
+
+from src.core.errors import ContractViolationError
 
 from .event import Event
 
@@ -49,6 +52,62 @@ class Producer(ABC):
         """
         pass
 
+    @abstractmethod
+    def step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Execute up to n consecutive steps of the algorithm
+        Args:
+            start_timestamp (int): The logical clock time of the first step,
+                each following step occurs one time unit later
+            n (int): The maximum number of steps to execute
+        Returns:
+            One entry per executed step, in timestamp order (None where no
+            meaningful occurrence happened). Shorter than n if the algorithm
+            completes before executing all n steps
+        Raises:
+            InvalidLifecycleError: if called before start()
+            or after completion
+        """
+        pass
+
+    def bind_step(self) -> Callable[[int], Event]:
+        """
+        Get a callable equivalent to step() for runners that validate the
+        lifecycle themselves: they only call it after start() and check
+        is_finished() after every call. Implementations may skip their
+        per-step validation, by default this is step() itself.
+        Returns:
+            A function (timestamp) -> Event
+        """
+        return self.step
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the algorithm state so that a checkpoint can resume it later
+        Returns:
+            A picklable snapshot of the state
+
+        Raises:
+            ContractViolationError: if the producer does not support snapshots
+        """
+        raise ContractViolationError(
+            f"{type(self).__name__} does not support snapshots."
+        )
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Resume the algorithm from a snapshot, in place of start()
+        Args:
+            snapshot (Dict[str, Any]): A snapshot returned by snapshot()
+
+        Raises:
+            ContractViolationError: if the producer does not support snapshots
+            InvalidLifecycleError: if the producer has already been started
+        """
+        raise ContractViolationError(
+            f"{type(self).__name__} does not support snapshots."
+        )
+
     @abstractmethod
     def is_finished(self) -> bool:
         """
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class RunnerCheckpoint:
+    """
+    Immutable snapshot of a runner between two steps.
+
+    Attributes:
+        steps (int): The number of runner steps executed so far
+        timestamp (int): The timestamp the next producer step will receive
+        clock_time (int): The time of the runner's clock
+        producers (Tuple[Dict[str, Any], ...]): Each producer's snapshot, in runner order
+        trace_position (Optional[int]): The number of traced steps, None without a tracer
+    """
+
+    steps: int
+    timestamp: int
+    clock_time: int
+    producers: Tuple[Dict[str, Any], ...]
+    trace_position: Optional[int]
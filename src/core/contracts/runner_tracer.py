@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterator, List, Optional, Type
 
 from src.core.contracts.event import Event
 from src.core.contracts.trace_entry import TraceEntry
+from src.core.errors import ContractViolationError
 
 
 class RunnerTracer(ABC):
@@ -32,3 +33,78 @@ class RunnerTracer(ABC):
             A list of TraceEntry objects representing the execution trace.
         """
         pass
+
+    def position(self) -> int:
+        """
+        Get the number of steps recorded so far, making them durable first
+        for tracers that persist the trace. Runner checkpoints store it.
+        Returns:
+            The number of recorded steps.
+        """
+        return len(self.get_trace())
+
+    def iter_since(self, offset: int) -> Iterator[TraceEntry]:
+        """
+        Iterate the steps recorded from position `offset` on, so that a reader
+        polling the tracer only pays for the steps it has not seen yet.
+        The default copies get_trace(), tracers override it to read in place.
+        Args:
+            offset (int): The number of steps to skip, e.g. the steps already read
+        Returns:
+            An iterator over the TraceEntry objects recorded after the offset.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return iter(self.get_trace()[offset:])
+
+    def follow(self, offset: int = 0) -> AsyncIterator[TraceEntry]:
+        """
+        Asynchronously iterate the steps recorded from position `offset` on,
+        waiting for record_step() to append new ones once they are exhausted.
+        Args:
+            offset (int): The number of steps to skip
+        Returns:
+            An async iterator over the recorded TraceEntry objects.
+        Raises:
+            ContractViolationError: if the tracer cannot be followed.
+        """
+        raise ContractViolationError(f"{type(self).__name__} cannot be followed.")
+
+    def truncate(self, position: int) -> None:
+        """
+        Discard every step recorded after the first `position` ones, to resume
+        a run from a checkpoint.
+        Args:
+            position (int): The number of steps to keep
+        Raises:
+            ContractViolationError: if the tracer does not support truncation.
+            ValueError: if fewer than `position` steps are recorded.
+        """
+        raise ContractViolationError(f"{type(self).__name__} cannot be truncated.")
+
+    def query(
+        self,
+        *,
+        producer_id: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        event_type: Optional[Type[Event]] = None,
+    ) -> Iterator[TraceEntry]:
+        """
+        Lazily iterate the recorded steps matching every given filter, in
+        recording order, using the tracer's indexes instead of scanning the trace.
+        Args:
+            producer_id (Optional[str]): Only steps executed by this producer
+            start (Optional[int]): Only steps with a timestamp at or after it
+            end (Optional[int]): Only steps with a timestamp before it
+            event_type (Optional[Type[Event]]): Only events of this type or a subclass
+        Returns:
+            An iterator over the matching TraceEntry objects.
+        Raises:
+            ContractViolationError:
+                - if the tracer does not index its trace
+                - if a timestamp bound is given and steps were not recorded in timestamp order
+        """
+        raise ContractViolationError(f"{type(self).__name__} cannot be queried.")
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
+
+from .producer import Producer
+
+
+class Scheduler(ABC):
+    """
+    Abstract base class for all producer schedulers
+
+    - Decides which producers a runner steps in each round, in which order and how often
+    - Receives the measured duration of every step to account for producer cost
+
+    """
+
+    @abstractmethod
+    def schedule(self, producers: Sequence[Producer]) -> Iterator[Producer]:
+        """
+        Yield the producers to step in one round. The runner steps each yielded
+        producer once and reports the step through record_step() before asking
+        for the next one, so a scheduler can base later decisions on it.
+        Args:
+            producers (Sequence[Producer]): The unfinished producers, in runner order
+        """
+        pass
+
+    @abstractmethod
+    def record_step(self, producer: Producer, elapsed: float) -> None:
+        """
+        Account for a step executed by the runner.
+        Args:
+            producer (Producer): The producer that was stepped
+            elapsed (float): Wall-clock duration of the step in seconds
+        """
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from .consumer import Consumer
 from .event import Event
@@ -31,6 +32,19 @@ class Transport(ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Publish a batch of events to all subscribed consumers.
+        Events are delivered in the order they appear in the batch.
+        Args:
+            events (Sequence[Event]): The events to be published
+
+        Raises:
+            InvalidEventError: if any event in the batch is invalid.
+        """
+        pass
+
     @abstractmethod
     def subscribe(self, consumer: Consumer) -> None:
         """
@@ -20,3 +20,9 @@ class InvalidEventError(ContractViolationError):
     """Raised when an event does not conform to expected structure or data."""
 
     pass
+
+
+class ProducerExecutionError(VisualizationEngineError):
+    """Raised when a producer fails while being stepped outside the runner's process."""
+
+    pass
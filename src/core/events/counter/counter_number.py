@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.core.contracts.event import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CounterNumber(Event):
     """
     Emitted when a counter value is incremented by the CounterProducer.
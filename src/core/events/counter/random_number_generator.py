@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.core.contracts.event import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RandomNumber(Event):
     """
     Emiited when a random number is generated by the RandomNumberProducer.
@@ -0,0 +1,60 @@
+from dataclasses import fields
+from typing import Any, Callable, Dict, Type
+
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError
+
+
+def compile_event_factory(
+    event_type: Type[Event], producer_id: str
+) -> Callable[..., Event]:
+    """
+    Compile a constructor for high-rate producers that always emit the same event type.
+
+    The returned function takes the timestamp followed by the remaining fields
+    positionally, in declaration order, and reuses the given producer id for
+    every event. It writes fields through the slot descriptors directly instead
+    of going through the frozen dataclass __init__, which assigns every field
+    through object.__setattr__.
+
+    Event types that are not slotted, or that define __post_init__, fall back to
+    calling the class so that no validation is skipped.
+    Args:
+        event_type (Type[Event]): The event class to construct
+        producer_id (str): The producer id shared by every constructed event
+    Returns:
+        A function (timestamp, *values) -> Event.
+    Raises:
+        InvalidEventError: if event_type is not an Event dataclass.
+    """
+    if not (isinstance(event_type, type) and issubclass(event_type, Event)):
+        raise InvalidEventError(f"{event_type!r} is not an Event type.")
+
+    names = [field.name for field in fields(event_type) if field.init]
+    payload_names = [name for name in names if name not in ("timestamp", "producer_id")]
+    parameters = ", ".join(["timestamp"] + payload_names)
+
+    namespace: Dict[str, Any] = {
+        "_event_type": event_type,
+        "_producer_id": producer_id,
+        "_new": object.__new__,
+    }
+
+    if "__slots__" not in event_type.__dict__ or hasattr(event_type, "__post_init__"):
+        arguments = ", ".join(
+            ["timestamp=timestamp", "producer_id=_producer_id"]
+            + [f"{name}={name}" for name in payload_names]
+        )
+        source = f"def make({parameters}):\n    return _event_type({arguments})\n"
+    else:
+        lines = [f"def make({parameters}):", "    _instance = _new(_event_type)"]
+        for name in names:
+            namespace[f"_set_{name}"] = getattr(event_type, name).__set__
+            value = "_producer_id" if name == "producer_id" else name
+            lines.append(f"    _set_{name}(_instance, {value})")
+        lines.append("    return _instance")
+        source = "\n".join(lines) + "\n"
+
+    local_namespace: Dict[str, Any] = {}
+    exec(source, namespace, local_namespace)
+    return local_namespace["make"]
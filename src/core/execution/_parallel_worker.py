@@ -0,0 +1,64 @@
+import traceback
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Tuple
+
+from src.core.contracts.clock import Clock
+from src.core.contracts.event import Event
+from src.core.contracts.producer import Producer
+
+# Messages exchanged between ParallelRunner and its worker processes
+STEP = "step"
+STOP = "stop"
+RESULT = "result"
+ERROR = "error"
+
+StepResult = Tuple[int, Optional[Event], bool]
+
+
+def _worker_main(
+    connection: Connection, clock: Clock, producers: Dict[int, Producer]
+) -> None:
+    """
+    Entry point of a ParallelRunner worker process.
+
+    The worker owns its shard of producers for the whole run. It starts them and
+    acknowledges with an empty RESULT. Each following STEP message carries
+    (producer index, timestamp) pairs assigned by the parent, and the worker
+    answers with (producer index, event, finished) for every pair, in order.
+
+    The clock was shipped together with the producers, so producers holding a
+    read-only view of it observe a process-local copy. Before each step that copy
+    is ticked forward to the assigned timestamp, matching what the producer
+    would read from the shared clock under SimpleRunner.
+    """
+    try:
+        for producer in producers.values():
+            producer.start()
+    except Exception:
+        connection.send((ERROR, traceback.format_exc()))
+        connection.close()
+        return
+
+    connection.send((RESULT, []))
+
+    while True:
+        message = connection.recv()
+        if message[0] == STOP:
+            connection.close()
+            return
+
+        assignments: List[Tuple[int, int]] = message[1]
+        results: List[StepResult] = []
+        try:
+            for index, timestamp in assignments:
+                while clock.now() < timestamp:
+                    clock.tick()
+
+                producer = producers[index]
+                event = producer.step(timestamp)
+                results.append((index, event, producer.is_finished()))
+        except Exception:
+            connection.send((ERROR, traceback.format_exc()))
+            continue
+
+        connection.send((RESULT, results))
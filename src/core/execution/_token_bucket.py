@@ -0,0 +1,31 @@
+import asyncio
+import time
+
+
+class _TokenBucket:
+    """
+    Token bucket pacing a stream of events to a target rate.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Consuming
+    more tokens than available puts the bucket in debt, and consume() sleeps
+    until the debt is repaid, so a large batch is followed by a proportionally
+    long pause instead of being rejected.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    async def consume(self, tokens: int) -> None:
+        """Take tokens from the bucket, sleeping while it is in debt."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+        self._tokens -= tokens
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
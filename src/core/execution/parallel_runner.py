@@ -0,0 +1,273 @@
+import asyncio
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Dict, List, Optional, Tuple
+
+from src.core.contracts.clock import Clock
+from src.core.contracts.event import Event
+from src.core.contracts.producer import Producer
+from src.core.contracts.runner import Runner
+from src.core.contracts.runner_tracer import RunnerTracer
+from src.core.contracts.transport import Transport
+from src.core.errors import InvalidLifecycleError, ProducerExecutionError
+from src.core.execution._parallel_worker import (
+    ERROR,
+    STEP,
+    STOP,
+    StepResult,
+    _worker_main,
+)
+
+
+class ParallelRunner(Runner):
+    """
+    ParallelRunner executes producers in worker processes so that CPU-bound
+    producers can use several cores.
+
+    - Producers are partitioned round-robin across a pool of worker processes
+    - Every step the parent assigns logical timestamps exactly like SimpleRunner
+      (one tick per active producer, in list order) and the workers step their
+      shard concurrently
+    - Events are streamed back to the parent, then published and traced in
+      producer order, so the trace is identical to a SimpleRunner run
+
+    Producers and the clock must be picklable. Once started, producers live in
+    the worker processes; the instances passed to the constructor are not advanced.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Clock,
+        producers: List[Producer],
+        transport: Transport,
+        tracer: Optional[RunnerTracer] = None,
+        number_of_workers: Optional[int] = None,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            clock (Clock): The clock ticked once per producer step.
+            producers (List[Producer]): The producers to execute.
+            transport (Transport): The transport receiving the emitted events.
+            tracer (Optional[RunnerTracer]): Records each emitted event if provided.
+            number_of_workers (Optional[int]): Number of worker processes,
+                defaults to the number of CPUs and never exceeds the number of producers.
+            start_method (Optional[str]): multiprocessing start method
+                ("fork", "spawn", "forkserver"), defaults to the platform default.
+        """
+        if not producers:
+            raise InvalidLifecycleError(
+                "ParallelRunner requires at least one producer."
+            )
+
+        if len(set(producers)) != len(producers):
+            raise InvalidLifecycleError("ParallelRunner received duplicate producers.")
+
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+        if number_of_workers < 1:
+            raise ValueError("number_of_workers must be at least 1.")
+
+        self._clock = clock
+        self._producers: List[Producer] = list(producers)
+        self._transport = transport
+        self._tracer = tracer
+        self._number_of_workers = min(number_of_workers, len(self._producers))
+        self._context = multiprocessing.get_context(start_method)
+
+        self._producer_ids = [producer.producer_id for producer in self._producers]
+        self._active: List[int] = list(range(len(self._producers)))
+        self._processes: List[BaseProcess] = []
+        self._connections: List[Connection] = []
+
+        self._started = False
+        self._finished = False
+        self._timestamp: int = 0
+
+    async def start(self) -> None:
+        """
+        Spawn the worker processes and start every producer in its worker.
+        Must be called before step().
+        Raises:
+            InvalidLifecycleError: if called more than once
+            ProducerExecutionError: if a producer fails to start
+        """
+        if self._started:
+            raise InvalidLifecycleError("ParallelRunner.start() called more than once.")
+
+        self._started = True
+        self._finished = False
+        self._timestamp = 0
+
+        shards: List[Dict[int, Producer]] = [{} for _ in range(self._number_of_workers)]
+        for index, producer in enumerate(self._producers):
+            shards[self._worker_of(index)][index] = producer
+
+        for shard in shards:
+            parent_connection, child_connection = self._context.Pipe()
+            process = self._context.Process(  # type: ignore[attr-defined]
+                target=_worker_main,
+                args=(child_connection, self._clock, shard),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._processes.append(process)
+            self._connections.append(parent_connection)
+
+        await asyncio.gather(
+            *(self._receive(worker) for worker in range(self._number_of_workers))
+        )
+
+        await self._transport.start()
+
+    async def step(self) -> None:
+        """
+        Execute a single step for all producers across the worker processes.
+
+        One step involves:
+        - ticking the clock once per active producer to assign its timestamp
+        - stepping every shard concurrently in its worker process
+        - publishing and tracing the returned events in producer order
+
+        Raises:
+            InvalidLifecycleError:
+                - if step() is called before start()
+                - if step() is called after completion
+            ProducerExecutionError: if a producer fails in a worker process
+        """
+        if not self._started:
+            raise InvalidLifecycleError("ParallelRunner.step() called before start().")
+        if self._finished:
+            raise InvalidLifecycleError(
+                "ParallelRunner.step() called after completion."
+            )
+
+        timestamps: List[int] = []
+        assignments: List[List[Tuple[int, int]]] = [
+            [] for _ in range(self._number_of_workers)
+        ]
+        for index in self._active:
+            timestamps.append(self._timestamp)
+            assignments[self._worker_of(index)].append((index, self._timestamp))
+            self._timestamp = self._clock.tick()
+
+        workers = [worker for worker, work in enumerate(assignments) if work]
+        for worker in workers:
+            self._connections[worker].send((STEP, assignments[worker]))
+
+        shard_results = await asyncio.gather(
+            *(self._receive(worker) for worker in workers)
+        )
+
+        results: Dict[int, StepResult] = {}
+        for shard_result in shard_results:
+            for result in shard_result:
+                results[result[0]] = result
+
+        events: List[Event] = []
+        still_active: List[int] = []
+        for index, timestamp in zip(self._active, timestamps):
+            _, event, finished = results[index]
+
+            if event is not None:
+                events.append(event)
+                if self._tracer:
+                    self._tracer.record_step(
+                        producer_id=self._producer_ids[index],
+                        event=event,
+                        timestamp=timestamp,
+                    )
+
+            if not finished:
+                still_active.append(index)
+
+        self._active = still_active
+
+        if events:
+            await self._transport.publish_many(events)
+
+        if not self._active:
+            self._finished = True
+            await self.aclose()
+
+    async def run(self) -> None:
+        """Run all producers until completion."""
+
+        if not self._started:
+            await self.start()
+
+        try:
+            while not self.is_finished():
+                await self.step()
+        finally:
+            await self.aclose()
+
+    def is_finished(self) -> bool:
+        """
+        Check if all producers have completed execution.
+        Returns:
+            True if all producers are finished, else False
+        """
+        return self._finished
+
+    def close(self) -> None:
+        """
+        Stop the worker processes, blocking until they exit. Safe to call more
+        than once. From a coroutine, use aclose() instead.
+        """
+        for process in self._stop_workers():
+            self._join(process)
+
+    async def aclose(self) -> None:
+        """
+        Stop the worker processes, waiting for them to exit in a thread so that
+        the event loop keeps running. Safe to call more than once.
+        """
+        for process in self._stop_workers():
+            await asyncio.to_thread(self._join, process)
+
+    def _stop_workers(self) -> List[BaseProcess]:
+        """Ask every worker to stop and hand over their processes to be joined."""
+        for connection in self._connections:
+            try:
+                connection.send((STOP,))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+
+        processes = list(self._processes)
+        self._connections.clear()
+        self._processes.clear()
+        return processes
+
+    @staticmethod
+    def _join(process: BaseProcess) -> None:
+        """Wait for a worker to exit, terminating it if it does not within 5 seconds."""
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    def _worker_of(self, index: int) -> int:
+        """Worker process owning the producer at the given index."""
+        return index % self._number_of_workers
+
+    async def _receive(self, worker: int) -> List[StepResult]:
+        """Wait for a worker's reply without blocking the event loop."""
+        try:
+            kind, payload = await asyncio.to_thread(self._connections[worker].recv)
+        except EOFError:
+            raise ProducerExecutionError(
+                f"Worker process {worker} exited unexpectedly."
+            )
+
+        if kind == ERROR:
+            raise ProducerExecutionError(
+                f"Producer failed in worker process {worker}:\n{payload}"
+            )
+
+        return payload
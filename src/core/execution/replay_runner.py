@@ -0,0 +1,200 @@
+import asyncio
+import time
+from bisect import bisect_left
+from typing import Iterator, List, Optional, Sequence, Union
+
+from src.core.contracts.event import Event
+from src.core.contracts.runner import Runner
+from src.core.contracts.trace_entry import TraceEntry
+from src.core.contracts.transport import Transport
+from src.core.errors import ContractViolationError, InvalidLifecycleError
+from src.core.trace.trace_segment_reader import TraceSegmentReader
+
+TraceSource = Union[Sequence[TraceEntry], TraceSegmentReader]
+
+
+class ReplayRunner(Runner):
+    """
+    Runner that re-publishes the events of a recorded trace instead of stepping producers.
+
+    - Reads an in-memory trace (e.g. RunnerTracer.get_trace()) or a persisted one
+      through a TraceSegmentReader (e.g. FileRunnerTracer.reader())
+    - Publishes the recorded events in trace order through publish_many(), at most
+      `batch_size` per step
+    - Replays at maximum speed by default, or paced so that `timestamps_per_second`
+      logical time units of the trace take one second of wall-clock time
+    - Can seek to a timestamp before or between steps
+    """
+
+    def __init__(
+        self,
+        *,
+        trace: TraceSource,
+        transport: Transport,
+        batch_size: int = 256,
+        timestamps_per_second: Optional[float] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            trace (TraceSource): The recorded steps, in timestamp order.
+            transport (Transport): The transport receiving the replayed events.
+            batch_size (int): Maximum number of events published per step.
+            timestamps_per_second (Optional[float]): Pacing of the replay, in logical
+                time units per wall-clock second. Replays at maximum speed if None.
+            start_timestamp (Optional[int]): Replay from the first step at or after it.
+            end_timestamp (Optional[int]): Stop before the first step at or after it.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if timestamps_per_second is not None and timestamps_per_second <= 0:
+            raise ValueError("timestamps_per_second must be positive.")
+
+        self._trace = trace
+        # Reader traces check their own order, sequences are checked once here
+        self._sorted = isinstance(trace, TraceSegmentReader) or all(
+            a.timestamp <= b.timestamp for a, b in zip(trace, trace[1:])
+        )
+        self._transport = transport
+        self._batch_size = batch_size
+        self._timestamps_per_second = timestamps_per_second
+        self._end_timestamp = end_timestamp
+
+        self._started = False
+        self._finished = False
+        self._replayed = 0
+
+        self._entries: Iterator[TraceEntry] = iter(())
+        self._next: Optional[TraceEntry] = None
+        self._origin: Optional[float] = None
+        self._origin_timestamp = 0
+        self.seek(start_timestamp)
+
+    async def start(self) -> None:
+        """
+        Start the transport. Must be called before step().
+        Raises:
+            InvalidLifecycleError: if called more than once
+        """
+        if self._started:
+            raise InvalidLifecycleError("ReplayRunner.start() called more than once.")
+
+        self._started = True
+        await self._transport.start()
+
+    async def step(self) -> None:
+        """
+        Publish the next batch of recorded events.
+        When paced, waits until the first event of the batch is due and only
+        batches events that are due already.
+        Raises:
+            InvalidLifecycleError:
+                - if step() is called before start()
+                - if step() is called after completion
+        """
+        if not self._started:
+            raise InvalidLifecycleError("ReplayRunner.step() called before start().")
+        if self._finished:
+            raise InvalidLifecycleError("ReplayRunner.step() called after completion.")
+
+        batch: List[Event] = []
+        while len(batch) < self._batch_size and self._next is not None:
+            if self._timestamps_per_second is not None:
+                due = self._due(self._next, self._timestamps_per_second)
+                delay = due - time.monotonic()
+                if delay > 0:
+                    if batch:
+                        break
+                    await asyncio.sleep(delay)
+
+            batch.append(self._next.event)
+            self._advance()
+
+        if batch:
+            await self._transport.publish_many(batch)
+            self._replayed += len(batch)
+
+        if self._next is None:
+            self._finished = True
+
+    async def run(self) -> None:
+        """Replay the trace until its end."""
+        if not self._started:
+            await self.start()
+
+        while not self._finished:
+            await self.step()
+
+    def is_finished(self) -> bool:
+        """
+        Check if every selected step has been replayed.
+        Returns:
+            True if finished, else False
+        """
+        return self._finished
+
+    def seek(self, timestamp: Optional[int]) -> None:
+        """
+        Continue the replay from the first step at or after a timestamp, or from
+        the beginning of the trace if None. Pacing restarts from that step.
+        Args:
+            timestamp (Optional[int]): The logical timestamp to seek to
+        Raises:
+            ContractViolationError: if the trace is not in timestamp order.
+        """
+        trace = self._trace
+        if isinstance(trace, TraceSegmentReader):
+            if timestamp is None:
+                self._entries = iter(trace)
+            else:
+                self._entries = trace.read_range(timestamp, _END_OF_TRACE)
+        else:
+            start = 0
+            if timestamp is not None:
+                if not self._sorted:
+                    raise ContractViolationError(
+                        "Trace was not recorded in timestamp order and cannot be sought."
+                    )
+                start = bisect_left(trace, timestamp, key=_timestamp_of)
+            self._entries = (trace[index] for index in range(start, len(trace)))
+
+        self._origin = None
+        self._advance()
+        self._finished = self._started and self._next is None
+
+    @property
+    def replayed_events(self) -> int:
+        """Number of events published so far."""
+        return self._replayed
+
+    def _advance(self) -> None:
+        """Load the next step to replay, stopping at the end timestamp."""
+        entry = next(self._entries, None)
+        if (
+            entry is not None
+            and self._end_timestamp is not None
+            and entry.timestamp >= self._end_timestamp
+        ):
+            entry = None
+        self._next = entry
+
+    def _due(self, entry: TraceEntry, timestamps_per_second: float) -> float:
+        """
+        Wall-clock time at which a step is due when the replay is paced, relative
+        to the first step replayed since start or the last seek.
+        """
+        if self._origin is None:
+            self._origin = time.monotonic()
+            self._origin_timestamp = entry.timestamp
+
+        elapsed = (entry.timestamp - self._origin_timestamp) / timestamps_per_second
+        return self._origin + elapsed
+
+
+# Upper bound for TraceSegmentReader.read_range() when seeking to the end of the trace
+_END_OF_TRACE = 2**63 - 1
+
+
+def _timestamp_of(entry: TraceEntry) -> int:
+    return entry.timestamp
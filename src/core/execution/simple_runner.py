@@ -1,11 +1,18 @@
+import asyncio
+import time
 from typing import List, Optional
 
+from src.core.contracts.checkpoint_store import CheckpointStore
 from src.core.contracts.clock import Clock
+from src.core.contracts.event import Event
 from src.core.contracts.producer import Producer
 from src.core.contracts.runner import Runner
+from src.core.contracts.runner_checkpoint import RunnerCheckpoint
 from src.core.contracts.runner_tracer import RunnerTracer
+from src.core.contracts.scheduler import Scheduler
 from src.core.contracts.transport import Transport
 from src.core.errors import InvalidLifecycleError
+from src.core.execution._token_bucket import _TokenBucket
 
 
 class SimpleRunner(Runner):
@@ -21,22 +28,82 @@ class SimpleRunner(Runner):
         clock: Clock,
         producers: List[Producer],
         transport: Transport,
-        tracer: Optional[RunnerTracer] = None
+        tracer: Optional[RunnerTracer] = None,
+        chunk_size: int = 1,
+        lookahead: int = 0,
+        scheduler: Optional[Scheduler] = None,
+        yield_every: int = 1024,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_every: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            clock (Clock): The clock ticked once per producer step.
+            producers (List[Producer]): The producers to execute.
+            transport (Transport): The transport receiving the emitted events.
+            tracer (Optional[RunnerTracer]): Records each emitted event if provided.
+            chunk_size (int): Number of consecutive steps each producer executes
+                per runner step. With a chunk size above 1 producers advance through
+                step_many() and receive contiguous timestamps.
+            lookahead (int): Number of steps run() lets producers run ahead of
+                publishing. With a lookahead above 0, each step's events are staged
+                and a separate task publishes them in order, so stepping only waits
+                on the transport once `lookahead` steps are staged.
+            scheduler (Optional[Scheduler]): Decides which producers are stepped in each
+                runner step and how often. Without one, every active producer is
+                stepped once per runner step, in list order.
+            yield_every (int): Number of events run() accumulates before publishing
+                them and yielding to the event loop, when it runs without chunking,
+                lookahead, a scheduler or checkpoints. run() also yields after that
+                many steps, so steps emitting no events do not starve other tasks,
+                and run() with a budget yields at the same cadence.
+            checkpoint_store (Optional[CheckpointStore]): Receives the periodic checkpoints.
+            checkpoint_every (Optional[int]): Number of runner steps between two
+                checkpoints saved to `checkpoint_store`, each saved once the events
+                of its step have been published.
+        """
         if not producers:
             raise InvalidLifecycleError("SimpleRunner requires at least one producer.")
 
         if len(set(producers)) != len(producers):
             raise InvalidLifecycleError("SimpleRunner received duplicate producers.")
 
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+
+        if lookahead < 0:
+            raise ValueError("lookahead must not be negative.")
+
+        if yield_every < 1:
+            raise ValueError("yield_every must be at least 1.")
+
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1.")
+
+        if (checkpoint_every is None) != (checkpoint_store is None):
+            raise ValueError(
+                "checkpoint_every and checkpoint_store must be given together."
+            )
+
         self._clock = clock
         self._producers: List[Producer] = list(producers)
         self._transport = transport
         self._tracer = tracer
+        self._chunk_size = chunk_size
+        self._lookahead = lookahead
+        self._scheduler = scheduler
+        self._yield_every = yield_every
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint_every = checkpoint_every
 
         self._started = False
         self._finished = False
         self._timestamp: int = 0
+        self._steps = 0
+        # Producers still running, in their original order
+        self._active: List[Producer] = []
+        self._finished_producers = 0
+        self._publish_error: Optional[BaseException] = None
 
     async def start(self) -> None:
         """
@@ -51,10 +118,74 @@ class SimpleRunner(Runner):
         self._started = True
         self._finished = False
         self._timestamp = 0
+        self._steps = 0
 
         for producer in self._producers:
             producer.start()
 
+        self._active = [p for p in self._producers if not p.is_finished()]
+        self._finished_producers = len(self._producers) - len(self._active)
+
+        await self._transport.start()
+
+    def snapshot(self) -> RunnerCheckpoint:
+        """
+        Capture the runner between two steps: its timestamp and step count,
+        the clock time, every producer's snapshot and the tracer position.
+        Events already handed to the transport are not part of the checkpoint.
+        Returns:
+            A picklable RunnerCheckpoint.
+        Raises:
+            InvalidLifecycleError: if the runner has not been started
+            ContractViolationError: if a producer or the tracer does not support it
+        """
+        if not self._started:
+            raise InvalidLifecycleError(
+                "SimpleRunner.snapshot() called before start()."
+            )
+
+        return RunnerCheckpoint(
+            steps=self._steps,
+            timestamp=self._timestamp,
+            clock_time=self._clock.now(),
+            producers=tuple(producer.snapshot() for producer in self._producers),
+            trace_position=None if self._tracer is None else self._tracer.position(),
+        )
+
+    async def restore(self, checkpoint: RunnerCheckpoint) -> None:
+        """
+        Resume from a checkpoint in place of start(). The runner must be built
+        with the same producers, in the same order, as the checkpointed one.
+        The clock and producers are restored, the tracer is truncated to the
+        checkpointed position and the transport is started. Events emitted after
+        the checkpoint are produced again, so consumers may see them twice.
+        Args:
+            checkpoint (RunnerCheckpoint): A checkpoint taken by snapshot()
+        Raises:
+            InvalidLifecycleError: if the runner has already been started
+            ValueError: if the checkpoint holds a different number of producers
+        """
+        if self._started:
+            raise InvalidLifecycleError("SimpleRunner.restore() called after start().")
+        if len(checkpoint.producers) != len(self._producers):
+            raise ValueError(
+                f"Checkpoint holds {len(checkpoint.producers)} producers, "
+                f"the runner has {len(self._producers)}."
+            )
+
+        self._clock.restore(checkpoint.clock_time)
+        for producer, producer_snapshot in zip(self._producers, checkpoint.producers):
+            producer.restore(producer_snapshot)
+        if self._tracer is not None and checkpoint.trace_position is not None:
+            self._tracer.truncate(checkpoint.trace_position)
+
+        self._started = True
+        self._timestamp = checkpoint.timestamp
+        self._steps = checkpoint.steps
+        self._active = [p for p in self._producers if not p.is_finished()]
+        self._finished_producers = len(self._producers) - len(self._active)
+        self._finished = not self._active
+
         await self._transport.start()
 
     async def step(self) -> None:
@@ -63,8 +194,9 @@ class SimpleRunner(Runner):
 
         One step involves:
         - ticking the clock
-        - stepping each active producer
-        - publishing any generated events
+        - stepping each active producer (chunk_size steps each in chunked mode),
+          or the producers picked by the scheduler if one is configured
+        - publishing the generated events as one ordered batch
 
         Raises:
             InvalidLifecycleError:
@@ -77,35 +209,327 @@ class SimpleRunner(Runner):
         if self._finished:
             raise InvalidLifecycleError("SimpleRunner.step() called after completion.")
 
-        for producer in self._producers:
+        events = self._step_producers()
+        if events:
+            await self._transport.publish_many(events)
+        if self._checkpoint_due():
+            self._save_checkpoint()
+
+    def _step_producers(self) -> List[Event]:
+        """
+        Step the active producers, tracing the emitted events, and mark the runner
+        finished once all producers are. Without a scheduler every active producer
+        is stepped once (or by a chunk) in order, otherwise the scheduler picks them.
+        Producers that finish are dropped from the active list, so the cost of
+        a step only depends on the number of live producers.
+        Returns:
+            The emitted events, in the order they were emitted.
+        """
+        events: List[Event] = []
+        active = self._active
+        still_active: List[Producer] = []
+
+        if self._scheduler is not None:
+            self._step_scheduled(self._scheduler, active, events)
+            still_active = [p for p in active if not p.is_finished()]
+        else:
+            for producer in active:
+                if self._chunk_size > 1:
+                    self._step_chunk(producer, events)
+                else:
+                    self._step_once(producer, events)
+
+                if not producer.is_finished():
+                    still_active.append(producer)
+
+        if len(still_active) != len(active):
+            self._finished_producers += len(active) - len(still_active)
+            self._active = still_active
+
+        if not still_active:
+            self._finished = True
+
+        self._steps += 1
+        return events
+
+    def _checkpoint_due(self) -> bool:
+        """Check if the step just taken is one to checkpoint after."""
+        return (
+            self._checkpoint_every is not None
+            and self._steps % self._checkpoint_every == 0
+        )
+
+    def _save_checkpoint(self) -> None:
+        """
+        Save a snapshot to the checkpoint store. Only called once every event
+        of the checkpointed steps has been published, so that resuming from it
+        never skips events that did not reach the transport.
+        """
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.save(self.snapshot())
+
+    def _step_scheduled(
+        self, scheduler: Scheduler, active: List[Producer], events: List[Event]
+    ) -> None:
+        """
+        Step the producers yielded by the scheduler, reporting the measured
+        duration of every step (or chunk) back to it.
+        """
+        for producer in scheduler.schedule(active):
             if producer.is_finished():
                 continue
 
-            event = producer.step(self._timestamp)
+            started = time.perf_counter()
+            if self._chunk_size > 1:
+                self._step_chunk(producer, events)
+            else:
+                self._step_once(producer, events)
+            scheduler.record_step(producer, time.perf_counter() - started)
 
-            if event is not None:
-                await self._transport.publish(event)
-                if self._tracer:
-                    self._tracer.record_step(
-                        producer_id=producer.producer_id,
-                        event=event,
-                        timestamp=self._timestamp,
-                    )
+    def _step_once(self, producer: Producer, events: List[Event]) -> None:
+        """
+        Advance a producer by a single step, collecting its event and ticking the clock.
+        """
+        event = producer.step(self._timestamp)
 
-            self._timestamp = self._clock.tick()
+        if event is not None:
+            events.append(event)
+            if self._tracer:
+                self._tracer.record_step(
+                    producer_id=producer.producer_id,
+                    event=event,
+                    timestamp=self._timestamp,
+                )
 
-        if self._all_finished():
-            self._finished = True
+        self._timestamp = self._clock.tick()
 
-    async def run(self) -> None:
-        """Run all producers until completion."""
+    async def run(
+        self,
+        *,
+        max_steps: Optional[int] = None,
+        deadline: Optional[float] = None,
+        rate: Optional[float] = None,
+    ) -> None:
+        """
+        Run all producers until completion, or until a budget runs out.
+
+        With any budget, run() publishes each step as step() does and returns
+        once the budget is exhausted, leaving the runner resumable: a later
+        run() or step() continues from the next step.
+        Args:
+            max_steps (Optional[int]): Maximum number of runner steps to execute.
+            deadline (Optional[float]): Seconds of wall-clock time after which no
+                further step is started.
+            rate (Optional[float]): Target events per second. Steps are paced with
+                a token bucket holding up to a tenth of a second of events, which
+                also yields to the event loop between steps.
+        """
+
+        if max_steps is not None and max_steps < 0:
+            raise ValueError("max_steps must not be negative.")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive.")
 
         if not self._started:
             await self.start()
 
+        if max_steps is not None or deadline is not None or rate is not None:
+            await self._run_budgeted(max_steps, deadline, rate)
+            return
+
+        if self._lookahead:
+            await self._run_pipelined()
+            return
+
+        if (
+            self._scheduler is None
+            and self._chunk_size == 1
+            and self._checkpoint_store is None
+        ):
+            await self._run_fused()
+            return
+
         while not self.is_finished():
             await self.step()
 
+    async def _run_budgeted(
+        self,
+        max_steps: Optional[int],
+        deadline: Optional[float],
+        rate: Optional[float],
+    ) -> None:
+        """
+        Step until completion or until the step count, deadline or pacing
+        budget given to run() is exhausted. Yields to the event loop every
+        `yield_every` steps or events, as the token bucket only sleeps when
+        it runs out of tokens.
+        """
+        ends_at = None if deadline is None else time.monotonic() + deadline
+        bucket = None if rate is None else _TokenBucket(rate, max(1.0, rate / 10))
+        yield_every = self._yield_every
+        steps = 0
+        steps_since_yield = 0
+        events_since_yield = 0
+
+        while not self._finished:
+            if max_steps is not None and steps >= max_steps:
+                return
+            if ends_at is not None and time.monotonic() >= ends_at:
+                return
+
+            events = self._step_producers()
+            steps += 1
+            if events:
+                await self._transport.publish_many(events)
+            if self._checkpoint_due():
+                self._save_checkpoint()
+            if bucket is not None:
+                await bucket.consume(len(events))
+
+            steps_since_yield += 1
+            events_since_yield += len(events)
+            if steps_since_yield >= yield_every or events_since_yield >= yield_every:
+                steps_since_yield = events_since_yield = 0
+                await asyncio.sleep(0)
+
+    async def _run_fused(self) -> None:
+        """
+        Equivalent of calling step() until completion, with the per-step overhead
+        hoisted out of the loop: the lifecycle is validated once, producers are
+        stepped through bind_step(), methods are bound to locals and the tracer
+        check is made once by picking one of two loops. Events of consecutive
+        steps are published together once `yield_every` have accumulated, which
+        is also when the loop yields to the event loop. It yields as well every
+        `yield_every` steps, in case producers emit few events. The trace,
+        timestamps and delivery order are the same as with step().
+        """
+        if self._finished:
+            return
+
+        tick = self._clock.tick
+        publish_many = self._transport.publish_many
+        tracer = self._tracer
+        yield_every = self._yield_every
+
+        steppers = [
+            (producer, producer.producer_id, producer.bind_step(), producer.is_finished)
+            for producer in self._active
+        ]
+        timestamp = self._timestamp
+        events: List[Event] = []
+        append = events.append
+        steps_since_yield = 0
+
+        while steppers:
+            still_active = []
+            if tracer is None:
+                for stepper in steppers:
+                    event = stepper[2](timestamp)
+                    if event is not None:
+                        append(event)
+                    timestamp = tick()
+                    if not stepper[3]():
+                        still_active.append(stepper)
+            else:
+                record_step = tracer.record_step
+                for stepper in steppers:
+                    event = stepper[2](timestamp)
+                    if event is not None:
+                        append(event)
+                        record_step(
+                            producer_id=stepper[1], event=event, timestamp=timestamp
+                        )
+                    timestamp = tick()
+                    if not stepper[3]():
+                        still_active.append(stepper)
+
+            self._timestamp = timestamp
+            self._steps += 1
+            steps_since_yield += 1
+            if len(still_active) != len(steppers):
+                self._finished_producers += len(steppers) - len(still_active)
+                steppers = still_active
+                self._active = [stepper[0] for stepper in steppers]
+
+            if len(events) >= yield_every or steps_since_yield >= yield_every:
+                if events:
+                    await publish_many(events)
+                    events = []
+                    append = events.append
+                steps_since_yield = 0
+                await asyncio.sleep(0)
+
+        if events:
+            await publish_many(events)
+        self._finished = True
+
+    async def _run_pipelined(self) -> None:
+        """
+        Step producers into a staging queue of up to `lookahead` steps while a
+        publisher task drains it into the transport. A single publisher keeps
+        the events in step order. If publishing fails, stepping stops and the
+        error is raised once the publisher has exited. When a checkpoint is due,
+        stepping waits for the staged steps to be published before saving it.
+        """
+        staging: asyncio.Queue[Optional[List[Event]]] = asyncio.Queue(
+            maxsize=self._lookahead
+        )
+        self._publish_error = None
+        publisher = asyncio.create_task(self._publish_staged(staging))
+
+        try:
+            while not self._finished and self._publish_error is None:
+                events = self._step_producers()
+                if events:
+                    await staging.put(events)
+                if self._checkpoint_due():
+                    await staging.join()
+                    if self._publish_error is None:
+                        self._save_checkpoint()
+        except BaseException:
+            publisher.cancel()
+            raise
+
+        await staging.put(None)
+        await publisher
+        if self._publish_error is not None:
+            raise self._publish_error
+
+    async def _publish_staged(
+        self, staging: "asyncio.Queue[Optional[List[Event]]]"
+    ) -> None:
+        """
+        Publish staged steps until the end marker. After a failure the
+        remaining steps are discarded so that stepping never waits on a full queue.
+        """
+        while True:
+            events = await staging.get()
+            if events is None:
+                return
+            if self._publish_error is None:
+                try:
+                    await self._transport.publish_many(events)
+                except Exception as e:
+                    self._publish_error = e
+            staging.task_done()
+
+    def _step_chunk(self, producer: Producer, events: List[Event]) -> None:
+        """
+        Advance a producer by up to chunk_size steps in a single call,
+        collecting its events and ticking the clock once per executed step.
+        """
+        for event in producer.step_many(self._timestamp, self._chunk_size):
+            if event is not None:
+                events.append(event)
+                if self._tracer:
+                    self._tracer.record_step(
+                        producer_id=producer.producer_id,
+                        event=event,
+                        timestamp=self._timestamp,
+                    )
+
+            self._timestamp = self._clock.tick()
+
     def is_finished(self) -> bool:
         """
         Check if all producers have completed execution.
@@ -114,6 +538,12 @@ class SimpleRunner(Runner):
         """
         return self._finished
 
-    def _all_finished(self) -> bool:
-        """Check if all producers have finished."""
-        return all(producer.is_finished() for producer in self._producers)
+    @property
+    def active_producers(self) -> int:
+        """Number of producers that have not finished yet."""
+        return len(self._active)
+
+    @property
+    def finished_producers(self) -> int:
+        """Number of producers that have finished."""
+        return self._finished_producers
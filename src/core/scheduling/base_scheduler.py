@@ -0,0 +1,62 @@
+from abc import ABC
+from dataclasses import dataclass
+from typing import Dict
+
+from src.core.contracts.producer import Producer
+from src.core.contracts.scheduler import Scheduler
+
+
+@dataclass(slots=True)
+class ProducerAccounting:
+    """Step-time accounting of a single producer."""
+
+    steps: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.steps if self.steps else 0.0
+
+
+class BaseScheduler(Scheduler, ABC):
+    """
+    Base implementation for all producer schedulers.
+
+    Keeps per-producer step-time accounting from the steps reported by the runner.
+    """
+
+    def __init__(self) -> None:
+        self._accounting: Dict[Producer, ProducerAccounting] = {}
+
+    def record_step(self, producer: Producer, elapsed: float) -> None:
+        """
+        Account for a step executed by the runner.
+        Args:
+            producer (Producer): The producer that was stepped
+            elapsed (float): Wall-clock duration of the step in seconds
+        """
+        accounting = self._accounting.get(producer)
+        if accounting is None:
+            accounting = self._accounting[producer] = ProducerAccounting()
+
+        accounting.steps += 1
+        accounting.total_time += elapsed
+        if elapsed > accounting.max_time:
+            accounting.max_time = elapsed
+
+        self._on_step(producer, elapsed)
+
+    def accounting(self, producer: Producer) -> ProducerAccounting:
+        """
+        Get the step-time accounting of a producer.
+        Producers that have not been stepped yet report zero steps.
+        """
+        return self._accounting.get(producer) or ProducerAccounting()
+
+    def _on_step(self, producer: Producer, elapsed: float) -> None:
+        """
+        Hook for schedulers whose decisions depend on measured step time.
+        Called after the accounting has been updated; does nothing by default.
+        """
+        pass
@@ -0,0 +1,64 @@
+from typing import Dict, Iterator, Mapping, Optional, Sequence
+
+from src.core.contracts.producer import Producer
+from src.core.scheduling.base_scheduler import BaseScheduler
+
+
+class PriorityScheduler(BaseScheduler):
+    """
+    Steps producers once per round from the highest priority down, within an
+    optional time budget per round.
+
+    Once the steps of a round have used up `round_budget` seconds, the remaining
+    producers are skipped for that round. Every skipped round raises a producer's
+    effective priority by one until it is stepped again, so low-priority producers
+    are delayed but never starved. Producers of equal priority keep runner order.
+    """
+
+    def __init__(
+        self,
+        priorities: Optional[Mapping[Producer, int]] = None,
+        *,
+        round_budget: Optional[float] = None,
+        default_priority: int = 0,
+    ) -> None:
+        """
+        Args:
+            priorities (Optional[Mapping[Producer, int]]): Priority of each producer,
+                higher runs first.
+            round_budget (Optional[float]): Seconds of step time per round, unbounded if None.
+            default_priority (int): Priority of producers missing from `priorities`.
+        """
+        super().__init__()
+
+        if round_budget is not None and round_budget <= 0:
+            raise ValueError("round_budget must be positive.")
+
+        self._priorities: Dict[Producer, int] = dict(priorities or {})
+        self._round_budget = round_budget
+        self._default_priority = default_priority
+        self._ages: Dict[Producer, int] = {}
+        self._round_time = 0.0
+
+    def schedule(self, producers: Sequence[Producer]) -> Iterator[Producer]:
+        ages = self._ages
+        ordered = sorted(
+            producers,
+            key=lambda producer: -(
+                self._priorities.get(producer, self._default_priority)
+                + ages.get(producer, 0)
+            ),
+        )
+
+        self._round_time = 0.0
+        budget = self._round_budget
+        for index, producer in enumerate(ordered):
+            if budget is not None and index and self._round_time >= budget:
+                ages[producer] = ages.get(producer, 0) + 1
+                continue
+
+            yield producer
+            ages.pop(producer, None)
+
+    def _on_step(self, producer: Producer, elapsed: float) -> None:
+        self._round_time += elapsed
@@ -0,0 +1,14 @@
+from typing import Iterator, Sequence
+
+from src.core.contracts.producer import Producer
+from src.core.scheduling.base_scheduler import BaseScheduler
+
+
+class RoundRobinScheduler(BaseScheduler):
+    """
+    Steps every unfinished producer once per round, in runner order.
+    This is the schedule SimpleRunner follows without a scheduler, plus accounting.
+    """
+
+    def schedule(self, producers: Sequence[Producer]) -> Iterator[Producer]:
+        return iter(producers)
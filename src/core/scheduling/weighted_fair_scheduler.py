@@ -0,0 +1,84 @@
+from typing import Dict, Iterator, Mapping, Optional, Sequence
+
+from src.core.contracts.producer import Producer
+from src.core.scheduling.base_scheduler import BaseScheduler
+
+
+class WeightedFairScheduler(BaseScheduler):
+    """
+    Shares step time between producers in proportion to their weights.
+
+    Deficit round robin on measured time: every round each producer is credited
+    `quantum * weight` seconds and stepped while its credit is positive, each step
+    costing its measured duration. A producer whose step outlasts its credit runs
+    into debt and sits out rounds until it is paid back, so expensive producers
+    cannot starve cheap ones, and a producer's time per round stays bounded by
+    about one quantum plus one step.
+
+    Steps per round are capped as well, in proportion to the weights, so that
+    producers whose steps are too cheap to exhaust their credit still share
+    steps by weight.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Mapping[Producer, float]] = None,
+        *,
+        quantum: float = 0.001,
+        default_weight: float = 1.0,
+        max_steps_per_round: int = 1000,
+    ) -> None:
+        """
+        Args:
+            weights (Optional[Mapping[Producer, float]]): Relative share of each producer.
+            quantum (float): Seconds of step time credited per unit of weight and round.
+            default_weight (float): Weight of producers missing from `weights`.
+            max_steps_per_round (int): Upper bound on the steps per round of the
+                producers with the highest weight, for producers whose steps are too
+                short to measure. Other producers get a share of it proportional
+                to their weight, and at least one step.
+        """
+        super().__init__()
+
+        self._weights: Dict[Producer, float] = dict(weights or {})
+        if any(weight <= 0 for weight in self._weights.values()) or default_weight <= 0:
+            raise ValueError("Producer weights must be positive.")
+        if quantum <= 0:
+            raise ValueError("quantum must be positive.")
+        if max_steps_per_round < 1:
+            raise ValueError("max_steps_per_round must be at least 1.")
+
+        self._quantum = quantum
+        self._default_weight = default_weight
+        self._max_steps_per_round = max_steps_per_round
+        self._deficits: Dict[Producer, float] = {}
+
+    def schedule(self, producers: Sequence[Producer]) -> Iterator[Producer]:
+        deficits = self._deficits
+        weights = [self._weight_of(producer) for producer in producers]
+        top_weight = max(weights, default=1.0)
+        for producer, weight in zip(producers, weights):
+            credit = self._quantum * weight
+            deficits[producer] = deficits.get(producer, 0.0) + credit
+            max_steps = max(1, round(self._max_steps_per_round * weight / top_weight))
+
+            steps = 0
+            while (
+                deficits[producer] > 0
+                and steps < max_steps
+                and not producer.is_finished()
+            ):
+                yield producer
+                steps += 1
+
+            if producer.is_finished():
+                del deficits[producer]
+            elif deficits[producer] > credit:
+                # Unused credit does not pile up across rounds
+                deficits[producer] = credit
+
+    def _weight_of(self, producer: Producer) -> float:
+        return self._weights.get(producer, self._default_weight)
+
+    def _on_step(self, producer: Producer, elapsed: float) -> None:
+        self._deficits[producer] = self._deficits.get(producer, 0.0) - elapsed
@@ -28,6 +28,14 @@ class SimpleClock(Clock):
         """
         return self._time
 
+    def restore(self, time: int) -> None:
+        """
+        Set the current step, e.g. when resuming from a checkpoint.
+        Args:
+            time (int): The step to restore.
+        """
+        self._time = time
+
     def as_read_only(self) -> ReadOnlyClock:
         """
         Get a read-only view of this clock.
@@ -2,14 +2,17 @@ import threading
 
 from src.core.contracts.clock import Clock
 from src.core.contracts.read_only_clock import ReadOnlyClock
-from src.core.time._thread_safe_read_only_clock_wrapper import (
-    _ThreadSafeReadOnlyClockWrapper,
-)
+from src.core.time._read_only_clock_wrapper import _ReadOnlyClockWrapper
 
 
 class ThreadSafeClock(Clock):
     """
     A thread-safe implementation of the Clock contract that tracks steps.
+
+    - Ticks are serialized by a lock, so concurrent ticks never lose an increment
+    - Each tick publishes the new step with a single attribute store, which
+      readers observe atomically, so now() does not lock and always returns
+      a step that was actually reached
     """
 
     def __init__(self) -> None:
@@ -23,22 +26,32 @@ class ThreadSafeClock(Clock):
             The current step after incrementing.
         """
         with self._lock:
-            self._time += 1
-            return self._time
+            time = self._time + 1
+            self._time = time
+            return time
 
     def now(self) -> int:
         """
-        Get the current step without incrementing.
+        Get the current step without incrementing or locking.
         Returns:
-            The current step value.
+            The latest published step value.
+        """
+        return self._time
+
+    def restore(self, time: int) -> None:
+        """
+        Set the current step, e.g. when resuming from a checkpoint.
+        Args:
+            time (int): The step to restore.
         """
         with self._lock:
-            return self._time
+            self._time = time
 
     def as_read_only(self) -> ReadOnlyClock:
         """
         Get a thread-safe read-only view of this clock.
+        Reads through the view are lock-free as well.
         Returns:
-            A thread-safe read-only wrapper around this clock instance.
+            A read-only wrapper around this clock instance.
         """
-        return _ThreadSafeReadOnlyClockWrapper(self)
+        return _ReadOnlyClockWrapper(self)
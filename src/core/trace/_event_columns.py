@@ -0,0 +1,55 @@
+from dataclasses import fields
+from typing import Any, List, Tuple, Type
+
+from src.core.contracts.event import Event
+
+# Fields every event carries, stored once per trace entry rather than per event type
+_BASE_FIELDS = ("timestamp", "producer_id")
+
+
+class _EventColumns:
+    """
+    Payload storage for a single event type, one list per dataclass field.
+
+    Only the fields declared beyond the Event base are stored here; the timestamp
+    and producer id live in the tracer's entry-level columns.
+    """
+
+    def __init__(self, event_type: Type[Event]) -> None:
+        self.event_type = event_type
+        self.field_names: Tuple[str, ...] = tuple(
+            field.name
+            for field in fields(event_type)
+            if field.init and field.name not in _BASE_FIELDS
+        )
+        self.columns: Tuple[List[Any], ...] = tuple([] for _ in self.field_names)
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, event: Event) -> int:
+        """
+        Store the payload of an event.
+        Returns:
+            The row of the event within this event type.
+        """
+        for name, column in zip(self.field_names, self.columns):
+            column.append(getattr(event, name))
+
+        row = self._rows
+        self._rows += 1
+        return row
+
+    def truncate(self, rows: int) -> None:
+        """Discard the payloads stored from a row onwards."""
+        for column in self.columns:
+            del column[rows:]
+        self._rows = min(self._rows, rows)
+
+    def build(self, row: int, timestamp: int, producer_id: str) -> Event:
+        """Materialize the event stored at a row."""
+        payload = {
+            name: column[row] for name, column in zip(self.field_names, self.columns)
+        }
+        return self.event_type(timestamp=timestamp, producer_id=producer_id, **payload)
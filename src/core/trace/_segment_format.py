@@ -0,0 +1,51 @@
+import pickle
+import struct
+from pathlib import Path
+from typing import List, Tuple
+
+from src.core.contracts.event import Event
+
+# Every segment file starts with this magic, followed by fixed-header records
+SEGMENT_MAGIC = b"RTRACE01"
+SEGMENT_SUFFIX = ".trace"
+
+# timestamp (int64), producer id length (uint16), event payload length (uint32)
+RECORD_HEADER = struct.Struct("<qHI")
+
+
+def segment_path(directory: Path, index: int) -> Path:
+    """Path of the segment file with the given index."""
+    return directory / f"segment-{index:08d}{SEGMENT_SUFFIX}"
+
+
+def segment_index(path: Path) -> int:
+    """Index of a segment file, parsed from its name."""
+    return int(path.name[len("segment-") : -len(SEGMENT_SUFFIX)])
+
+
+def list_segments(directory: Path) -> List[Path]:
+    """Segment files of a trace directory, in write order."""
+    return sorted(directory.glob(f"segment-*{SEGMENT_SUFFIX}"))
+
+
+def encode_record(producer_id: str, timestamp: int, event: Event) -> bytes:
+    """Encode a single trace step as header + producer id + event payload."""
+    producer_bytes = producer_id.encode("utf-8")
+    payload = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+    return (
+        RECORD_HEADER.pack(timestamp, len(producer_bytes), len(payload))
+        + producer_bytes
+        + payload
+    )
+
+
+def decode_record(buffer: memoryview, offset: int) -> Tuple[str, int, Event]:
+    """Decode the record starting at an offset of a segment buffer."""
+    timestamp, producer_length, payload_length = RECORD_HEADER.unpack_from(
+        buffer, offset
+    )
+    start = offset + RECORD_HEADER.size
+    producer_id = bytes(buffer[start : start + producer_length]).decode("utf-8")
+    start += producer_length
+    event = pickle.loads(buffer[start : start + payload_length])
+    return producer_id, timestamp, event
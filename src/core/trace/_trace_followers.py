@@ -0,0 +1,69 @@
+import asyncio
+from typing import AsyncIterator, Callable, Iterator, List
+
+from src.core.contracts.trace_entry import TraceEntry
+
+
+class _TraceFollowers:
+    """
+    Wakes the coroutines following a tracer when new steps become readable.
+
+    Tracers call notify() after recording (or persisting) steps, which must
+    happen on the thread running the followers' event loop, and truncated()
+    after discarding steps.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: List["asyncio.Future[None]"] = []
+        self._closed = False
+        # Bumped on every truncation, followers started before it end
+        self._generation = 0
+
+    def notify(self) -> None:
+        """Wake every waiting follower."""
+        if not self._waiters:
+            return
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def truncated(self) -> None:
+        """
+        End every active follower: their offsets may point past the steps that
+        were discarded, or at steps recorded in place of them.
+        """
+        self._generation += 1
+        self.notify()
+
+    def close(self) -> None:
+        """Let followers finish once they have read the remaining steps."""
+        self._closed = True
+        self.notify()
+
+    async def follow(
+        self, iter_since: Callable[[int], Iterator[TraceEntry]], offset: int
+    ) -> AsyncIterator[TraceEntry]:
+        """
+        Yield the steps from an offset on, then wait for new ones.
+        Returns once the tracer is closed and every step has been yielded,
+        or as soon as the tracer is truncated.
+        """
+        generation = self._generation
+        while True:
+            closed = self._closed
+            for entry in iter_since(offset):
+                if self._generation != generation:
+                    return
+                offset += 1
+                yield entry
+
+            if closed or self._generation != generation:
+                return
+            if self._closed:
+                continue
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
@@ -0,0 +1,143 @@
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from src.core.contracts.event import Event
+from src.core.errors import ContractViolationError
+
+
+class _TraceIndex:
+    """
+    Secondary indexes over the steps recorded by a tracer, maintained while recording.
+
+    - The tracer's own timestamp column serves as the timestamp index and is
+      binary searched for range queries, as long as steps arrive in timestamp order
+    - Posting lists hold the positions of each producer's and each event type's
+      steps, in recording order, so they are sorted as well
+
+    The index only yields positions; the tracer turns them into entries lazily.
+    """
+
+    def __init__(self, timestamps: "array[int]") -> None:
+        """
+        Args:
+            timestamps (array[int]): The tracer's timestamp column, one entry per
+                recorded step. The tracer appends to it before calling add().
+        """
+        self._timestamps = timestamps
+        # Position of the first step recorded before its predecessor's timestamp
+        self._first_unsorted: Optional[int] = None
+        self._by_producer: Dict[str, "array[int]"] = {}
+        self._by_type: Dict[Type[Event], "array[int]"] = {}
+
+    def add(self, position: int, producer_id: str, event_type: Type[Event]) -> None:
+        """Index the step recorded at a position."""
+        timestamps = self._timestamps
+        if (
+            self._first_unsorted is None
+            and position
+            and timestamps[position] < timestamps[position - 1]
+        ):
+            self._first_unsorted = position
+
+        postings = self._by_producer.get(producer_id)
+        if postings is None:
+            postings = self._by_producer[producer_id] = array("q")
+        postings.append(position)
+
+        postings = self._by_type.get(event_type)
+        if postings is None:
+            postings = self._by_type[event_type] = array("q")
+        postings.append(position)
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the indexed steps were recorded in timestamp order."""
+        return self._first_unsorted is None
+
+    def truncate(self, position: int) -> None:
+        """Forget the steps from a position onwards."""
+        if self._first_unsorted is not None and self._first_unsorted >= position:
+            self._first_unsorted = None
+        _truncate_postings(self._by_producer, position)
+        _truncate_postings(self._by_type, position)
+
+    def positions(
+        self,
+        producer_id: Optional[str],
+        start: Optional[int],
+        end: Optional[int],
+        event_type: Optional[Type[Event]],
+    ) -> Iterator[int]:
+        """
+        Lazily iterate the positions of the matching steps, in recording order.
+        Raises:
+            ContractViolationError: if a timestamp bound is given and steps were
+            not recorded in timestamp order.
+        """
+        low, high = 0, len(self._timestamps)
+        if start is not None or end is not None:
+            if self._first_unsorted is not None:
+                raise ContractViolationError(
+                    "Trace was not recorded in timestamp order and cannot be queried."
+                )
+            if start is not None:
+                low = bisect_left(self._timestamps, start)
+            if end is not None:
+                high = max(low, bisect_left(self._timestamps, end, lo=low))
+
+        candidates: List[Iterable[int]] = []
+        if producer_id is not None:
+            candidates.append(
+                self._window(self._by_producer.get(producer_id), low, high)
+            )
+        if event_type is not None:
+            candidates.append(
+                merge(
+                    *(
+                        self._window(postings, low, high)
+                        for indexed_type, postings in self._by_type.items()
+                        if issubclass(indexed_type, event_type)
+                    )
+                )
+            )
+
+        if not candidates:
+            return iter(range(low, high))
+        if len(candidates) == 1:
+            return iter(candidates[0])
+        return _intersect(iter(candidates[0]), iter(candidates[1]))
+
+    @staticmethod
+    def _window(postings: Optional["array[int]"], low: int, high: int) -> Iterable[int]:
+        """The part of a posting list between two positions, without copying it."""
+        if postings is None:
+            return ()
+        first = bisect_left(postings, low)
+        last = bisect_left(postings, high, lo=first)
+        return (postings[index] for index in range(first, last))
+
+
+def _truncate_postings(index: Dict[Any, "array[int]"], position: int) -> None:
+    """Drop the positions at or after a position from every posting list."""
+    for key in list(index):
+        postings = index[key]
+        del postings[bisect_left(postings, position) :]
+        if not postings:
+            del index[key]
+
+
+def _intersect(left: Iterator[int], right: Iterator[int]) -> Iterator[int]:
+    """Intersect two ascending position streams."""
+    a = next(left, None)
+    b = next(right, None)
+    while a is not None and b is not None:
+        if a == b:
+            yield a
+            a = next(left, None)
+            b = next(right, None)
+        elif a < b:
+            a = next(left, None)
+        else:
+            b = next(right, None)
@@ -0,0 +1,306 @@
+from array import array
+from bisect import bisect_left
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from src.core.contracts.event import Event
+from src.core.contracts.runner_tracer import RunnerTracer
+from src.core.contracts.trace_entry import TraceEntry
+from src.core.errors import ContractViolationError
+from src.core.trace._event_columns import _EventColumns
+from src.core.trace._trace_followers import _TraceFollowers
+from src.core.trace._trace_index import _TraceIndex
+
+
+class ColumnarRunnerTracer(RunnerTracer):
+    """
+    Memory-compact implementation of RunnerTracer storing the trace as columns.
+    Responsibilities:
+    - Store timestamps in an array('q') and producer ids as small integer codes
+    - Store event payloads in per-event-type columns instead of keeping Event objects
+    - Provide zero-copy views and timestamp range slicing over the recorded steps
+    - Maintain producer and event type posting lists for query()
+    - Materialize TraceEntry objects lazily, only when they are accessed
+    """
+
+    def __init__(self) -> None:
+        self._timestamps = array("q")
+        self._producer_codes = array("I")
+        self._type_codes = array("I")
+        self._type_rows = array("q")
+
+        self._producer_ids: List[str] = []
+        self._producer_index: Dict[str, int] = {}
+        self._event_columns: List[_EventColumns] = []
+        self._type_index: Dict[Type[Event], int] = {}
+
+        # Events whose own timestamp/producer_id differ from the recorded step
+        self._event_overrides: Dict[int, Tuple[int, str]] = {}
+        self._index = _TraceIndex(self._timestamps)
+        self._followers = _TraceFollowers()
+
+    def record_step(self, producer_id: str, timestamp: int, event: Event) -> None:
+        """
+        Record a single step in the execution trace.
+        Args:
+            producer_id (str): The unique identifier of the producer that executed the step
+            timestamp (int): The logical clock time when the step occurred
+            event (Event): The event emitted by the producer during this step
+        """
+        producer_code = self._producer_index.get(producer_id)
+        if producer_code is None:
+            producer_code = len(self._producer_ids)
+            self._producer_index[producer_id] = producer_code
+            self._producer_ids.append(producer_id)
+
+        event_type = type(event)
+        type_code = self._type_index.get(event_type)
+        if type_code is None:
+            type_code = len(self._event_columns)
+            self._type_index[event_type] = type_code
+            self._event_columns.append(_EventColumns(event_type))
+
+        position = len(self._timestamps)
+        if event.timestamp != timestamp or event.producer_id != producer_id:
+            self._event_overrides[position] = (event.timestamp, event.producer_id)
+
+        self._timestamps.append(timestamp)
+        self._producer_codes.append(producer_code)
+        self._type_codes.append(type_code)
+        self._type_rows.append(self._event_columns[type_code].append(event))
+        self._index.add(position, producer_id, event_type)
+        self._followers.notify()
+
+    def get_trace(self) -> List[TraceEntry]:
+        """
+        Get the copy of the trace log generated so far.
+        Every entry is materialized, prefer view() or slice_by_timestamp() on large traces.
+        Returns:
+            A list of TraceEntry objects representing the execution trace.
+        """
+        return [self._entry_at(position) for position in range(len(self._timestamps))]
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def position(self) -> int:
+        """
+        Get the number of steps recorded so far.
+        """
+        return len(self._timestamps)
+
+    def iter_since(self, offset: int) -> Iterator[TraceEntry]:
+        """
+        Lazily iterate the steps recorded from position `offset` on, without
+        copying the trace. Entries are materialized on demand and steps
+        recorded while iterating are included.
+        Args:
+            offset (int): The number of steps to skip, e.g. the steps already read
+        Returns:
+            An iterator over the TraceEntry objects recorded after the offset.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._read_since(offset)
+
+    def follow(self, offset: int = 0) -> AsyncIterator[TraceEntry]:
+        """
+        Asynchronously iterate the steps recorded from position `offset` on,
+        waiting for record_step() to append new ones once they are exhausted.
+        record_step() must be called on the thread running the follower's event loop.
+        Args:
+            offset (int): The number of steps to skip
+        Returns:
+            An async iterator over the recorded TraceEntry objects, which ends
+            when the trace is truncated or when the caller stops iterating.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._followers.follow(self._read_since, offset)
+
+    def truncate(self, position: int) -> None:
+        """
+        Discard every step recorded after the first `position` ones, along
+        with their payloads. Producer and event type codes are kept.
+        Active followers end, and must follow again from the new position.
+        Raises:
+            ValueError: if fewer than `position` steps are recorded.
+        """
+        length = len(self._timestamps)
+        if not 0 <= position <= length:
+            raise ValueError(
+                f"Cannot truncate a trace of {length} steps to {position}."
+            )
+
+        # Rows are assigned in recording order, so each type keeps its rows
+        # below the first one recorded at or after the position
+        first_rows: Dict[int, int] = {}
+        for index in range(position, length):
+            first_rows.setdefault(self._type_codes[index], self._type_rows[index])
+        for type_code, row in first_rows.items():
+            self._event_columns[type_code].truncate(row)
+
+        for column in (
+            self._timestamps,
+            self._producer_codes,
+            self._type_codes,
+            self._type_rows,
+        ):
+            del column[position:]
+
+        for index in [i for i in self._event_overrides if i >= position]:
+            del self._event_overrides[index]
+        self._index.truncate(position)
+        self._followers.truncated()
+
+    def view(self) -> "ColumnarTraceView":
+        """
+        Get a lazy view over every step recorded so far.
+        Returns:
+            A ColumnarTraceView that does not copy the underlying columns.
+        """
+        return ColumnarTraceView(self, 0, len(self._timestamps))
+
+    def slice_by_timestamp(self, start: int, end: int) -> "ColumnarTraceView":
+        """
+        Get a lazy view over the steps with start <= timestamp < end.
+        Args:
+            start (int): The first logical timestamp to include
+            end (int): The logical timestamp to stop before
+        Returns:
+            A ColumnarTraceView over the matching steps.
+        Raises:
+            ContractViolationError: if steps were not recorded in timestamp order.
+        """
+        if not self._index.is_sorted:
+            raise ContractViolationError(
+                "Trace was not recorded in timestamp order and cannot be sliced."
+            )
+
+        low = bisect_left(self._timestamps, start)
+        high = bisect_left(self._timestamps, end, lo=low)
+        return ColumnarTraceView(self, low, max(low, high))
+
+    def query(
+        self,
+        *,
+        producer_id: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        event_type: Optional[Type[Event]] = None,
+    ) -> Iterator[TraceEntry]:
+        """
+        Lazily iterate the recorded steps matching every given filter, in recording order.
+        Only the matching entries are materialized.
+        Args:
+            producer_id (Optional[str]): Only steps executed by this producer
+            start (Optional[int]): Only steps with a timestamp at or after it
+            end (Optional[int]): Only steps with a timestamp before it
+            event_type (Optional[Type[Event]]): Only events of this type or a subclass
+        Returns:
+            An iterator over the matching TraceEntry objects.
+        Raises:
+            ContractViolationError: if a timestamp bound is given and steps were
+            not recorded in timestamp order.
+        """
+        positions = self._index.positions(producer_id, start, end, event_type)
+        entry_at = self._entry_at
+        return (entry_at(position) for position in positions)
+
+    @property
+    def producer_ids(self) -> List[str]:
+        """Producer ids indexed by their integer code."""
+        return self._producer_ids.copy()
+
+    def _read_since(self, offset: int) -> Iterator[TraceEntry]:
+        """Yield the steps from an offset on, until the end of the trace."""
+        position = offset
+        while position < len(self._timestamps):
+            yield self._entry_at(position)
+            position += 1
+
+    def _entry_at(self, position: int) -> TraceEntry:
+        """Materialize the trace entry recorded at a position."""
+        timestamp = self._timestamps[position]
+        producer_id = self._producer_ids[self._producer_codes[position]]
+
+        event_timestamp, event_producer_id = self._event_overrides.get(
+            position, (timestamp, producer_id)
+        )
+        columns = self._event_columns[self._type_codes[position]]
+        event = columns.build(
+            self._type_rows[position], event_timestamp, event_producer_id
+        )
+
+        return TraceEntry(event=event, producer_id=producer_id, timestamp=timestamp)
+
+
+class ColumnarTraceView(Sequence[TraceEntry]):
+    """
+    Read-only, lazy window over a contiguous range of a ColumnarRunnerTracer.
+
+    - Indexing or iterating materializes TraceEntry objects on demand
+    - Slicing returns another view without copying
+    - timestamps() and producer_codes() expose the raw columns as memoryviews
+
+    Memoryviews pin the underlying arrays: release them (or use them in a
+    `with` block) before the tracer records further steps.
+    """
+
+    def __init__(self, tracer: ColumnarRunnerTracer, start: int, stop: int) -> None:
+        self._tracer = tracer
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> TraceEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ColumnarTraceView": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TraceEntry, "ColumnarTraceView"]:
+        if isinstance(index, slice):
+            start, stop, stride = index.indices(len(self))
+            if stride != 1:
+                raise ValueError("ColumnarTraceView only supports contiguous slices.")
+            return ColumnarTraceView(
+                self._tracer, self._start + start, self._start + max(start, stop)
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarTraceView index out of range.")
+        return self._tracer._entry_at(self._start + index)
+
+    def __iter__(self) -> Iterator[TraceEntry]:
+        entry_at = self._tracer._entry_at
+        for position in range(self._start, self._stop):
+            yield entry_at(position)
+
+    def timestamps(self) -> memoryview:
+        """Zero-copy view of the timestamps in this range."""
+        return memoryview(self._tracer._timestamps)[self._start : self._stop]
+
+    def producer_codes(self) -> memoryview:
+        """Zero-copy view of the producer codes in this range, see producer_ids."""
+        return memoryview(self._tracer._producer_codes)[self._start : self._stop]
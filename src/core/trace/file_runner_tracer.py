@@ -0,0 +1,263 @@
+import os
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterator, List, Optional, Union
+
+from src.core.contracts.event import Event
+from src.core.contracts.runner_tracer import RunnerTracer
+from src.core.contracts.trace_entry import TraceEntry
+from src.core.errors import InvalidLifecycleError
+from src.core.trace._segment_format import (
+    SEGMENT_MAGIC,
+    encode_record,
+    list_segments,
+    segment_index,
+    segment_path,
+)
+from src.core.trace._trace_followers import _TraceFollowers
+from src.core.trace.trace_segment_reader import TraceSegmentReader
+
+
+class FileRunnerTracer(RunnerTracer):
+    """
+    Implementation of RunnerTracer that streams the trace to append-only segment files.
+    Responsibilities:
+    - Encode each recorded step as a fixed-size header followed by its payload
+    - Buffer records in memory and write them in batches of `flush_every` records
+    - Rotate to a new segment file once the current one exceeds `segment_size` bytes
+    - Read the trace back through a memory-mapped TraceSegmentReader
+    - Let readers tail the written records through iter_since() and follow()
+
+    Opening an existing trace directory appends new segments after the existing ones.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        flush_every: int = 1024,
+        segment_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            directory (Union[str, Path]): Directory holding the segment files.
+            flush_every (int): Number of buffered records written per batch.
+            segment_size (int): Size in bytes after which a new segment is started.
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1.")
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1.")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._flush_every = flush_every
+        self._segment_size = segment_size
+
+        existing = list_segments(self._directory)
+        self._next_segment = segment_index(existing[-1]) + 1 if existing else 0
+        self._file: Optional[BinaryIO] = None
+        self._file_size = 0
+
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._closed = False
+
+        # Reader kept open for iter_since(), refreshed instead of reopened
+        self._tail: Optional[TraceSegmentReader] = None
+        self._followers = _TraceFollowers()
+
+        self._recorded = 0
+        if existing:
+            with TraceSegmentReader(self._directory) as reader:
+                self._recorded = len(reader)
+
+    def record_step(self, producer_id: str, timestamp: int, event: Event) -> None:
+        """
+        Record a single step in the execution trace.
+        Args:
+            producer_id (str): The unique identifier of the producer that executed the step
+            timestamp (int): The logical clock time when the step occurred
+            event (Event): The event emitted by the producer during this step
+        Raises:
+            InvalidLifecycleError: if the tracer has been closed
+        """
+        if self._closed:
+            raise InvalidLifecycleError("FileRunnerTracer is closed.")
+
+        self._buffer += encode_record(producer_id, timestamp, event)
+        self._buffered += 1
+        self._recorded += 1
+
+        if self._buffered >= self._flush_every:
+            self.flush()
+
+    def get_trace(self) -> List[TraceEntry]:
+        """
+        Get the copy of the trace log generated so far, read back from disk.
+        Returns:
+            A list of TraceEntry objects representing the execution trace.
+        """
+        with self.reader() as reader:
+            return reader.get_trace()
+
+    def reader(self) -> TraceSegmentReader:
+        """
+        Flush pending records and open a memory-mapped reader over the segments.
+        Returns:
+            A TraceSegmentReader that must be closed by the caller.
+        """
+        self.flush()
+        return TraceSegmentReader(self._directory)
+
+    def position(self) -> int:
+        """
+        Flush pending records and get the number of steps in the trace directory.
+        """
+        self.flush()
+        return self._recorded
+
+    def iter_since(self, offset: int) -> Iterator[TraceEntry]:
+        """
+        Flush pending records and lazily read the steps from position `offset` on.
+        A reader is kept open between calls and only indexes the records
+        written since the previous call.
+        Args:
+            offset (int): The number of steps to skip, e.g. the steps already read
+        Returns:
+            An iterator decoding the TraceEntry objects recorded after the offset.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        self.flush()
+        return self._read_since(offset)
+
+    def follow(self, offset: int = 0) -> AsyncIterator[TraceEntry]:
+        """
+        Asynchronously iterate the steps recorded from position `offset` on,
+        waiting for new ones once they are exhausted. Steps become visible
+        when they are written, every `flush_every` records or on flush().
+        Flushing must happen on the thread running the follower's event loop.
+        Args:
+            offset (int): The number of steps to skip
+        Returns:
+            An async iterator over the recorded TraceEntry objects, which ends
+            once the tracer is closed and every step has been read, or when
+            the trace is truncated.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._followers.follow(self._read_since, offset)
+
+    def truncate(self, position: int) -> None:
+        """
+        Discard every step recorded after the first `position` ones by cutting
+        the segment holding that step and deleting the segments after it.
+        Steps recorded afterwards go to a new segment. Active followers end,
+        and must follow again from the new position.
+        Raises:
+            InvalidLifecycleError: if the tracer has been closed
+            ValueError: if fewer than `position` steps are recorded.
+        """
+        if self._closed:
+            raise InvalidLifecycleError("FileRunnerTracer is closed.")
+        if not 0 <= position <= self._recorded:
+            raise ValueError(
+                f"Cannot truncate a trace of {self._recorded} steps to {position}."
+            )
+
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._close_tail()
+        self._followers.truncated()
+        with TraceSegmentReader(self._directory) as reader:
+            if not len(reader):
+                return
+            path, offset = reader.location(position)
+
+        os.truncate(path, offset)
+        for later in list_segments(self._directory):
+            if segment_index(later) > segment_index(path):
+                later.unlink()
+
+        self._next_segment = segment_index(path) + 1
+        self._recorded = position
+
+    def flush(self) -> None:
+        """
+        Write buffered records to the current segment, rotating it if it is full.
+        """
+        if not self._buffer:
+            return
+
+        segment = self._file
+        if segment is None or self._file_size >= self._segment_size:
+            segment = self._open_next_segment()
+
+        segment.write(self._buffer)
+        segment.flush()
+        self._file_size += len(self._buffer)
+
+        self._buffer.clear()
+        self._buffered = 0
+        self._followers.notify()
+
+    def close(self) -> None:
+        """
+        Flush pending records and close the current segment. Safe to call more than once.
+        """
+        if self._closed:
+            return
+
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._closed = True
+        self._close_tail()
+        self._followers.close()
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the segment files."""
+        return self._directory
+
+    def _read_since(self, offset: int) -> Iterator[TraceEntry]:
+        """Yield the written steps from an offset on, through the tail reader."""
+        if self._closed:
+            with TraceSegmentReader(self._directory) as reader:
+                yield from reader.iter_since(offset)
+            return
+
+        if self._tail is None:
+            self._tail = TraceSegmentReader(self._directory)
+        else:
+            self._tail.refresh()
+        yield from self._tail.iter_since(offset)
+
+    def _close_tail(self) -> None:
+        """
+        Close the tail reader. Iterators reading from it stop, and followers
+        still running resume from their offset through a new one.
+        """
+        if self._tail is not None:
+            self._tail.close()
+            self._tail = None
+
+    def _open_next_segment(self) -> BinaryIO:
+        """Close the current segment and start a new one."""
+        if self._file is not None:
+            self._file.close()
+
+        segment = open(segment_path(self._directory, self._next_segment), "wb")
+        segment.write(SEGMENT_MAGIC)
+        self._file = segment
+        self._file_size = len(SEGMENT_MAGIC)
+        self._next_segment += 1
+        return segment
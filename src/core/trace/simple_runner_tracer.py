@@ -1,8 +1,11 @@
-from typing import List
+from array import array
+from typing import AsyncIterator, Iterator, List, Optional, Type
 
 from src.core.contracts.event import Event
 from src.core.contracts.runner_tracer import RunnerTracer
 from src.core.contracts.trace_entry import TraceEntry
+from src.core.trace._trace_followers import _TraceFollowers
+from src.core.trace._trace_index import _TraceIndex
 
 
 class SimpleRunnerTracer(RunnerTracer):
@@ -11,10 +14,14 @@ class SimpleRunnerTracer(RunnerTracer):
     Responsibilities:
     - Record each step of the execution with associated events
     - Provide access to the complete trace log for analysis
+    - Maintain timestamp and producer indexes for query()
     """
 
     def __init__(self) -> None:
         self._trace_log: List[TraceEntry] = []
+        self._timestamps = array("q")
+        self._index = _TraceIndex(self._timestamps)
+        self._followers = _TraceFollowers()
 
     def record_step(self, producer_id: str, timestamp: int, event: Event) -> None:
         """
@@ -26,6 +33,9 @@ class SimpleRunnerTracer(RunnerTracer):
         """
         entry = TraceEntry(event=event, producer_id=producer_id, timestamp=timestamp)
         self._trace_log.append(entry)
+        self._timestamps.append(timestamp)
+        self._index.add(len(self._timestamps) - 1, producer_id, type(event))
+        self._followers.notify()
 
     def get_trace(self) -> List[TraceEntry]:
         """
@@ -34,3 +44,91 @@ class SimpleRunnerTracer(RunnerTracer):
             A list of TraceEntry objects representing the execution trace.
         """
         return self._trace_log.copy()
+
+    def position(self) -> int:
+        """
+        Get the number of steps recorded so far.
+        """
+        return len(self._trace_log)
+
+    def iter_since(self, offset: int) -> Iterator[TraceEntry]:
+        """
+        Lazily iterate the steps recorded from position `offset` on, without
+        copying the trace. Steps recorded while iterating are included.
+        Args:
+            offset (int): The number of steps to skip, e.g. the steps already read
+        Returns:
+            An iterator over the TraceEntry objects recorded after the offset.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._read_since(offset)
+
+    def follow(self, offset: int = 0) -> AsyncIterator[TraceEntry]:
+        """
+        Asynchronously iterate the steps recorded from position `offset` on,
+        waiting for record_step() to append new ones once they are exhausted.
+        record_step() must be called on the thread running the follower's event loop.
+        Args:
+            offset (int): The number of steps to skip
+        Returns:
+            An async iterator over the recorded TraceEntry objects, which ends
+            when the trace is truncated or when the caller stops iterating.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._followers.follow(self._read_since, offset)
+
+    def truncate(self, position: int) -> None:
+        """
+        Discard every step recorded after the first `position` ones.
+        Active followers end, and must follow again from the new position.
+        Raises:
+            ValueError: if fewer than `position` steps are recorded.
+        """
+        if not 0 <= position <= len(self._trace_log):
+            raise ValueError(
+                f"Cannot truncate a trace of {len(self._trace_log)} steps to {position}."
+            )
+        del self._trace_log[position:]
+        del self._timestamps[position:]
+        self._index.truncate(position)
+        self._followers.truncated()
+
+    def query(
+        self,
+        *,
+        producer_id: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        event_type: Optional[Type[Event]] = None,
+    ) -> Iterator[TraceEntry]:
+        """
+        Lazily iterate the recorded steps matching every given filter, in recording order.
+        Timestamp bounds are binary searched and producer/event type filters walk
+        posting lists, so the cost depends on the number of matches, not the trace length.
+        Args:
+            producer_id (Optional[str]): Only steps executed by this producer
+            start (Optional[int]): Only steps with a timestamp at or after it
+            end (Optional[int]): Only steps with a timestamp before it
+            event_type (Optional[Type[Event]]): Only events of this type or a subclass
+        Returns:
+            An iterator over the matching TraceEntry objects.
+        Raises:
+            ContractViolationError: if a timestamp bound is given and steps were
+            not recorded in timestamp order.
+        """
+        positions = self._index.positions(producer_id, start, end, event_type)
+        trace_log = self._trace_log
+        return (trace_log[position] for position in positions)
+
+    def _read_since(self, offset: int) -> Iterator[TraceEntry]:
+        """Yield the steps from an offset on, until the end of the trace."""
+        position = offset
+        while position < len(self._timestamps):
+            yield self._trace_log[position]
+            position += 1
@@ -0,0 +1,245 @@
+import mmap
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator, List, Optional, Tuple, Type, Union
+
+from src.core.contracts.trace_entry import TraceEntry
+from src.core.errors import ContractViolationError
+from src.core.trace._segment_format import (
+    RECORD_HEADER,
+    SEGMENT_MAGIC,
+    decode_record,
+    list_segments,
+    segment_index,
+)
+
+
+class TraceSegmentReader:
+    """
+    Memory-mapped reader over the segment files written by FileRunnerTracer.
+
+    - Maps every segment read-only and indexes record headers on open,
+      payloads are only decoded when entries are read
+    - Supports timestamp range queries through a binary search over the index
+    - Ignores a truncated trailing record left behind by an interrupted writer
+    - Picks up records appended since it was opened on refresh(), indexing only those
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        Args:
+            directory (Union[str, Path]): Directory holding the segment files.
+        Raises:
+            ContractViolationError: if a file is not a trace segment.
+        """
+        self._directory = Path(directory)
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+        self._paths: List[Path] = []
+        # Offset right after the last indexed record of each segment
+        self._ends: List[int] = []
+
+        self._timestamps = array("q")
+        self._segments = array("I")
+        self._offsets = array("q")
+        self._sorted = True
+
+        for path in list_segments(self._directory):
+            self._open_segment(path)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def get_trace(self) -> List[TraceEntry]:
+        """
+        Read every recorded step.
+        Returns:
+            A list of TraceEntry objects representing the execution trace.
+        """
+        return [self._entry_at(position) for position in range(len(self))]
+
+    def read_range(self, start: int, end: int) -> Iterator[TraceEntry]:
+        """
+        Lazily read the steps with start <= timestamp < end.
+        Args:
+            start (int): The first logical timestamp to include
+            end (int): The logical timestamp to stop before
+        Returns:
+            An iterator decoding matching entries on demand.
+        Raises:
+            ContractViolationError: if steps were not recorded in timestamp order.
+        """
+        if not self._sorted:
+            raise ContractViolationError(
+                "Trace was not recorded in timestamp order and cannot be sliced."
+            )
+
+        low = bisect_left(self._timestamps, start)
+        high = bisect_left(self._timestamps, end, lo=low)
+        return self._read_positions(low, high)
+
+    def iter_since(self, offset: int) -> Iterator[TraceEntry]:
+        """
+        Lazily read the steps from position `offset` on, including the steps
+        indexed by refresh() while iterating.
+        Args:
+            offset (int): The number of steps to skip
+        Returns:
+            An iterator decoding entries on demand.
+        Raises:
+            ValueError: if the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return self._read_since(offset)
+
+    def refresh(self) -> int:
+        """
+        Index the records appended to the trace directory since the reader was
+        opened or last refreshed, remapping the last segment if it grew.
+        Returns:
+            The number of newly indexed records.
+        Raises:
+            ContractViolationError: if a new file is not a trace segment.
+        """
+        before = len(self._timestamps)
+        last_known = -1
+        if self._paths:
+            last_known = segment_index(self._paths[-1])
+            self._remap_last_segment()
+
+        for path in list_segments(self._directory):
+            if segment_index(path) > last_known:
+                self._open_segment(path)
+        return len(self._timestamps) - before
+
+    def __iter__(self) -> Iterator[TraceEntry]:
+        for position in range(len(self)):
+            yield self._entry_at(position)
+
+    def location(self, position: int) -> Tuple[Path, int]:
+        """
+        Find where a record is stored. The position right after the last
+        record maps to the end of the last record.
+        Args:
+            position (int): The position of the record in the trace
+        Returns:
+            The segment file and the byte offset the record starts at.
+        Raises:
+            IndexError: if the position is past the end of the trace.
+        """
+        if position < len(self._offsets):
+            return self._paths[self._segments[position]], self._offsets[position]
+        if position > len(self._offsets) or not self._offsets:
+            raise IndexError(f"No record at position {position}.")
+
+        last = len(self._offsets) - 1
+        view = self._views[self._segments[last]]
+        offset = self._offsets[last]
+        _, producer_length, payload_length = RECORD_HEADER.unpack_from(view, offset)
+        end = offset + RECORD_HEADER.size + producer_length + payload_length
+        return self._paths[self._segments[last]], end
+
+    def close(self) -> None:
+        """
+        Unmap every segment and forget the indexed records, so that iterators
+        still reading from the reader stop. Safe to call more than once.
+        """
+        for view in self._views:
+            view.release()
+        for segment in self._maps:
+            segment.close()
+        self._views.clear()
+        self._maps.clear()
+        self._paths.clear()
+        self._ends.clear()
+        for column in (self._timestamps, self._segments, self._offsets):
+            del column[:]
+
+    def __enter__(self) -> "TraceSegmentReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _open_segment(self, path: Path) -> None:
+        """Map a segment file and index the records it contains."""
+        with open(path, "rb") as segment_file:
+            if path.stat().st_size == 0:
+                return
+            segment = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(segment)
+        if view[: len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            view.release()
+            segment.close()
+            raise ContractViolationError(f"{path} is not a trace segment.")
+
+        self._maps.append(segment)
+        self._views.append(view)
+        self._paths.append(path)
+        self._ends.append(len(SEGMENT_MAGIC))
+        self._index_records(len(self._maps) - 1)
+
+    def _remap_last_segment(self) -> None:
+        """Map the last segment again if records were appended to it."""
+        last = len(self._maps) - 1
+        path = self._paths[last]
+        if path.stat().st_size <= len(self._views[last]):
+            return
+
+        with open(path, "rb") as segment_file:
+            segment = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views[last].release()
+        self._maps[last].close()
+        self._maps[last] = segment
+        self._views[last] = memoryview(segment)
+        self._index_records(last)
+
+    def _index_records(self, segment_number: int) -> None:
+        """Index the complete records of a segment after its last indexed one."""
+        view = self._views[segment_number]
+        size = len(view)
+        offset = self._ends[segment_number]
+        while offset + RECORD_HEADER.size <= size:
+            timestamp, producer_length, payload_length = RECORD_HEADER.unpack_from(
+                view, offset
+            )
+            end = offset + RECORD_HEADER.size + producer_length + payload_length
+            if end > size:
+                break
+
+            if self._timestamps and timestamp < self._timestamps[-1]:
+                self._sorted = False
+
+            self._timestamps.append(timestamp)
+            self._segments.append(segment_number)
+            self._offsets.append(offset)
+            offset = end
+        self._ends[segment_number] = offset
+
+    def _read_since(self, offset: int) -> Iterator[TraceEntry]:
+        """Decode the entries from an offset on, including newly indexed ones."""
+        position = offset
+        while position < len(self._timestamps):
+            yield self._entry_at(position)
+            position += 1
+
+    def _read_positions(self, low: int, high: int) -> Iterator[TraceEntry]:
+        """Decode the entries at positions low to high, excluded, on demand."""
+        for position in range(low, high):
+            yield self._entry_at(position)
+
+    def _entry_at(self, position: int) -> TraceEntry:
+        """Decode the trace entry at a position of the index."""
+        producer_id, timestamp, event = decode_record(
+            self._views[self._segments[position]], self._offsets[position]
+        )
+        return TraceEntry(event=event, producer_id=producer_id, timestamp=timestamp)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import Any, Callable, ClassVar, Dict, List
 
 from src.core.contracts.event import Event
 from src.core.contracts.producer import Producer
@@ -74,6 +74,82 @@ class BaseProducer(Producer, ABC):
 
         return event
 
+    def step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Execute up to n consecutive steps of the producer, validating the lifecycle once.
+        Args:
+            start_timestamp (int): The logical clock time of the first step
+            n (int): The maximum number of steps to execute
+        Returns:
+            One entry per executed step, in timestamp order.
+            Shorter than n if the producer finishes early.
+        Raises:
+            InvalidLifecycleError:
+                - if step_many() is called before start()
+                - if step_many() is called after completion
+        """
+
+        if not self._started:
+            raise InvalidLifecycleError("Producer.step_many() called before start().")
+        if self._finished:
+            raise InvalidLifecycleError("Producer.step_many() called after completion.")
+        if n < 1:
+            raise ValueError("n must be at least 1.")
+
+        events = self._step_many(start_timestamp, n)
+
+        if self.is_finished():
+            self._finished = True
+
+        return events
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the lifecycle flags and the state returned by _get_state().
+        Returns:
+            A picklable snapshot of the producer.
+        """
+        return {
+            "started": self._started,
+            "finished": self._finished,
+            "state": self._get_state() if self._started else None,
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Resume the producer from a snapshot, in place of start().
+        A started snapshot runs _on_start() to rebuild derived state, then
+        hands the saved state to _set_state().
+        Args:
+            snapshot (Dict[str, Any]): A snapshot returned by snapshot()
+        Raises:
+            InvalidLifecycleError: if the producer has already been started
+        """
+        if self._started:
+            raise InvalidLifecycleError(
+                "Producer.restore() called on a started producer."
+            )
+
+        if not snapshot["started"]:
+            return
+
+        self._started = True
+        self._finished = False
+        self._on_start()
+        self._set_state(snapshot["state"])
+        self._finished = snapshot["finished"]
+
+    def bind_step(self) -> Callable[[int], Event]:
+        """
+        Get a callable equivalent to step() without the lifecycle validation.
+        Subclasses set `_finished` from _step(), so callers following the
+        bind_step() contract observe completion through is_finished().
+        Subclasses overriding step() keep it.
+        """
+        if type(self).step is not BaseProducer.step:
+            return self.step
+        return self._step
+
     def is_finished(self) -> bool:
         """
         Returns True if the producer is finished.
@@ -112,9 +188,37 @@ class BaseProducer(Producer, ABC):
         """
         pass
 
+    def _step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Internal bulk step method. Subclasses can override it with a tight loop,
+        by default it calls _step() until n steps ran or the producer finished.
+        Returns:
+            One entry per executed step, in timestamp order.
+        """
+        events = []
+        for timestamp in range(start_timestamp, start_timestamp + n):
+            events.append(self._step(timestamp))
+            if self.is_finished():
+                break
+        return events
+
     def _on_start(self) -> None:
         """
         Hook for subclasses to implement custom start logic.
-        Called once when start() is invoked.
+        Called once when start() is invoked, and when restoring a snapshot.
+        """
+        pass
+
+    def _get_state(self) -> Dict[str, Any]:
+        """
+        Hook for subclasses to capture the state their steps depend on.
+        Values must be picklable. By default there is no state to capture.
+        """
+        return {}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Hook for subclasses to reapply a state captured by _get_state().
+        Called after _on_start() when restoring a snapshot.
         """
         pass
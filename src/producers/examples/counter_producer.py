@@ -1,5 +1,9 @@
+from typing import Any, Dict, List
+
+from src.core.contracts.event import Event
 from src.core.contracts.read_only_clock import ReadOnlyClock
 from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.event_factory import compile_event_factory
 from src.producers.base.base_producer import BaseProducer
 
 
@@ -20,6 +24,13 @@ class CounterProducer(BaseProducer):
 
     def _on_start(self) -> None:
         self._index = 0
+        self._new_event = compile_event_factory(CounterNumber, self._producer_id)
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"index": self._index}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._index = state["index"]
 
     def _step(self, timestamp: int) -> CounterNumber:
         """
@@ -44,3 +55,29 @@ class CounterProducer(BaseProducer):
             self._finished = True
 
         return event
+
+    def _step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Execute up to n counting steps in a single call.
+        Args:
+            start_timestamp (int): The logical clock time of the first step
+            n (int): The maximum number of steps to execute
+        Returns:
+            The CounterNumber events for the executed steps
+        """
+
+        count = min(n, max(self._limit - self._index, 1))
+        first_value = self._index
+        new_event = self._new_event
+
+        events: List[Event] = [
+            new_event(start_timestamp + offset, first_value + offset)
+            for offset in range(count)
+        ]
+
+        self._index += count
+
+        if self._index >= self._limit:
+            self._finished = True
+
+        return events
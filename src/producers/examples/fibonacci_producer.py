@@ -1,5 +1,9 @@
+from typing import Any, Dict, List
+
+from src.core.contracts.event import Event
 from src.core.contracts.read_only_clock import ReadOnlyClock
 from src.core.events.counter.fibonacci_number import FibonacciNumber
+from src.core.events.event_factory import compile_event_factory
 from src.producers.base.base_producer import BaseProducer
 
 
@@ -21,6 +25,19 @@ class FibonacciProducer(BaseProducer):
         self.previous = 0
         self.current = 1
         self._index = 0
+        self._new_event = compile_event_factory(FibonacciNumber, self._producer_id)
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "previous": self.previous,
+            "current": self.current,
+            "index": self._index,
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.previous = state["previous"]
+        self.current = state["current"]
+        self._index = state["index"]
 
     def _step(self, timestamp: int) -> FibonacciNumber:
         """
@@ -47,3 +64,30 @@ class FibonacciProducer(BaseProducer):
             self._finished = True
 
         return event
+
+    def _step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Execute up to n Fibonacci steps in a single call.
+        Args:
+            start_timestamp (int): The logical clock time of the first step
+            n (int): The maximum number of steps to execute
+        Returns:
+            The FibonacciNumber events for the executed steps
+        """
+
+        count = min(n, max(self._limit - self._index, 1))
+        new_event = self._new_event
+        previous, current = self.previous, self.current
+
+        events: List[Event] = []
+        for timestamp in range(start_timestamp, start_timestamp + count):
+            events.append(new_event(timestamp, previous))
+            previous, current = current, previous + current
+
+        self.previous, self.current = previous, current
+        self._index += count
+
+        if self._index >= self._limit:
+            self._finished = True
+
+        return events
@@ -1,7 +1,10 @@
 import random
+from typing import Any, Dict, List
 
+from src.core.contracts.event import Event
 from src.core.contracts.read_only_clock import ReadOnlyClock
 from src.core.events.counter.random_number_generator import RandomNumber
+from src.core.events.event_factory import compile_event_factory
 from src.producers.base.base_producer import BaseProducer
 
 
@@ -23,6 +26,14 @@ class SeededRandomProducer(BaseProducer):
 
     def _on_start(self) -> None:
         self._index = 0
+        self._new_event = compile_event_factory(RandomNumber, self._producer_id)
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"index": self._index, "random": self._random.getstate()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._index = state["index"]
+        self._random.setstate(state["random"])
 
     def _step(self, timestamp: int) -> RandomNumber:
         """
@@ -48,3 +59,29 @@ class SeededRandomProducer(BaseProducer):
             self._finished = True
 
         return event
+
+    def _step_many(self, start_timestamp: int, n: int) -> List[Event]:
+        """
+        Execute up to n random number steps in a single call.
+        Args:
+            start_timestamp (int): The logical clock time of the first step
+            n (int): The maximum number of steps to execute
+        Returns:
+            The RandomNumber events for the executed steps
+        """
+
+        count = min(n, max(self._limit - self._index, 1))
+        new_event = self._new_event
+        next_random = self._random.random
+
+        events: List[Event] = [
+            new_event(timestamp, next_random())
+            for timestamp in range(start_timestamp, start_timestamp + count)
+        ]
+
+        self._index += count
+
+        if self._index >= self._limit:
+            self._finished = True
+
+        return events
@@ -0,0 +1,31 @@
+from typing import Iterable, List, Tuple
+
+from src.core.contracts.consumer import Consumer
+
+
+class _DispatchPlan:
+    """
+    Subscribed consumers grouped by how a transport has to invoke them.
+
+    - Consumers whose is_synchronous is True are called inline through
+      handle_event()/handle_events(), without creating a coroutine
+    - Every other consumer is awaited through on_event()/on_events()
+
+    Every synchronous consumer is called before any asynchronous one, so
+    consumers receive an event in that order rather than in subscription order.
+
+    The plan is immutable and rebuilt by the transport whenever a consumer
+    subscribes or unsubscribes, so dispatching an event never re-inspects consumers.
+    """
+
+    def __init__(self, consumers: Iterable[Consumer]) -> None:
+        sync_consumers: List[Consumer] = []
+        async_consumers: List[Consumer] = []
+        for consumer in consumers:
+            if consumer.is_synchronous:
+                sync_consumers.append(consumer)
+            else:
+                async_consumers.append(consumer)
+
+        self.sync_consumers: Tuple[Consumer, ...] = tuple(sync_consumers)
+        self.async_consumers: Tuple[Consumer, ...] = tuple(async_consumers)
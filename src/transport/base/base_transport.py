@@ -2,12 +2,13 @@ import asyncio
 import logging
 from abc import ABC
 from enum import Enum
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.core.contracts.consumer import Consumer
 from src.core.contracts.event import Event
 from src.core.contracts.transport import Transport
 from src.core.errors import InvalidEventError, InvalidLifecycleError
+from src.transport.base._dispatch_plan import _DispatchPlan
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class BaseTransport(Transport, ABC):
 
     def __init__(self) -> None:
         self._consumers: List[Consumer] = []
+        self._plan = _DispatchPlan(self._consumers)
         self._state = TransportState.INITIAL
 
     async def start(self) -> None:
@@ -52,12 +54,14 @@ class BaseTransport(Transport, ABC):
         if consumer in self._consumers:
             raise InvalidLifecycleError("Consumer is already subscribed.")
         self._consumers.append(consumer)
+        self._plan = _DispatchPlan(self._consumers)
 
     def unsubscribe(self, consumer: Consumer) -> None:
         try:
             self._consumers.remove(consumer)
         except ValueError:
             raise InvalidLifecycleError("Consumer is not subscribed.")
+        self._plan = _DispatchPlan(self._consumers)
 
     async def publish(self, event: Event) -> None:
         """
@@ -72,6 +76,20 @@ class BaseTransport(Transport, ABC):
         self._validate_transport_request(event)
         await self._dispatch_event(event)
 
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Dispatches a batch of events to all consumers in order.
+        Args:
+            events (Sequence[Event]): The events to be published
+        Raises:
+            InvalidEventError: if any event in the batch is invalid.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+
+        self._validate_transport_batch(events)
+        if events:
+            await self._dispatch_batch(events)
+
     def _validate_transport_request(self, event: Event) -> None:
         """Validate the event before publishing."""
         if self._state != TransportState.RUNNING:
@@ -81,23 +99,106 @@ class BaseTransport(Transport, ABC):
         if not self._consumers:
             raise InvalidLifecycleError("No consumers subscribed to receive events.")
 
+    def _validate_transport_batch(self, events: Sequence[Event]) -> None:
+        """Validate a batch of events before publishing, checking state only once."""
+        if self._state != TransportState.RUNNING:
+            raise InvalidLifecycleError("Transport is not running.")
+        if not self._consumers:
+            raise InvalidLifecycleError("No consumers subscribed to receive events.")
+        for event in events:
+            if not isinstance(event, Event):
+                raise InvalidEventError("Invalid event type.")
+
     async def _dispatch_event(self, event: Event) -> None:
-        """Internal method to dispatch an event to all consumers."""
+        """
+        Internal method to dispatch an event to all consumers.
+        Synchronous consumers are called inline, a single asynchronous consumer
+        is awaited directly and only several asynchronous consumers are gathered.
+        """
+        plan = self._plan
+
+        for sync_consumer in plan.sync_consumers:
+            try:
+                sync_consumer.handle_event(event)
+            except Exception as e:
+                self._log_unhandled_exception(sync_consumer, e, event=event)
+
+        async_consumers = plan.async_consumers
+        if not async_consumers:
+            return
+
+        if len(async_consumers) == 1:
+            consumer = async_consumers[0]
+            try:
+                await consumer.on_event(event)
+            except Exception as e:
+                self._log_unhandled_exception(consumer, e, event=event)
+            return
+
+        results = await asyncio.gather(
+            *(consumer.on_event(event) for consumer in async_consumers),
+            return_exceptions=True,
+        )
+
+        for consumer, result in zip(async_consumers, results):
+            if isinstance(result, Exception):
+                self._log_unhandled_exception(consumer, result, event=event)
+
+    async def _dispatch_batch(self, events: Sequence[Event]) -> None:
+        """
+        Internal method to dispatch a batch of events to all consumers.
+        Each consumer receives the batch in order, following the same
+        inline/direct/gathered strategy as _dispatch_event().
+        """
+        plan = self._plan
+
+        for sync_consumer in plan.sync_consumers:
+            try:
+                sync_consumer.handle_events(events)
+            except Exception as e:
+                self._log_unhandled_exception(sync_consumer, e, batch_size=len(events))
+
+        async_consumers = plan.async_consumers
+        if not async_consumers:
+            return
+
+        if len(async_consumers) == 1:
+            consumer = async_consumers[0]
+            try:
+                await consumer.on_events(events)
+            except Exception as e:
+                self._log_unhandled_exception(consumer, e, batch_size=len(events))
+            return
+
         results = await asyncio.gather(
-            *(consumer.on_event(event) for consumer in self._consumers),
+            *(consumer.on_events(events) for consumer in async_consumers),
             return_exceptions=True,
         )
 
-        for consumer, result in zip(self._consumers, results):
+        for consumer, result in zip(async_consumers, results):
             if isinstance(result, Exception):
-                logger.exception(
-                    "Consumer raised an unhandled exception. This is a bug",
-                    exc_info=result,
-                    extra={
-                        "consumer": consumer.__class__.__name__,
-                        "event_type": event.__class__.__name__,
-                    },
-                )
+                self._log_unhandled_exception(consumer, result, batch_size=len(events))
+
+    def _log_unhandled_exception(
+        self,
+        consumer: Consumer,
+        error: BaseException,
+        *,
+        event: Optional[Event] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """Log an exception that escaped a consumer's own error handling."""
+        extra: Dict[str, Any] = {"consumer": consumer.__class__.__name__}
+        if event is not None:
+            extra["event_type"] = event.__class__.__name__
+        if batch_size is not None:
+            extra["batch_size"] = batch_size
+
+        logger.exception(
+            "Consumer raised an unhandled exception. This is a bug",
+            exc_info=error,
+            extra=extra,
+        )
 
     @property
     def consumers(self) -> List[Consumer]:
@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+from types import TracebackType
+from typing import AsyncIterator, List, Optional, Type, Union
+
+from src.core.contracts.event import Event
+from src.core.trace.trace_segment_reader import TraceSegmentReader
+
+
+class FileLogReader:
+    """
+    Reads the events of a FileTransport log, from another process or after the fact.
+
+    - Starts at any offset of the log, counted in events from its first segment
+    - read() returns the events committed since the previous read, indexing
+      only the newly appended records
+    - tail() follows the log, polling it every `poll_interval` seconds once
+      every committed event has been read
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        offset: int = 0,
+        *,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Args:
+            directory (Union[str, Path]): Directory holding the segment files.
+            offset (int): Number of events to skip from the start of the log.
+            poll_interval (float): Seconds tail() sleeps between checks for new events.
+        """
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive.")
+
+        self._reader = TraceSegmentReader(directory)
+        self._offset = offset
+        self._poll_interval = poll_interval
+
+    @property
+    def offset(self) -> int:
+        """Offset of the next event to read."""
+        return self._offset
+
+    def read(self, max_events: Optional[int] = None) -> List[Event]:
+        """
+        Read the committed events from the current offset on and advance past them.
+        Args:
+            max_events (Optional[int]): Maximum number of events to return
+        Returns:
+            The events in log order, empty if no new event was committed.
+        """
+        reader = self._reader
+        reader.refresh()
+
+        events = []
+        for entry in reader.iter_since(self._offset):
+            events.append(entry.event)
+            if max_events is not None and len(events) >= max_events:
+                break
+        self._offset += len(events)
+        return events
+
+    async def tail(self, batch_size: int = 1024) -> AsyncIterator[Event]:
+        """
+        Follow the log, yielding events as they are committed.
+        Only ends when the caller stops iterating.
+        Args:
+            batch_size (int): Maximum number of events read between yields to the event loop
+        """
+        while True:
+            events = self.read(batch_size)
+            for event in events:
+                yield event
+            if len(events) < batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    def close(self) -> None:
+        """
+        Unmap the log segments. Safe to call more than once.
+        """
+        self._reader.close()
+
+    def __enter__(self) -> "FileLogReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
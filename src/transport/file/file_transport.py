@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Sequence, Union
+
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError, InvalidLifecycleError
+from src.core.trace._segment_format import (
+    SEGMENT_MAGIC,
+    encode_record,
+    list_segments,
+    segment_index,
+    segment_path,
+)
+from src.core.trace.trace_segment_reader import TraceSegmentReader
+from src.transport.base.base_transport import BaseTransport, TransportState
+
+logger = logging.getLogger(__name__)
+
+
+class FileTransport(BaseTransport):
+    """
+    Transport appending every published event to a segmented, append-only log on disk.
+    - Events are encoded in the trace segment format and buffered by publish();
+      a commit task writes the buffer to the current segment and fsyncs it in a
+      worker thread every `fsync_every` events or `fsync_interval` seconds,
+      whichever comes first, so one sync covers every event published meanwhile.
+    - Subscribed consumers receive each batch once it is durable, in publish order.
+      A separate delivery task hands committed batches to them, so slow consumers
+      never delay the next commit. Consumers are optional: the log itself can be
+      read by offline consumers through FileLogReader, from any offset.
+    - Segments rotate once they exceed `segment_size` bytes. Opening an existing
+      log directory appends new segments after the existing ones.
+    - At most `capacity` events wait for a commit; beyond that publish() waits
+      for the commit in progress.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        fsync_every: int = 1024,
+        fsync_interval: float = 0.05,
+        segment_size: int = 64 * 1024 * 1024,
+        capacity: int = 65536,
+    ) -> None:
+        """
+        Args:
+            directory (Union[str, Path]): Directory holding the segment files.
+            fsync_every (int): Number of pending events that triggers a commit.
+            fsync_interval (float): Maximum time in seconds an event waits for a commit.
+            segment_size (int): Size in bytes after which a new segment is started.
+            capacity (int): Maximum number of events waiting for a commit.
+        """
+        super().__init__()
+
+        if fsync_every < 1:
+            raise ValueError("fsync_every must be at least 1.")
+        if fsync_interval <= 0:
+            raise ValueError("fsync_interval must be positive.")
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1.")
+        if capacity < fsync_every:
+            raise ValueError("capacity must be at least fsync_every.")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._segment_size = segment_size
+        self._capacity = capacity
+
+        existing = list_segments(self._directory)
+        self._next_segment = segment_index(existing[-1]) + 1 if existing else 0
+        self._file: Optional[BinaryIO] = None
+        self._file_size = 0
+
+        self._buffer = bytearray()
+        self._pending: List[Event] = []
+        self._commit_requested = asyncio.Event()
+        self._committed = asyncio.Event()
+        self._commit_task: Optional[asyncio.Task] = None
+        self._commit_error: Optional[BaseException] = None
+        self._stopping = False
+        # Committed batches waiting to be handed to the consumers
+        self._deliveries: asyncio.Queue[List[Event]] = asyncio.Queue()
+        self._delivery_task: Optional[asyncio.Task] = None
+
+        self._base_offset = 0
+        if existing:
+            with TraceSegmentReader(self._directory) as reader:
+                self._base_offset = len(reader)
+        self._published_events = 0
+        self._committed_events = 0
+        self._delivered_events = 0
+        self._syncs = 0
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the segment files."""
+        return self._directory
+
+    @property
+    def published_events(self) -> int:
+        """Number of events accepted by publish() and publish_many()."""
+        return self._published_events
+
+    @property
+    def committed_events(self) -> int:
+        """Number of published events written and synced to disk."""
+        return self._committed_events
+
+    @property
+    def delivered_events(self) -> int:
+        """Number of committed events handed to the subscribed consumers."""
+        return self._delivered_events
+
+    @property
+    def pending_events(self) -> int:
+        """Number of published events waiting for a commit."""
+        return self._published_events - self._committed_events
+
+    @property
+    def syncs(self) -> int:
+        """Number of fsyncs issued, each covering a whole group of events."""
+        return self._syncs
+
+    @property
+    def end_offset(self) -> int:
+        """Offset of the next event appended to the log, counting existing segments."""
+        return self._base_offset + self._published_events
+
+    async def start(self) -> None:
+        """
+        Start the tasks committing buffered events to disk and delivering
+        committed events to the consumers.
+        """
+        await super().start()
+        self._commit_task = asyncio.create_task(
+            self._commit_loop(), name="FileTransportCommitter"
+        )
+        self._delivery_task = asyncio.create_task(
+            self._delivery_loop(), name="FileTransportDelivery"
+        )
+
+    async def publish(self, event: Event) -> None:
+        """
+        Appends an event to the log buffer. Returns before the event is synced,
+        unless `capacity` events are already waiting for a commit.
+        Args:
+            event (Event): The event to be published
+        Raises:
+            InvalidEventError: if the event is invalid.
+            InvalidLifecycleError: if the transport is not running.
+            OSError: if an earlier commit failed.
+        """
+        await self.publish_many((event,))
+
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Appends a batch of events to the log buffer, in order.
+        Args:
+            events (Sequence[Event]): The events to be published
+        Raises:
+            InvalidEventError: if any event in the batch is invalid.
+            InvalidLifecycleError: if the transport is not running.
+            OSError: if an earlier commit failed.
+        """
+        self._validate_log_batch(events)
+
+        buffer = self._buffer
+        for event in events:
+            buffer += encode_record(event.producer_id, event.timestamp, event)
+        self._pending.extend(events)
+        self._published_events += len(events)
+
+        if len(self._pending) >= self._fsync_every:
+            self._commit_requested.set()
+        while len(self._pending) >= self._capacity and self._commit_error is None:
+            self._committed.clear()
+            await self._committed.wait()
+
+    async def flush(self) -> None:
+        """
+        Wait until every published event is synced and delivered to the consumers.
+        Raises:
+            OSError: if a commit failed.
+        """
+        while self._committed_events < self._published_events:
+            self._raise_commit_error()
+            self._committed.clear()
+            self._commit_requested.set()
+            await self._committed.wait()
+        self._raise_commit_error()
+        await self._deliveries.join()
+
+    async def shutdown(self) -> None:
+        """
+        Commit and deliver the pending events, stop the commit and delivery
+        tasks and close the current segment.
+        Raises:
+            OSError: if a commit failed.
+        """
+        await super().shutdown()
+        try:
+            await self.flush()
+        finally:
+            self._stopping = True
+            self._commit_requested.set()
+            if self._commit_task is not None:
+                await asyncio.gather(self._commit_task, return_exceptions=True)
+                self._commit_task = None
+            if self._delivery_task is not None:
+                await self._deliveries.join()
+                self._delivery_task.cancel()
+                await asyncio.gather(self._delivery_task, return_exceptions=True)
+                self._delivery_task = None
+            await asyncio.to_thread(self._close_segment)
+            self._state = TransportState.FINISHED
+
+    def _validate_log_batch(self, events: Sequence[Event]) -> None:
+        """
+        Validate a batch before appending it. Unlike other transports, publishing
+        without subscribed consumers is allowed, since the log keeps the events.
+        """
+        if self._state != TransportState.RUNNING:
+            raise InvalidLifecycleError("Transport is not running.")
+        self._raise_commit_error()
+        for event in events:
+            if not isinstance(event, Event):
+                raise InvalidEventError("Invalid event type.")
+
+    def _raise_commit_error(self) -> None:
+        if self._commit_error is not None:
+            raise self._commit_error
+
+    async def _commit_loop(self) -> None:
+        """
+        Commit the buffered events whenever enough are pending, the interval
+        elapses or a flush is requested. Events published while a commit is in
+        progress are buffered for the next one.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._commit_requested.wait(), self._fsync_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._commit_requested.clear()
+
+            if self._pending:
+                data, self._buffer = self._buffer, bytearray()
+                batch, self._pending = self._pending, []
+                try:
+                    await asyncio.to_thread(self._write_and_sync, data)
+                except Exception as e:
+                    logger.exception("FileTransport failed to commit events")
+                    self._commit_error = e
+                    self._committed.set()
+                    return
+
+                self._syncs += 1
+                self._committed_events += len(batch)
+                if self._consumers:
+                    self._deliveries.put_nowait(batch)
+                self._committed.set()
+
+            if self._stopping and not self._pending:
+                return
+
+    async def _delivery_loop(self) -> None:
+        """
+        Hand the committed batches to the subscribed consumers, in commit order.
+        Batches committed while consumers are busy queue up here instead of
+        holding back the commit loop.
+        """
+        while True:
+            batch = await self._deliveries.get()
+            try:
+                if len(batch) == 1:
+                    await self._dispatch_event(batch[0])
+                else:
+                    await self._dispatch_batch(batch)
+            except Exception as e:
+                logger.error(
+                    f"Error occurred while dispatching events: {e}",
+                    extra={"batch_size": len(batch)},
+                )
+            finally:
+                self._delivered_events += len(batch)
+                self._deliveries.task_done()
+
+    def _write_and_sync(self, data: bytearray) -> None:
+        """Append encoded records to the current segment and fsync it. Runs in a thread."""
+        segment = self._file
+        if segment is None or self._file_size >= self._segment_size:
+            segment = self._open_next_segment()
+
+        segment.write(data)
+        segment.flush()
+        os.fsync(segment.fileno())
+        self._file_size += len(data)
+
+    def _open_next_segment(self) -> BinaryIO:
+        """Close the current segment and start a new one, syncing the directory entry."""
+        self._close_segment()
+
+        segment = open(segment_path(self._directory, self._next_segment), "wb")
+        segment.write(SEGMENT_MAGIC)
+        self._file = segment
+        self._file_size = len(SEGMENT_MAGIC)
+        self._next_segment += 1
+
+        if hasattr(os, "O_DIRECTORY"):
+            directory_fd = os.open(self._directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+        return segment
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,45 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+from src.core.contracts.event import Event
+from src.transport.sentinel_stop_signal import SentinelStopSignal
+
+
+class _CoalescingQueue(asyncio.Queue):
+    """
+    asyncio.Queue that can replace a producer's latest queued event in place.
+
+    Items are stored in single-element slots so that a queued event can be
+    swapped without searching the queue. Coalescing keeps the slot's position,
+    so each producer's events are still delivered in publication order.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: Deque[List[Any]] = deque()
+        self._latest: Dict[str, List[Any]] = {}
+
+    def _put(self, item: Event) -> None:
+        slot = [item]
+        self._queue.append(slot)
+        if not isinstance(item, SentinelStopSignal):
+            self._latest[item.producer_id] = slot
+
+    def _get(self) -> Event:
+        slot = self._queue.popleft()
+        item = slot[0]
+        if self._latest.get(item.producer_id) is slot:
+            del self._latest[item.producer_id]
+        return item
+
+    def coalesce(self, event: Event) -> bool:
+        """
+        Replace the latest queued event of the event's producer.
+        Returns:
+            True if an event was replaced, False if none is queued.
+        """
+        slot = self._latest.get(event.producer_id)
+        if slot is None:
+            return False
+        slot[0] = event
+        return True
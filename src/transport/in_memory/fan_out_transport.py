@@ -0,0 +1,193 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from src.core.contracts.consumer import Consumer
+from src.core.contracts.event import Event
+from src.core.errors import InvalidLifecycleError
+from src.transport.base.base_transport import BaseTransport, TransportState
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from src.transport.in_memory.overflow_policy import OverflowPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class ConsumerLaneStats:
+    """
+    Snapshot of one consumer's lane in a FanOutTransport.
+    - lag: published events the consumer has not received yet
+    - throughput: delivered events per second since the transport started
+    """
+
+    consumer: Consumer
+    published_events: int
+    delivered_events: int
+    dropped_events: int
+    coalesced_events: int
+    lag: int
+    throughput: float
+
+
+class FanOutTransport(BaseTransport):
+    """
+    In-memory transport that gives every subscribed consumer its own lane.
+    - Each lane is an InMemoryTransport with a single consumer and its own queue,
+      workers, capacity, batch size and overflow policy.
+    - Publishing enqueues the event on every lane, so a slow consumer only fills
+      its own queue. Lanes default to OverflowPolicy.DROP_OLDEST: once a lane
+      is full it loses its oldest events, and publishing never waits on it, so
+      the throughput of fast consumers does not depend on the slowest one.
+    - Lanes subscribed with OverflowPolicy.BLOCK are lossless and push back on
+      the publisher when full. Every event is enqueued on the non-blocking
+      lanes before the publisher waits on a blocking one.
+    - Consumers can only be subscribed and unsubscribed before the transport starts.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lanes: Dict[Consumer, InMemoryTransport] = {}
+        # Lanes in publishing order: non-blocking lanes first
+        self._publish_order: List[InMemoryTransport] = []
+        self._started_at: Optional[float] = None
+
+    def subscribe(
+        self,
+        consumer: Consumer,
+        *,
+        capacity: int = 10000,
+        batch_size: int = 256,
+        number_of_workers: int = 1,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        sample_every: int = 10,
+    ) -> None:
+        """
+        Subscribe a consumer on a lane of its own.
+        Args:
+            consumer (Consumer): The consumer to subscribe
+            capacity (int): Maximum number of events queued for this consumer.
+            batch_size (int): Maximum number of events dispatched per wakeup.
+            number_of_workers (int): Number of worker tasks draining the lane.
+            overflow_policy (OverflowPolicy): What to do when the lane is full,
+                BLOCK makes the publisher wait for this consumer.
+            sample_every (int): Sampling rate used by OverflowPolicy.SAMPLE.
+        Raises:
+            InvalidLifecycleError: if the transport has started or the consumer
+            is already subscribed.
+        """
+        if self._state != TransportState.INITIAL:
+            raise InvalidLifecycleError(
+                "Consumers can only be subscribed before the transport starts."
+            )
+
+        lane = InMemoryTransport(
+            number_of_workers=number_of_workers,
+            batch_size=batch_size,
+            capacity=capacity,
+            overflow_policy=overflow_policy,
+            sample_every=sample_every,
+        )
+        super().subscribe(consumer)
+        lane.subscribe(consumer)
+        self._lanes[consumer] = lane
+
+    def unsubscribe(self, consumer: Consumer) -> None:
+        """
+        Remove a consumer and its lane.
+        Raises:
+            InvalidLifecycleError: if the transport has started or the consumer
+            is not subscribed.
+        """
+        if self._state != TransportState.INITIAL:
+            raise InvalidLifecycleError(
+                "Consumers can only be unsubscribed before the transport starts."
+            )
+
+        super().unsubscribe(consumer)
+        del self._lanes[consumer]
+
+    async def start(self) -> None:
+        """
+        Start the workers of every lane.
+        """
+        await super().start()
+        for lane in self._lanes.values():
+            await lane.start()
+        self._publish_order = sorted(
+            self._lanes.values(),
+            key=lambda lane: lane.overflow_policy is OverflowPolicy.BLOCK,
+        )
+        self._started_at = time.monotonic()
+
+    async def publish(self, event: Event) -> None:
+        """
+        Enqueue an event on every consumer's lane.
+        Args:
+            event (Event): The event to be published
+        Raises:
+            InvalidEventError: if the event is invalid.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+        self._validate_transport_request(event)
+        for lane in self._publish_order:
+            await lane.publish(event)
+
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Enqueue a batch of events on every consumer's lane, in order.
+        Args:
+            events (Sequence[Event]): The events to be published
+        Raises:
+            InvalidEventError: if any event in the batch is invalid.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+        self._validate_transport_batch(events)
+        if not events:
+            return
+        for lane in self._publish_order:
+            await lane.publish_many(events)
+
+    async def flush(self) -> None:
+        """
+        Wait until every lane has delivered its queued events.
+        """
+        await asyncio.gather(*(lane.flush() for lane in self._lanes.values()))
+
+    async def shutdown(self) -> None:
+        """
+        Drain and stop every lane.
+        """
+        await super().shutdown()
+        await asyncio.gather(*(lane.shutdown() for lane in self._lanes.values()))
+        self._state = TransportState.FINISHED
+
+    def lane_stats(self, consumer: Consumer) -> ConsumerLaneStats:
+        """
+        Get the delivery statistics of a consumer's lane.
+        Raises:
+            InvalidLifecycleError: if the consumer is not subscribed.
+        """
+        lane = self._lanes.get(consumer)
+        if lane is None:
+            raise InvalidLifecycleError("Consumer is not subscribed.")
+
+        throughput = 0.0
+        if self._started_at is not None:
+            elapsed = time.monotonic() - self._started_at
+            if elapsed > 0:
+                throughput = lane.delivered_events / elapsed
+
+        return ConsumerLaneStats(
+            consumer=consumer,
+            published_events=lane.published_events,
+            delivered_events=lane.delivered_events,
+            dropped_events=lane.dropped_events,
+            coalesced_events=lane.coalesced_events,
+            lag=lane.lag,
+            throughput=throughput,
+        )
+
+    def stats(self) -> List[ConsumerLaneStats]:
+        """
+        Get the delivery statistics of every lane, in subscription order.
+        """
+        return [self.lane_stats(consumer) for consumer in self._consumers]
@@ -1,9 +1,11 @@
 import asyncio
 import logging
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
 from src.core.contracts.event import Event
 from src.transport.base.base_transport import BaseTransport, TransportState
+from src.transport.in_memory._coalescing_queue import _CoalescingQueue
+from src.transport.in_memory.overflow_policy import OverflowPolicy
 from src.transport.sentinel_stop_signal import SentinelStopSignal
 
 _STOP = SentinelStopSignal()
@@ -14,14 +16,105 @@ class InMemoryTransport(BaseTransport):
     """
     In-memory transport mechanism for moving events from producers to consumers asynchronously.
     - Delivers events to subscribed consumers using an internal asyncio queue and worker tasks.
+    - Workers drain up to `batch_size` queued events per wakeup and dispatch them as one batch.
+      Events within a batch keep their queue order, so with a single worker every producer's
+      events reach consumers in the order they were published.
+    - The queue holds at most `capacity` events; what happens to events published while
+      it is full is decided by the overflow policy (see OverflowPolicy).
     """
 
-    def __init__(self, number_of_workers: int = 1) -> None:
+    def __init__(
+        self,
+        number_of_workers: int = 1,
+        batch_size: int = 256,
+        capacity: int = 10000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_every: int = 10,
+    ) -> None:
+        """
+        Args:
+            number_of_workers (int): Number of worker tasks draining the queue.
+            batch_size (int): Maximum number of events a worker dispatches per wakeup.
+            capacity (int): Maximum number of queued events.
+            overflow_policy (OverflowPolicy): What to do with events published while the queue is full.
+            sample_every (int): With OverflowPolicy.SAMPLE, keep one of every `sample_every`
+                overflowing events.
+        """
         super().__init__()
 
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1.")
+
         self._number_of_workers = number_of_workers
-        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=10000)
+        self._batch_size = batch_size
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+        self._sample_every = sample_every
+        self._queue: asyncio.Queue[Event]
+        self._coalescing_queue: Optional[_CoalescingQueue] = None
+        if overflow_policy is OverflowPolicy.COALESCE_BY_PRODUCER:
+            self._coalescing_queue = _CoalescingQueue(maxsize=capacity)
+            self._queue = self._coalescing_queue
+        else:
+            self._queue = asyncio.Queue(maxsize=capacity)
         self._tasks: List[asyncio.Task] = []
+        self._published_events = 0
+        self._delivered_events = 0
+        self._overflowed_events = 0
+        self._dropped_events = 0
+        self._coalesced_events = 0
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """The policy applied to events published while the queue is full."""
+        return self._overflow_policy
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of queued events."""
+        return self._capacity
+
+    @property
+    def pending_events(self) -> int:
+        """Number of events currently waiting in the queue."""
+        return self._queue.qsize()
+
+    @property
+    def published_events(self) -> int:
+        """Number of events accepted by publish() and publish_many()."""
+        return self._published_events
+
+    @property
+    def delivered_events(self) -> int:
+        """Number of events handed to the consumers by the workers."""
+        return self._delivered_events
+
+    @property
+    def lag(self) -> int:
+        """
+        Number of published events not yet delivered, including the batches
+        workers are dispatching, and excluding dropped and coalesced events.
+        """
+        return (
+            self._published_events
+            - self._delivered_events
+            - self._dropped_events
+            - self._coalesced_events
+        )
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of events discarded by the overflow policy."""
+        return self._dropped_events
+
+    @property
+    def coalesced_events(self) -> int:
+        """Number of queued events replaced by a newer event of the same producer."""
+        return self._coalesced_events
 
     async def start(self) -> None:
         """
@@ -39,9 +132,25 @@ class InMemoryTransport(BaseTransport):
         Worker task loop to process events from the queue and publish them to consumers.
         """
         while True:
-            event: Event = await self._queue.get()
+            batch, stop = await self._drain_batch()
 
-            if event is _STOP:
+            if batch:
+                try:
+                    if len(batch) == 1:
+                        await self._dispatch_event(batch[0])
+                    else:
+                        await self._dispatch_batch(batch)
+                except Exception as e:
+                    logger.error(
+                        f"Error occurred while dispatching events: {e}",
+                        extra={"worker_id": worker_id, "batch_size": len(batch)},
+                    )
+                finally:
+                    self._delivered_events += len(batch)
+                    for _ in batch:
+                        self._queue.task_done()
+
+            if stop:
                 self._queue.task_done()
                 logger.debug(
                     "Worker received stop signal, exiting.",
@@ -49,15 +158,25 @@ class InMemoryTransport(BaseTransport):
                 )
                 return
 
-            try:
-                await self._dispatch_event(event)
-            except Exception as e:
-                logger.error(
-                    f"Error occurred while dispatching event: {e}",
-                    extra={"worker_id": worker_id, "event": event},
-                )
-            finally:
-                self._queue.task_done()
+    async def _drain_batch(self) -> Tuple[List[Event], bool]:
+        """
+        Wait for at least one event, then take whatever else is already queued
+        up to the batch size without yielding to the event loop again.
+        Returns:
+            The drained events in queue order, and whether a stop signal was taken.
+        """
+        event: Event = await self._queue.get()
+        if event is _STOP:
+            return [], True
+
+        batch = [event]
+        while len(batch) < self._batch_size and not self._queue.empty():
+            event = self._queue.get_nowait()
+            if event is _STOP:
+                return batch, True
+            batch.append(event)
+
+        return batch, False
 
     async def publish(self, event: Event) -> None:
         """
@@ -70,7 +189,72 @@ class InMemoryTransport(BaseTransport):
         """
 
         self._validate_transport_request(event)
-        await self._queue.put(event)
+        self._published_events += 1
+        queue = self._queue
+        if queue.full():
+            await self._overflow(event)
+        else:
+            queue.put_nowait(event)
+
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Adds a batch of events to the internal queue, validating the transport state once.
+        Events are enqueued in order; the overflow policy applies to each event that
+        finds the queue full.
+        Args:
+            events (Sequence[Event]): The events to be published
+        Raises:
+            InvalidEventError: if any event in the batch is invalid.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+
+        self._validate_transport_batch(events)
+        self._published_events += len(events)
+        queue = self._queue
+        for event in events:
+            if queue.full():
+                await self._overflow(event)
+            else:
+                queue.put_nowait(event)
+
+    async def _overflow(self, event: Event) -> None:
+        """
+        Apply the overflow policy to an event published while the queue is full.
+        """
+        policy = self._overflow_policy
+        queue = self._queue
+
+        if policy is OverflowPolicy.BLOCK:
+            await queue.put(event)
+            return
+
+        self._overflowed_events += 1
+        if policy is OverflowPolicy.DROP_NEWEST:
+            self._dropped_events += 1
+        elif policy is OverflowPolicy.COALESCE_BY_PRODUCER:
+            coalescing_queue = self._coalescing_queue
+            if coalescing_queue is not None and coalescing_queue.coalesce(event):
+                self._coalesced_events += 1
+            else:
+                self._dropped_events += 1
+        elif (
+            policy is OverflowPolicy.SAMPLE
+            and self._overflowed_events % self._sample_every != 0
+        ):
+            self._dropped_events += 1
+        else:
+            # DROP_OLDEST, or the sampled event of SAMPLE: make room at the head.
+            self._discard_oldest()
+            queue.put_nowait(event)
+
+    def _discard_oldest(self) -> None:
+        """
+        Remove the oldest queued event. The queue is full, so it cannot be empty,
+        and a stop signal is never queued while publishing is allowed.
+        """
+        self._queue.get_nowait()
+        self._queue.task_done()
+        self._dropped_events += 1
 
     async def flush(self) -> None:
         """
@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """
+    What InMemoryTransport does with a published event when its queue is full.
+
+    - BLOCK: wait until a worker frees a slot (lossless, the default)
+    - DROP_OLDEST: discard the oldest queued event to make room
+    - DROP_NEWEST: discard the published event
+    - SAMPLE: keep one of every `sample_every` overflowing events, discarding
+      the oldest queued event to make room, and drop the rest
+    - COALESCE_BY_PRODUCER: replace the producer's latest queued event with the
+      published one, or drop the published event if none is queued
+    """
+
+    BLOCK = 0
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    SAMPLE = 3
+    COALESCE_BY_PRODUCER = 4
@@ -0,0 +1,151 @@
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Sequence, Tuple
+
+from src.core.codec.event_codec_registry import default_event_codecs
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError
+
+# Layout of the shared memory block:
+#   header:  write index (int64), closed flag (int64), padded to a cache line
+#   cursors: one read index (int64) per reader, each on its own cache line so
+#            readers in different processes do not invalidate each other's lines
+#   slots:   `slots` fixed-size slots holding the encoded length (uint32)
+#            followed by one codec-encoded event
+#
+# Indexes grow without wrapping; slot i lives at i % slots. The writer only
+# publishes the write index after the slots are filled, and only reuses a slot
+# once every reader's index has moved past it.
+_CACHE_LINE = 64
+_INDEX = struct.Struct("<q")
+_LENGTH = struct.Struct("<I")
+_WRITE_INDEX_OFFSET = 0
+_CLOSED_OFFSET = 8
+
+
+class _RingBuffer:
+    """
+    Single-writer, multi-reader ring of encoded events in shared memory.
+    Every reader sees every event, each through its own read index.
+    """
+
+    def __init__(
+        self,
+        memory: SharedMemory,
+        slots: int,
+        slot_size: int,
+        readers: int,
+    ) -> None:
+        self._memory = memory
+        self._buffer: Any = memory.buf
+        self._slots = slots
+        self._slot_size = slot_size
+        self._readers = readers
+        self._cursors_offset = _CACHE_LINE
+        self._slots_offset = _CACHE_LINE * (1 + readers)
+
+    @classmethod
+    def create(cls, slots: int, slot_size: int, readers: int) -> "_RingBuffer":
+        """Allocate a zeroed ring buffer in a new shared memory block."""
+        size = _CACHE_LINE * (1 + readers) + slots * slot_size
+        return cls(SharedMemory(create=True, size=size), slots, slot_size, readers)
+
+    @classmethod
+    def attach(
+        cls, name: str, slots: int, slot_size: int, readers: int
+    ) -> "_RingBuffer":
+        """Map an existing ring buffer, typically from a reader process."""
+        return cls(SharedMemory(name=name), slots, slot_size, readers)
+
+    @property
+    def layout(self) -> Tuple[str, int, int, int]:
+        """Arguments for attach() mapping this ring buffer from another process."""
+        return self._memory.name, self._slots, self._slot_size, self._readers
+
+    @property
+    def write_index(self) -> int:
+        return _INDEX.unpack_from(self._buffer, _WRITE_INDEX_OFFSET)[0]
+
+    def read_index(self, reader: int) -> int:
+        return _INDEX.unpack_from(self._buffer, self._cursor(reader))[0]
+
+    def set_read_index(self, reader: int, index: int) -> None:
+        _INDEX.pack_into(self._buffer, self._cursor(reader), index)
+
+    @property
+    def closed(self) -> bool:
+        return _INDEX.unpack_from(self._buffer, _CLOSED_OFFSET)[0] != 0
+
+    def close_writer(self) -> None:
+        """Tell readers that no event will be written after the current ones."""
+        _INDEX.pack_into(self._buffer, _CLOSED_OFFSET, 1)
+
+    def free_slots(self, readers: Sequence[int]) -> int:
+        """Number of slots the writer can fill without overtaking the given readers."""
+        if not readers:
+            return self._slots
+        oldest = min(self.read_index(reader) for reader in readers)
+        return self._slots - (self.write_index - oldest)
+
+    def encode(self, event: Event) -> bytes:
+        """
+        Encode an event for a slot.
+        Raises:
+            InvalidEventError: if the event type has no registered codec or the
+            encoded event does not fit in a slot.
+        """
+        encoded = default_event_codecs.encode(event)
+        if _LENGTH.size + len(encoded) > self._slot_size:
+            raise InvalidEventError(
+                f"{type(event).__name__} needs {_LENGTH.size + len(encoded)} bytes, "
+                f"more than the {self._slot_size} bytes of a slot."
+            )
+        return encoded
+
+    def write(self, encoded: Sequence[bytes]) -> None:
+        """
+        Fill the next slots and publish them with a single write index update.
+        The caller checks free_slots() first.
+        """
+        buffer = self._buffer
+        index = self.write_index
+        for payload in encoded:
+            offset = self._slot_offset(index)
+            _LENGTH.pack_into(buffer, offset, len(payload))
+            start = offset + _LENGTH.size
+            buffer[start : start + len(payload)] = payload
+            index += 1
+        _INDEX.pack_into(buffer, _WRITE_INDEX_OFFSET, index)
+
+    def read(self, reader: int, max_events: int) -> Tuple[List[Event], int]:
+        """
+        Decode the events published since a reader's index, straight from the
+        shared slots, without advancing it.
+        Returns:
+            The events, and the index to store with set_read_index() once they are handled.
+        """
+        buffer = self._buffer
+        index = self.read_index(reader)
+        end = min(self.write_index, index + max_events)
+        decode = default_event_codecs.decode
+
+        events = []
+        while index < end:
+            offset = self._slot_offset(index) + _LENGTH.size
+            event, _ = decode(buffer, offset)
+            events.append(event)
+            index += 1
+        return events, index
+
+    def close(self, unlink: bool = False) -> None:
+        """Unmap the block, and free it when called by its owner."""
+        self._buffer = None
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+    def _cursor(self, reader: int) -> int:
+        return self._cursors_offset + reader * _CACHE_LINE
+
+    def _slot_offset(self, index: int) -> int:
+        return self._slots_offset + (index % self._slots) * self._slot_size
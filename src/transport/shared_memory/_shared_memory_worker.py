@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Tuple
+
+from src.core.contracts.consumer import Consumer
+from src.transport.shared_memory._ring_buffer import _RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Empty polls answered by yielding to the consumer's event loop before sleeping
+SPINS_BEFORE_SLEEP = 64
+# Seconds an idle poll sleeps, bounding the delivery latency of an idle reader
+IDLE_SLEEP = 0.0002
+
+
+def consume_ring(
+    layout: Tuple[str, int, int, int],
+    reader: int,
+    consumer: Consumer,
+    batch_size: int,
+) -> None:
+    """Entry point of a SharedMemoryTransport consumer process."""
+    asyncio.run(_consume(_RingBuffer.attach(*layout), reader, consumer, batch_size))
+
+
+async def _consume(
+    ring: _RingBuffer, reader: int, consumer: Consumer, batch_size: int
+) -> None:
+    """
+    Deliver the events of a ring buffer to a consumer in batches of up to
+    `batch_size`, until the writer is closed and every event has been read.
+    """
+    try:
+        idle = 0
+        while True:
+            # Read the flag first: events written before closing are still drained
+            closed = ring.closed
+            events, index = ring.read(reader, batch_size)
+
+            if events:
+                try:
+                    await consumer.on_events(events)
+                except Exception:
+                    logger.exception(
+                        "Consumer raised an unhandled exception. This is a bug",
+                        extra={
+                            "consumer": consumer.__class__.__name__,
+                            "batch_size": len(events),
+                        },
+                    )
+                ring.set_read_index(reader, index)
+                idle = 0
+                continue
+
+            if closed:
+                return
+            idle += 1
+            await asyncio.sleep(0 if idle < SPINS_BEFORE_SLEEP else IDLE_SLEEP)
+    finally:
+        ring.close()
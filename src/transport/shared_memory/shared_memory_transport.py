@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.process import BaseProcess
+from typing import Any, List, Optional, Sequence
+
+from src.core.contracts.consumer import Consumer
+from src.core.contracts.event import Event
+from src.core.errors import InvalidLifecycleError
+from src.transport.base.base_transport import BaseTransport, TransportState
+from src.transport.shared_memory._ring_buffer import _RingBuffer
+from src.transport.shared_memory._shared_memory_worker import (
+    IDLE_SLEEP,
+    consume_ring,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMemoryTransport(BaseTransport):
+    """
+    Transport delivering events to consumers running in separate processes
+    through a ring buffer in shared memory.
+    - Every subscribed consumer runs in its own process, started by start(), and
+      receives every published event in publish order, in batches of up to `batch_size`.
+    - Events are encoded with the default event codecs into fixed-size slots and
+      decoded by the consumer processes straight from shared memory: there is
+      no pickling, pipe or socket on the delivery path.
+    - The ring holds `slots` events. When the slowest consumer is that far behind,
+      publish() waits for it to catch up.
+
+    Consumers are pickled into their process with the "spawn" start method, and
+    their state lives in that process. Event types must be registered on
+    default_event_codecs at import time, and encode to at most `slot_size` - 4 bytes.
+    Subscriptions can only change before start().
+    """
+
+    def __init__(
+        self,
+        slots: int = 65536,
+        slot_size: int = 256,
+        batch_size: int = 256,
+        start_method: Optional[str] = None,
+        stop_timeout: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            slots (int): Number of events the ring buffer holds.
+            slot_size (int): Size in bytes of a slot, the encoded length included.
+            batch_size (int): Maximum number of events a consumer process handles per wakeup.
+            start_method (Optional[str]): multiprocessing start method, defaults to the platform's.
+            stop_timeout (float): Seconds shutdown() waits for the consumers to drain
+                the ring buffer, then for each process to exit, before terminating it.
+        """
+        super().__init__()
+
+        if slots < 1:
+            raise ValueError("slots must be at least 1.")
+        if slot_size < 8:
+            raise ValueError("slot_size must be at least 8.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if stop_timeout <= 0:
+            raise ValueError("stop_timeout must be positive.")
+
+        self._slots = slots
+        self._slot_size = slot_size
+        self._batch_size = batch_size
+        self._stop_timeout = stop_timeout
+        self._context: Any = multiprocessing.get_context(start_method)
+
+        self._ring: Optional[_RingBuffer] = None
+        self._processes: List[BaseProcess] = []
+        self._live_readers: List[int] = []
+        self._published_events = 0
+
+    def subscribe(self, consumer: Consumer) -> None:
+        """
+        Subscribe a consumer, to be run in its own process.
+        Raises:
+            InvalidLifecycleError: if the transport has been started.
+        """
+        if self._state != TransportState.INITIAL:
+            raise InvalidLifecycleError("Cannot subscribe after the transport started.")
+        super().subscribe(consumer)
+
+    def unsubscribe(self, consumer: Consumer) -> None:
+        """
+        Unsubscribe a consumer.
+        Raises:
+            InvalidLifecycleError: if the transport has been started.
+        """
+        if self._state != TransportState.INITIAL:
+            raise InvalidLifecycleError(
+                "Cannot unsubscribe after the transport started."
+            )
+        super().unsubscribe(consumer)
+
+    @property
+    def published_events(self) -> int:
+        """Number of events written to the ring buffer."""
+        return self._published_events
+
+    @property
+    def lag(self) -> int:
+        """Number of published events the slowest live consumer has not handled yet."""
+        ring = self._ring
+        if ring is None or not self._live_readers:
+            return 0
+        write_index = ring.write_index
+        return max(write_index - ring.read_index(r) for r in self._live_readers)
+
+    async def start(self) -> None:
+        """
+        Allocate the ring buffer and start one process per subscribed consumer.
+        """
+        await super().start()
+
+        ring = _RingBuffer.create(self._slots, self._slot_size, len(self._consumers))
+        self._ring = ring
+        for reader, consumer in enumerate(self._consumers):
+            process = self._context.Process(
+                target=consume_ring,
+                args=(ring.layout, reader, consumer, self._batch_size),
+                name=f"SharedMemoryConsumer-{reader}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        self._live_readers = list(range(len(self._processes)))
+
+    async def publish(self, event: Event) -> None:
+        """
+        Write an event to the ring buffer.
+        Args:
+            event (Event): The event to be published
+        Raises:
+            InvalidEventError: if the event is invalid, has no registered codec
+                or does not fit in a slot.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+        self._validate_transport_request(event)
+        ring = self._require_ring()
+        await self._write(ring, [ring.encode(event)])
+
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Write a batch of events to the ring buffer, publishing as many as fit
+        with a single index update.
+        Args:
+            events (Sequence[Event]): The events to be published
+        Raises:
+            InvalidEventError: if any event in the batch is invalid, has no
+                registered codec or does not fit in a slot.
+            InvalidLifecycleError: if there are no consumers subscribed.
+        """
+        self._validate_transport_batch(events)
+        ring = self._require_ring()
+        encode = ring.encode
+        await self._write(ring, [encode(event) for event in events])
+
+    async def flush(self) -> None:
+        """
+        Wait until every live consumer has handled every published event.
+        """
+        while self._ring is not None and self.lag:
+            await asyncio.sleep(IDLE_SLEEP)
+            self._check_readers()
+
+    async def shutdown(self) -> None:
+        """
+        Wait for the consumers to drain the ring buffer, stop their processes
+        and free the shared memory. Consumers that do not drain or exit within
+        `stop_timeout` seconds are logged and their process is terminated.
+        """
+        await super().shutdown()
+        try:
+            await asyncio.wait_for(self.flush(), self._stop_timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Shared memory consumers did not drain the ring buffer in time",
+                extra={"lag": self.lag},
+            )
+
+        ring = self._require_ring()
+        ring.close_writer()
+        for reader, process in enumerate(self._processes):
+            await asyncio.to_thread(process.join, self._stop_timeout)
+            if process.is_alive():
+                logger.error(
+                    "Shared memory consumer process did not exit, terminating it",
+                    extra={"consumer": self._consumers[reader].__class__.__name__},
+                )
+                process.terminate()
+                await asyncio.to_thread(process.join)
+        self._processes.clear()
+        self._live_readers.clear()
+
+        ring.close(unlink=True)
+        self._ring = None
+        self._state = TransportState.FINISHED
+
+    def _require_ring(self) -> _RingBuffer:
+        ring = self._ring
+        if ring is None:
+            raise InvalidLifecycleError("Transport is not running.")
+        return ring
+
+    async def _write(self, ring: _RingBuffer, encoded: List[bytes]) -> None:
+        """Write encoded events, waiting for the slowest consumer when the ring is full."""
+        written = 0
+        while written < len(encoded):
+            free = ring.free_slots(self._live_readers)
+            if free <= 0:
+                await asyncio.sleep(IDLE_SLEEP)
+                self._check_readers()
+                continue
+
+            chunk = encoded[written : written + free]
+            ring.write(chunk)
+            written += len(chunk)
+            self._published_events += len(chunk)
+
+    def _check_readers(self) -> None:
+        """Stop waiting for consumers whose process exited before shutdown."""
+        for reader in list(self._live_readers):
+            process = self._processes[reader]
+            if not process.is_alive():
+                logger.error(
+                    "Shared memory consumer process exited unexpectedly",
+                    extra={
+                        "consumer": self._consumers[reader].__class__.__name__,
+                        "exitcode": process.exitcode,
+                    },
+                )
+                self._live_readers.remove(reader)
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.consumers.base.synchronous_consumer import SynchronousConsumer
@@ -22,6 +24,23 @@ class DummyEvent(Event):
         )
 
 
+class FakeTime:
+    """
+    Stand-in for the time and asyncio modules of code that paces itself:
+    sleeping advances monotonic() instantly instead of waiting.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += max(delay, 0.0)
+        await asyncio.sleep(0)
+
+
 @pytest.fixture
 def dummy_consumer():
     return DummyConsumer()
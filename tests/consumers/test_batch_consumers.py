@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+
+from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.contracts.event import Event
+from tests.conftest import DummyEvent
+
+
+class FailingSyncConsumer(SynchronousConsumer):
+    def __init__(self):
+        self.received_events = []
+
+    def _handle(self, event: Event) -> None:
+        if event.timestamp == 1:
+            raise RuntimeError("boom")
+        self.received_events.append(event)
+
+
+class FailingAsyncConsumer(AsynchronousConsumer):
+    def __init__(self):
+        self.received_events = []
+
+    async def _handle(self, event: Event) -> None:
+        if event.timestamp == 1:
+            raise RuntimeError("boom")
+        self.received_events.append(event)
+
+
+class BulkAsyncConsumer(AsynchronousConsumer):
+    def __init__(self):
+        self.batches = []
+
+    async def _handle(self, event: Event) -> None:
+        raise AssertionError("Bulk consumer should receive whole batches.")
+
+    async def _handle_batch(self, events) -> None:
+        self.batches.append(list(events))
+
+
+def make_batch(size):
+    return [DummyEvent(timestamp=i, producer_id="p") for i in range(size)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("consumer_cls", [FailingSyncConsumer, FailingAsyncConsumer])
+async def test_failing_event_is_isolated_in_batch(consumer_cls, caplog):
+    consumer = consumer_cls()
+    events = make_batch(3)
+
+    with caplog.at_level(logging.ERROR):
+        await consumer.on_events(events)
+
+    assert consumer.received_events == [events[0], events[2]]
+    assert [record.batch_index for record in caplog.records] == [1]
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_override_receives_whole_batch():
+    consumer = BulkAsyncConsumer()
+    events = make_batch(4)
+    await consumer.on_events(events)
+    assert consumer.batches == [events]
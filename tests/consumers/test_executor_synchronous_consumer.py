@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.consumers.base.executor_synchronous_consumer import (
+    ExecutorSynchronousConsumer,
+)
+from src.core.contracts.event import Event
+from src.transport.base._dispatch_plan import _DispatchPlan
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyEvent
+
+
+class RecordingExecutorConsumer(ExecutorSynchronousConsumer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.release = threading.Event()
+        self.release.set()
+        self.handled = []
+
+    def _handle(self, event: Event) -> None:
+        self.release.wait()
+        self.handled.append((threading.current_thread().name, event))
+
+
+@pytest.mark.asyncio
+async def test_keeps_per_producer_order_through_transport():
+    consumer = RecordingExecutorConsumer(max_workers=3)
+    transport = InMemoryTransport(batch_size=7)
+    transport.subscribe(consumer)
+    await transport.start()
+
+    events = [DummyEvent(timestamp=i, producer_id=f"p{i % 4}") for i in range(60)]
+    await transport.publish_many(events)
+    await transport.shutdown()
+    await consumer.close()
+
+    assert consumer.completed_events == 60
+    for producer_id in ("p0", "p1", "p2", "p3"):
+        handled = [
+            (thread, event)
+            for thread, event in consumer.handled
+            if event.producer_id == producer_id
+        ]
+        assert [event for _, event in handled] == [
+            event for event in events if event.producer_id == producer_id
+        ]
+        assert len({thread for thread, _ in handled}) == 1
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limit_applies_backpressure():
+    consumer = RecordingExecutorConsumer(max_workers=2, max_in_flight=2)
+    consumer.release.clear()
+
+    await consumer.on_event(DummyEvent(timestamp=0, producer_id="a"))
+    await consumer.on_event(DummyEvent(timestamp=1, producer_id="b"))
+    assert consumer.in_flight_events == 2
+    assert consumer.lane_depths == [1, 1]
+
+    blocked = asyncio.create_task(
+        consumer.on_event(DummyEvent(timestamp=2, producer_id="a"))
+    )
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    consumer.release.set()
+    await blocked
+    await consumer.close()
+    assert consumer.in_flight_events == 0
+    assert consumer.completed_events == 3
+    assert [
+        event.timestamp for _, event in consumer.handled if event.producer_id == "a"
+    ] == [0, 2]
+
+
+def test_executor_consumer_is_not_dispatched_inline():
+    consumer = RecordingExecutorConsumer()
+    plan = _DispatchPlan([consumer])
+    assert plan.async_consumers == (consumer,)
+
+
+def test_invalid_limits_raise():
+    with pytest.raises(ValueError):
+        RecordingExecutorConsumer(max_workers=0)
+    with pytest.raises(ValueError):
+        RecordingExecutorConsumer(max_in_flight=0)
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from src.consumers.base.process_pool_consumer import ProcessPoolConsumer
+from src.core.events.counter.counter_number import CounterNumber
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyEvent
+
+
+class SummingConsumer(ProcessPoolConsumer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.results = []
+
+    @staticmethod
+    def _process_batch(events):
+        return (
+            os.getpid(),
+            [event.timestamp for event in events],
+            sum(getattr(event, "value", 0) for event in events),
+        )
+
+    async def _on_result(self, result, events):
+        self.results.append(result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+async def test_batches_are_processed_in_workers_in_order(start_method):
+    consumer = SummingConsumer(max_workers=2, start_method=start_method)
+    transport = InMemoryTransport(batch_size=5)
+    transport.subscribe(consumer)
+    await transport.start()
+
+    events = [
+        CounterNumber(timestamp=i, producer_id="CounterProducer_0", value=i)
+        for i in range(20)
+    ]
+    await transport.publish_many(events)
+    await transport.shutdown()
+    await consumer.close()
+
+    assert consumer.processed_events == 20
+    assert all(pid != os.getpid() for pid, _, _ in consumer.results)
+    assert [ts for _, timestamps, _ in consumer.results for ts in timestamps] == list(
+        range(20)
+    )
+    assert sum(total for _, _, total in consumer.results) == sum(range(20))
+
+
+@pytest.mark.asyncio
+async def test_unregistered_events_are_pickled():
+    consumer = SummingConsumer(max_workers=1)
+    await consumer.on_event(DummyEvent(timestamp=7, producer_id="p"))
+    await consumer.close()
+    assert [timestamps for _, timestamps, _ in consumer.results] == [[7]]
+
+
+class FailingConsumer(SummingConsumer):
+    @staticmethod
+    def _process_batch(events):
+        if events[0].timestamp == 1:
+            raise RuntimeError("boom")
+        return None, [event.timestamp for event in events], 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_logged_and_skipped(caplog):
+    consumer = FailingConsumer(max_workers=1, max_in_flight_batches=1)
+    for i in range(3):
+        await consumer.on_event(DummyEvent(timestamp=i, producer_id="p"))
+    await consumer.close()
+
+    assert [timestamps for _, timestamps, _ in consumer.results] == [[0], [2]]
+    assert consumer.processed_events == 2
+    assert "failed to process batch" in caplog.text
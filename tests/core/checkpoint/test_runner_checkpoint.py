@@ -0,0 +1,179 @@
+import pytest
+
+from src.core.checkpoint.file_checkpoint_store import FileCheckpointStore
+from src.core.errors import InvalidLifecycleError
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.time.simple_clock import SimpleClock
+from src.core.trace.columnar_runner_tracer import ColumnarRunnerTracer
+from src.core.trace.file_runner_tracer import FileRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.producers.base.base_producer import BaseProducer
+from src.producers.examples.counter_producer import CounterProducer
+from src.producers.examples.fibonacci_producer import FibonacciProducer
+from src.producers.examples.random_producer import SeededRandomProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyConsumer, DummyEvent
+
+
+def _runner(monkeypatch, tracer, transport=None, **kwargs):
+    # Reset the producer id counter so every run produces identical ids
+    monkeypatch.setattr(BaseProducer, "_counter", 0)
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [
+        CounterProducer(clock=read_only_clock, limit=12),
+        FibonacciProducer(clock=read_only_clock, limit=5),
+        SeededRandomProducer(clock=read_only_clock, limit=9, seed=7),
+    ]
+    if transport is None:
+        transport = InMemoryTransport()
+    transport.subscribe(DummyConsumer())
+    runner = SimpleRunner(
+        clock=clock, producers=producers, transport=transport, tracer=tracer, **kwargs
+    )
+    return runner, transport
+
+
+@pytest.mark.asyncio
+async def test_resume_after_crash_matches_uninterrupted_run(tmp_path, monkeypatch):
+    reference_tracer = SimpleRunnerTracer()
+    runner, transport = _runner(monkeypatch, reference_tracer)
+    await runner.run()
+    await transport.shutdown()
+
+    store = FileCheckpointStore(tmp_path / "checkpoints")
+    crashed_tracer = FileRunnerTracer(tmp_path / "trace")
+    runner, _ = _runner(
+        monkeypatch, crashed_tracer, checkpoint_store=store, checkpoint_every=3
+    )
+    # Stop after 7 steps without closing anything, the last checkpoint is at 6
+    await runner.run(max_steps=7)
+
+    checkpoint = store.load_latest()
+    assert checkpoint is not None and checkpoint.steps == 6
+
+    resumed_tracer = FileRunnerTracer(tmp_path / "trace")
+    runner, transport = _runner(monkeypatch, resumed_tracer)
+    await runner.restore(checkpoint)
+    await runner.run()
+    await transport.shutdown()
+
+    assert resumed_tracer.get_trace() == reference_tracer.get_trace()
+    resumed_tracer.close()
+
+
+class FailingTransport(InMemoryTransport):
+    def __init__(self, fail_at):
+        super().__init__()
+        self.fail_at = fail_at
+        self.calls = 0
+
+    async def publish_many(self, events):
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise RuntimeError("transport down")
+        await super().publish_many(events)
+
+
+def _delivered(transport):
+    return [
+        (event.producer_id, event.timestamp)
+        for event in transport.consumers[0].received_events
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lookahead", [0, 2])
+async def test_checkpoint_is_saved_only_after_its_step_is_published(
+    tmp_path, monkeypatch, lookahead
+):
+    runner, transport = _runner(monkeypatch, None)
+    await runner.run()
+    await transport.shutdown()
+    expected = _delivered(transport)
+
+    store = FileCheckpointStore(tmp_path)
+    crashing = FailingTransport(fail_at=6)
+    runner, _ = _runner(
+        monkeypatch,
+        None,
+        crashing,
+        checkpoint_store=store,
+        checkpoint_every=3,
+        lookahead=lookahead,
+    )
+    with pytest.raises(RuntimeError):
+        await runner.run()
+    await crashing.flush()
+
+    # The checkpoint of step 6 would skip the events whose publish failed
+    checkpoint = store.load_latest()
+    assert checkpoint is not None and checkpoint.steps == 3
+
+    runner, transport = _runner(monkeypatch, None)
+    await runner.restore(checkpoint)
+    await runner.run()
+    await transport.shutdown()
+
+    resumed = _delivered(transport)
+    assert expected[-len(resumed) :] == resumed
+    assert set(_delivered(crashing)) | set(resumed) == set(expected)
+
+
+def test_snapshot_before_start_raises(tmp_path, monkeypatch):
+    runner, _ = _runner(monkeypatch, None)
+    assert FileCheckpointStore(tmp_path).load_latest() is None
+    with pytest.raises(InvalidLifecycleError):
+        runner.snapshot()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_and_store_pruning(tmp_path, monkeypatch):
+    runner, transport = _runner(monkeypatch, None)
+    store = FileCheckpointStore(tmp_path, keep=2)
+    await runner.start()
+    for _ in range(3):
+        await runner.step()
+        store.save(runner.snapshot())
+    await transport.shutdown()
+
+    assert len(list(tmp_path.iterdir())) == 2
+    latest = store.load_latest()
+    assert latest.steps == 3
+    assert latest.timestamp == latest.clock_time == 9
+    assert latest.trace_position is None
+
+
+def test_random_producer_snapshot_resumes_sequence():
+    clock = SimpleClock().as_read_only()
+    producer = SeededRandomProducer(clock=clock, limit=10, seed=3)
+    producer.start()
+    producer.step(0)
+    snapshot = producer.snapshot()
+    expected = [producer.step(t).value for t in range(1, 5)]
+
+    restored = SeededRandomProducer(clock=clock, limit=10, seed=99)
+    restored.restore(snapshot)
+    assert [restored.step(t).value for t in range(1, 5)] == expected
+
+
+@pytest.mark.parametrize("make_tracer", ["columnar", "file"])
+def test_tracer_truncate(make_tracer, tmp_path):
+    if make_tracer == "columnar":
+        tracer = ColumnarRunnerTracer()
+    else:
+        tracer = FileRunnerTracer(tmp_path, flush_every=2, segment_size=64)
+
+    for timestamp in range(6):
+        tracer.record_step("p", timestamp, DummyEvent(timestamp, "p"))
+    expected = tracer.get_trace()[:4]
+
+    tracer.truncate(4)
+    assert tracer.position() == 4
+    assert tracer.get_trace() == expected
+
+    tracer.record_step("p", 4, DummyEvent(4, "p"))
+    assert [entry.timestamp for entry in tracer.get_trace()] == [0, 1, 2, 3, 4]
+
+    with pytest.raises(ValueError):
+        tracer.truncate(10)
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.core.codec.event_codec_registry import EventCodecRegistry, default_event_codecs
+from src.core.contracts.event import Event
+from src.core.errors import InvalidEventError
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.fibonacci_number import FibonacciNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+from tests.conftest import DummyEvent
+
+
+@dataclass(frozen=True)
+class LabelledEvent(Event):
+    label: str
+    flag: bool
+    score: float
+    size: int
+
+
+EVENTS = [
+    CounterNumber(timestamp=0, producer_id="counter", value=-3),
+    FibonacciNumber(timestamp=1, producer_id="fib", value=2**200 + 1),
+    RandomNumber(timestamp=2, producer_id="random", value=0.25),
+]
+
+
+@pytest.mark.parametrize("event", EVENTS)
+def test_to_dict_matches_event_to_dict(event):
+    data = default_event_codecs.to_dict(event)
+    assert data == event.to_dict()
+    assert default_event_codecs.from_dict(data) == event
+
+
+def test_binary_round_trip():
+    buffer = default_event_codecs.encode_many(EVENTS)
+    assert default_event_codecs.decode_many(buffer) == EVENTS
+
+
+def test_custom_event_round_trip():
+    registry = EventCodecRegistry()
+    registry.register(LabelledEvent)
+    event = LabelledEvent(
+        5, "producer_é", label="ünïcode", flag=True, score=1.5, size=0
+    )
+
+    decoded, offset = registry.decode(registry.encode(event))
+
+    assert decoded == event
+    assert offset == len(registry.encode(event))
+
+
+def test_unregistered_events():
+    assert (
+        default_event_codecs.to_dict(DummyEvent(0, "p")) == DummyEvent(0, "p").to_dict()
+    )
+    with pytest.raises(InvalidEventError):
+        default_event_codecs.encode(DummyEvent(0, "p"))
+    with pytest.raises(InvalidEventError):
+        default_event_codecs.register(CounterNumber)
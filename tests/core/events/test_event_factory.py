@@ -0,0 +1,34 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+from src.core.events.event_factory import compile_event_factory
+from tests.conftest import DummyEvent
+
+
+def test_events_are_slotted_and_frozen():
+    event = CounterNumber(timestamp=1, producer_id="p", value=2)
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        event.value = 3  # type: ignore
+    assert event.to_dict() == {
+        "timestamp": 1,
+        "producer_id": "p",
+        "value": 2,
+        "event_type": "CounterNumber",
+    }
+
+
+@pytest.mark.parametrize("event_type, value", [(CounterNumber, 7), (RandomNumber, 0.5)])
+def test_factory_matches_constructor(event_type, value):
+    make = compile_event_factory(event_type, "producer")
+    event = make(3, value)
+    assert event == event_type(timestamp=3, producer_id="producer", value=value)
+    assert type(event) is event_type
+
+
+def test_factory_falls_back_for_unslotted_events():
+    make = compile_event_factory(DummyEvent, "producer")
+    assert make(4) == DummyEvent(timestamp=4, producer_id="producer")
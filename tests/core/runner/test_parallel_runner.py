@@ -0,0 +1,102 @@
+import copy
+import threading
+
+import pytest
+
+from src.core.errors import ProducerExecutionError
+from src.core.execution.parallel_runner import ParallelRunner
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.time.simple_clock import SimpleClock
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.producers.examples.counter_producer import CounterProducer
+from src.producers.examples.fibonacci_producer import FibonacciProducer
+from src.producers.examples.random_producer import SeededRandomProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyConsumer
+
+
+class ExplodingProducer(CounterProducer):
+    def _step(self, timestamp: int):
+        raise RuntimeError("boom")
+
+
+def make_producers():
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [
+        CounterProducer(clock=read_only_clock, limit=3),
+        FibonacciProducer(clock=read_only_clock, limit=7),
+        SeededRandomProducer(clock=read_only_clock, limit=5, seed=42),
+    ]
+    return clock, producers
+
+
+async def run_with(runner_cls, clock, producers, **kwargs):
+    transport = InMemoryTransport()
+    consumer = DummyConsumer()
+    transport.subscribe(consumer)
+    tracer = SimpleRunnerTracer()
+    runner = runner_cls(
+        clock=clock, producers=producers, transport=transport, tracer=tracer, **kwargs
+    )
+    await runner.run()
+    await transport.shutdown()
+    return tracer.get_trace(), consumer.received_events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+async def test_parallel_trace_matches_simple_runner(start_method):
+    clock, producers = make_producers()
+    simple_clock, simple_producers = copy.deepcopy((clock, producers))
+
+    expected_trace, expected_events = await run_with(
+        SimpleRunner, simple_clock, simple_producers
+    )
+    trace, events = await run_with(
+        ParallelRunner,
+        clock,
+        producers,
+        number_of_workers=2,
+        start_method=start_method,
+    )
+
+    assert trace == expected_trace
+    assert events == expected_events
+    assert clock.now() == simple_clock.now()
+
+
+@pytest.mark.asyncio
+async def test_parallel_runner_reports_producer_failure():
+    clock = SimpleClock()
+    producers = [ExplodingProducer(clock=clock.as_read_only(), limit=3)]
+
+    with pytest.raises(ProducerExecutionError):
+        await run_with(ParallelRunner, clock, producers, start_method="fork")
+
+
+@pytest.mark.asyncio
+async def test_run_joins_workers_off_the_event_loop():
+    clock, producers = make_producers()
+    transport = InMemoryTransport()
+    transport.subscribe(DummyConsumer())
+    runner = ParallelRunner(
+        clock=clock, producers=producers, transport=transport, start_method="fork"
+    )
+    await runner.start()
+
+    joined_on = []
+    for process in runner._processes:
+        join = process.join
+
+        def recording_join(timeout=None, join=join):
+            joined_on.append(threading.current_thread())
+            join(timeout)
+
+        process.join = recording_join
+
+    await runner.run()
+    await transport.shutdown()
+
+    assert joined_on
+    assert threading.main_thread() not in joined_on
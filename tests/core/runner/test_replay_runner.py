@@ -0,0 +1,100 @@
+import pytest
+
+from src.core.execution import replay_runner
+from src.core.execution.replay_runner import ReplayRunner
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.time.simple_clock import SimpleClock
+from src.core.trace.file_runner_tracer import FileRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.producers.examples.counter_producer import CounterProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyConsumer, FakeTime
+
+
+async def _record(tracer, limit=10):
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    consumer = DummyConsumer()
+    transport = InMemoryTransport()
+    transport.subscribe(consumer)
+    runner = SimpleRunner(
+        clock=clock,
+        producers=[
+            CounterProducer(clock=read_only_clock, limit=limit),
+            CounterProducer(clock=read_only_clock, limit=limit // 2),
+        ],
+        transport=transport,
+        tracer=tracer,
+    )
+    await runner.run()
+    await transport.shutdown()
+    return consumer.received_events
+
+
+async def _replay(trace, **kwargs):
+    consumer = DummyConsumer()
+    transport = InMemoryTransport()
+    transport.subscribe(consumer)
+    runner = ReplayRunner(trace=trace, transport=transport, **kwargs)
+    await runner.run()
+    await transport.shutdown()
+    return runner, consumer.received_events
+
+
+@pytest.mark.asyncio
+async def test_replay_republishes_recorded_events():
+    tracer = SimpleRunnerTracer()
+    recorded = await _record(tracer)
+
+    runner, replayed = await _replay(tracer.get_trace(), batch_size=4)
+
+    assert replayed == recorded
+    assert runner.is_finished()
+    assert runner.replayed_events == len(recorded)
+
+
+@pytest.mark.asyncio
+async def test_replay_from_file_trace_with_seek(tmp_path):
+    tracer = FileRunnerTracer(tmp_path)
+    recorded = await _record(tracer)
+
+    with tracer.reader() as reader:
+        _, replayed = await _replay(reader, start_timestamp=5, end_timestamp=11)
+    tracer.close()
+
+    assert replayed == [event for event in recorded if 5 <= event.timestamp < 11]
+
+
+@pytest.mark.asyncio
+async def test_seek_between_steps():
+    tracer = SimpleRunnerTracer()
+    recorded = await _record(tracer)
+
+    consumer = DummyConsumer()
+    transport = InMemoryTransport()
+    transport.subscribe(consumer)
+    runner = ReplayRunner(trace=tracer.get_trace(), transport=transport, batch_size=3)
+    await runner.start()
+    await runner.step()
+    runner.seek(12)
+    await runner.run()
+    await transport.shutdown()
+
+    assert consumer.received_events == recorded[:3] + [
+        event for event in recorded if event.timestamp >= 12
+    ]
+
+
+@pytest.mark.asyncio
+async def test_paced_replay_follows_scaled_timestamps(monkeypatch):
+    tracer = SimpleRunnerTracer()
+    recorded = await _record(tracer)
+    fake_time = FakeTime()
+    monkeypatch.setattr(replay_runner, "time", fake_time)
+    monkeypatch.setattr(replay_runner, "asyncio", fake_time)
+
+    # 15 recorded timestamps, 0 to 14, replayed at 100 per second
+    _, replayed = await _replay(tracer.get_trace(), timestamps_per_second=100)
+
+    assert replayed == recorded
+    assert fake_time.now == pytest.approx(0.14)
@@ -1,9 +1,20 @@
+import asyncio
+import pickle
+
 import pytest
 
+from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.execution import _token_bucket
 from src.core.execution.simple_runner import SimpleRunner
 from src.core.time.simple_clock import SimpleClock
 from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.producers.base.base_producer import BaseProducer
+from src.producers.examples.counter_producer import CounterProducer
+from src.producers.examples.fibonacci_producer import FibonacciProducer
+from src.producers.examples.random_producer import SeededRandomProducer
 from src.transport.in_memory.in_memory_transport import InMemoryTransport
+from tests.conftest import DummyConsumer, FakeTime
 
 
 @pytest.mark.asyncio
@@ -22,3 +33,296 @@ async def test_runner_records_trace(counter_producer, dummy_consumer):
     trace = tracer.get_trace()
     assert len(trace) > 0
     assert trace[0].producer_id == counter_producer.producer_id
+
+
+@pytest.mark.asyncio
+async def test_chunked_runner_publishes_every_event(dummy_consumer):
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [
+        CounterProducer(clock=read_only_clock, limit=5),
+        CounterProducer(clock=read_only_clock, limit=2),
+    ]
+    transport = InMemoryTransport()
+    tracer = SimpleRunnerTracer()
+    transport.subscribe(dummy_consumer)
+
+    runner = SimpleRunner(
+        clock=clock,
+        producers=producers,
+        transport=transport,
+        tracer=tracer,
+        chunk_size=3,
+    )
+    await runner.run()
+    await transport.shutdown()
+
+    trace = tracer.get_trace()
+    assert [entry.timestamp for entry in trace] == list(range(7))
+    assert [entry.event.value for entry in trace] == [0, 1, 2, 0, 1, 3, 4]
+    assert len(dummy_consumer.received_events) == 7
+
+
+class GatedConsumer(AsynchronousConsumer):
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.received_events = []
+
+    async def _handle(self, event: Event) -> None:
+        await self.gate.wait()
+        self.received_events.append(event)
+
+
+def _counter_producers(clock):
+    read_only_clock = clock.as_read_only()
+    return [
+        CounterProducer(clock=read_only_clock, limit=6),
+        CounterProducer(clock=read_only_clock, limit=3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_runner_matches_sequential_run():
+    traces = []
+    deliveries = []
+    for lookahead in (0, 2):
+        clock = SimpleClock()
+        consumer = DummyConsumer()
+        transport = InMemoryTransport()
+        tracer = SimpleRunnerTracer()
+        transport.subscribe(consumer)
+        runner = SimpleRunner(
+            clock=clock,
+            producers=_counter_producers(clock),
+            transport=transport,
+            tracer=tracer,
+            lookahead=lookahead,
+        )
+        await runner.run()
+        await transport.shutdown()
+        # Producer ids come from a global counter, so compare the payloads only
+        traces.append([(e.timestamp, e.event.value) for e in tracer.get_trace()])
+        deliveries.append(
+            [(event.timestamp, event.value) for event in consumer.received_events]
+        )
+
+    assert traces[0] == traces[1]
+    assert deliveries[0] == deliveries[1]
+    assert [timestamp for timestamp, _ in deliveries[1]] == list(range(9))
+
+
+@pytest.mark.asyncio
+async def test_pipelined_runner_steps_ahead_of_blocked_transport():
+    clock = SimpleClock()
+    consumer = GatedConsumer()
+    transport = InMemoryTransport(capacity=1, batch_size=1)
+    tracer = SimpleRunnerTracer()
+    transport.subscribe(consumer)
+    runner = SimpleRunner(
+        clock=clock,
+        producers=_counter_producers(clock),
+        transport=transport,
+        tracer=tracer,
+        lookahead=3,
+    )
+
+    run = asyncio.create_task(runner.run())
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert not run.done()
+    assert consumer.received_events == []
+    # One step in the worker, one in the queue, one being published, three staged
+    assert len(tracer.get_trace()) > 4
+
+    consumer.gate.set()
+    await run
+    await transport.shutdown()
+    assert len(consumer.received_events) == len(tracer.get_trace()) == 9
+
+
+@pytest.mark.asyncio
+async def test_invalid_lookahead_raises(counter_producer):
+    with pytest.raises(ValueError):
+        SimpleRunner(
+            clock=SimpleClock(),
+            producers=[counter_producer],
+            transport=InMemoryTransport(),
+            lookahead=-1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_runner_drops_finished_producers(dummy_consumer):
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [
+        CounterProducer(clock=read_only_clock, limit=limit) for limit in (1, 4, 2)
+    ]
+    transport = InMemoryTransport()
+    transport.subscribe(dummy_consumer)
+    runner = SimpleRunner(clock=clock, producers=producers, transport=transport)
+
+    await runner.start()
+    assert (runner.active_producers, runner.finished_producers) == (3, 0)
+
+    counts = []
+    while not runner.is_finished():
+        await runner.step()
+        counts.append((runner.active_producers, runner.finished_producers))
+    await transport.shutdown()
+
+    assert counts == [(2, 1), (1, 2), (1, 2), (0, 3)]
+    assert len(dummy_consumer.received_events) == 7
+
+
+async def _traced_run(monkeypatch, fused, yield_every=4):
+    # Reset the producer id counter so both runs produce identical ids
+    monkeypatch.setattr(BaseProducer, "_counter", 0)
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [
+        CounterProducer(clock=read_only_clock, limit=7),
+        FibonacciProducer(clock=read_only_clock, limit=3),
+        SeededRandomProducer(clock=read_only_clock, limit=5, seed=42),
+    ]
+    consumer = DummyConsumer()
+    transport = InMemoryTransport()
+    tracer = SimpleRunnerTracer()
+    transport.subscribe(consumer)
+    runner = SimpleRunner(
+        clock=clock,
+        producers=producers,
+        transport=transport,
+        tracer=tracer,
+        yield_every=yield_every,
+    )
+
+    if fused:
+        await runner.run()
+    else:
+        await runner.start()
+        while not runner.is_finished():
+            await runner.step()
+    await transport.shutdown()
+
+    assert runner.finished_producers == 3
+    return pickle.dumps(tracer.get_trace()), consumer.received_events
+
+
+@pytest.mark.asyncio
+async def test_fused_run_matches_stepping(monkeypatch):
+    stepped_trace, stepped_events = await _traced_run(monkeypatch, fused=False)
+    for yield_every in (1, 4, 1000):
+        fused_trace, fused_events = await _traced_run(monkeypatch, True, yield_every)
+        assert fused_trace == stepped_trace
+        assert fused_events == stepped_events
+
+
+class SilentProducer(CounterProducer):
+    """Producer that steps like CounterProducer but never emits an event."""
+
+    def _step(self, timestamp: int):
+        super()._step(timestamp)
+        return None
+
+
+@pytest.mark.asyncio
+async def test_fused_run_yields_when_steps_emit_no_events(dummy_consumer):
+    clock = SimpleClock()
+    producer = SilentProducer(clock=clock.as_read_only(), limit=1000)
+    transport = InMemoryTransport()
+    transport.subscribe(dummy_consumer)
+    runner = SimpleRunner(
+        clock=clock, producers=[producer], transport=transport, yield_every=10
+    )
+
+    async def observe():
+        await asyncio.sleep(0)
+        return runner.is_finished()
+
+    observer = asyncio.create_task(observe())
+    await runner.run()
+    await transport.shutdown()
+
+    assert runner.is_finished()
+    assert await observer is False
+
+
+def _budget_runner(consumer, limit=10):
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    transport = InMemoryTransport()
+    tracer = SimpleRunnerTracer()
+    transport.subscribe(consumer)
+    runner = SimpleRunner(
+        clock=clock,
+        producers=[CounterProducer(clock=read_only_clock, limit=limit)],
+        transport=transport,
+        tracer=tracer,
+    )
+    return runner, transport, tracer
+
+
+@pytest.mark.asyncio
+async def test_budgeted_run_yields_to_the_event_loop(dummy_consumer):
+    clock = SimpleClock()
+    producer = CounterProducer(clock=clock.as_read_only(), limit=1000)
+    transport = InMemoryTransport()
+    transport.subscribe(dummy_consumer)
+    runner = SimpleRunner(
+        clock=clock, producers=[producer], transport=transport, yield_every=10
+    )
+
+    async def observe():
+        await asyncio.sleep(0)
+        return runner.is_finished()
+
+    observer = asyncio.create_task(observe())
+    await runner.run(deadline=60)
+    await transport.shutdown()
+
+    assert runner.is_finished()
+    assert await observer is False
+
+
+@pytest.mark.asyncio
+async def test_run_with_max_steps_is_resumable(dummy_consumer):
+    runner, transport, tracer = _budget_runner(dummy_consumer)
+
+    await runner.run(max_steps=4)
+    assert not runner.is_finished()
+    assert len(tracer.get_trace()) == 4
+
+    await runner.run(max_steps=4)
+    assert len(tracer.get_trace()) == 8
+
+    await runner.run()
+    await transport.shutdown()
+    assert runner.is_finished()
+    assert [entry.timestamp for entry in tracer.get_trace()] == list(range(10))
+    assert [event.value for event in dummy_consumer.received_events] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_run_stops_at_deadline(dummy_consumer):
+    runner, transport, tracer = _budget_runner(dummy_consumer)
+    await runner.run(deadline=0)
+    assert tracer.get_trace() == []
+    assert not runner.is_finished()
+    await runner.run(deadline=60)
+    await transport.shutdown()
+    assert runner.is_finished()
+
+
+@pytest.mark.asyncio
+async def test_run_paces_events_to_rate(dummy_consumer, monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr(_token_bucket, "time", fake_time)
+    monkeypatch.setattr(_token_bucket, "asyncio", fake_time)
+    runner, transport, _ = _budget_runner(dummy_consumer, limit=30)
+    # 10 events of burst, then 20 events at 100 events per second
+    await runner.run(rate=100)
+    await transport.shutdown()
+    assert runner.is_finished()
+    assert fake_time.now == pytest.approx(0.2)
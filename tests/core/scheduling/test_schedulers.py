@@ -0,0 +1,153 @@
+import itertools
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.execution import simple_runner
+from src.core.execution.simple_runner import SimpleRunner
+from src.core.scheduling.priority_scheduler import PriorityScheduler
+from src.core.scheduling.round_robin_scheduler import RoundRobinScheduler
+from src.core.scheduling.weighted_fair_scheduler import WeightedFairScheduler
+from src.core.time.simple_clock import SimpleClock
+from src.producers.examples.counter_producer import CounterProducer
+from src.transport.in_memory.in_memory_transport import InMemoryTransport
+
+
+def _producers(limits):
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    producers = [CounterProducer(clock=read_only_clock, limit=n) for n in limits]
+    for producer in producers:
+        producer.start()
+    return producers
+
+
+def _run_round(scheduler, producers, costs):
+    """Step the producers the scheduler yields, reporting a fixed cost per step."""
+    stepped = []
+    for producer in scheduler.schedule(producers):
+        producer.step(0)
+        scheduler.record_step(producer, costs[producer])
+        stepped.append(producer)
+    return stepped
+
+
+def test_round_robin_steps_each_producer_once():
+    producers = _producers([5, 5])
+    scheduler = RoundRobinScheduler()
+    assert _run_round(scheduler, producers, dict.fromkeys(producers, 0.5)) == producers
+    assert scheduler.accounting(producers[0]).steps == 1
+    assert scheduler.accounting(producers[0]).mean_time == 0.5
+
+
+def test_weighted_fair_shares_time_by_weight():
+    fast, slow = _producers([1000, 1000])
+    scheduler = WeightedFairScheduler({fast: 3.0, slow: 1.0}, quantum=1.0)
+    costs = {fast: 1.0, slow: 1.0}
+
+    steps = Counter()
+    for _ in range(10):
+        steps.update(_run_round(scheduler, [fast, slow], costs))
+
+    assert steps[fast] == 30
+    assert steps[slow] == 10
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_shares_cheap_steps_by_weight(dummy_consumer):
+    # Counter steps are far shorter than the default quantum, so the
+    # per-round step caps decide the shares rather than measured time
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    fast = CounterProducer(clock=read_only_clock, limit=10**6)
+    slow = CounterProducer(clock=read_only_clock, limit=10**6)
+    scheduler = WeightedFairScheduler({fast: 3.0, slow: 1.0})
+    transport = InMemoryTransport()
+    transport.subscribe(dummy_consumer)
+    runner = SimpleRunner(
+        clock=clock, producers=[slow, fast], transport=transport, scheduler=scheduler
+    )
+
+    await runner.start()
+    for _ in range(5):
+        await runner.step()
+    await transport.shutdown()
+
+    ratio = scheduler.accounting(fast).steps / scheduler.accounting(slow).steps
+    assert 2.5 <= ratio <= 3.5
+
+
+def test_weighted_fair_expensive_producer_does_not_starve_cheap_one():
+    expensive, cheap = _producers([1000, 1000])
+    scheduler = WeightedFairScheduler(quantum=1.0, max_steps_per_round=50)
+    costs = {expensive: 5.0, cheap: 0.25}
+
+    rounds = [_run_round(scheduler, [expensive, cheap], costs) for _ in range(10)]
+
+    assert all(round.count(cheap) == 4 for round in rounds)
+    assert sum(round.count(expensive) for round in rounds) == 2
+    assert scheduler.accounting(expensive).total_time == 10.0
+
+
+def test_priority_scheduler_orders_and_ages_skipped_producers():
+    low, high = _producers([100, 100])
+    scheduler = PriorityScheduler({high: 2}, round_budget=1.0)
+    costs = {low: 1.0, high: 1.0}
+
+    rounds = [_run_round(scheduler, [low, high], costs) for _ in range(4)]
+
+    # low is skipped twice, then its age lifts it above high for one round
+    assert rounds == [[high], [high], [low], [high]]
+
+
+def test_invalid_weights_raise():
+    (producer,) = _producers([1])
+    with pytest.raises(ValueError):
+        WeightedFairScheduler({producer: 0})
+
+
+@pytest.mark.asyncio
+async def test_runner_steps_producers_picked_by_scheduler(dummy_consumer, monkeypatch):
+    # Every step measures exactly one second, so the weights alone decide the shares
+    ticks = itertools.count()
+    monkeypatch.setattr(
+        simple_runner,
+        "time",
+        SimpleNamespace(
+            perf_counter=lambda: float(next(ticks)), monotonic=time.monotonic
+        ),
+    )
+    clock = SimpleClock()
+    read_only_clock = clock.as_read_only()
+    fast = CounterProducer(clock=read_only_clock, limit=12)
+    slow = CounterProducer(clock=read_only_clock, limit=4)
+    scheduler = WeightedFairScheduler(
+        {fast: 3.0, slow: 1.0}, quantum=2.0, max_steps_per_round=10
+    )
+    transport = InMemoryTransport()
+    transport.subscribe(dummy_consumer)
+    runner = SimpleRunner(
+        clock=clock, producers=[slow, fast], transport=transport, scheduler=scheduler
+    )
+
+    await runner.start()
+    rounds = []
+    while not runner.is_finished():
+        handled = len(dummy_consumer.received_events)
+        await runner.step()
+        await transport.flush()
+        rounds.append(
+            Counter(
+                event.producer_id for event in dummy_consumer.received_events[handled:]
+            )
+        )
+    await transport.shutdown()
+
+    assert rounds == [Counter({fast.producer_id: 6, slow.producer_id: 2})] * 2
+    assert [event.timestamp for event in dummy_consumer.received_events] == list(
+        range(16)
+    )
+    assert scheduler.accounting(fast).steps == 12
+    assert scheduler.accounting(slow).steps == 4
@@ -0,0 +1,37 @@
+import threading
+
+from src.core.time.thread_safe_clock import ThreadSafeClock
+
+
+def test_thread_safe_clock_ticks_and_reads():
+    clock = ThreadSafeClock()
+    assert clock.now() == 0
+    assert clock.tick() == 1
+    assert clock.as_read_only().now() == 1
+
+
+def test_concurrent_ticks_are_not_lost():
+    clock = ThreadSafeClock()
+    read_only_clock = clock.as_read_only()
+    observed = []
+
+    def tick_many():
+        for _ in range(2000):
+            clock.tick()
+
+    def read_many():
+        last = 0
+        for _ in range(2000):
+            now = read_only_clock.now()
+            observed.append(now >= last)
+            last = now
+
+    threads = [threading.Thread(target=tick_many) for _ in range(4)]
+    threads += [threading.Thread(target=read_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert clock.now() == 8000
+    assert all(observed)
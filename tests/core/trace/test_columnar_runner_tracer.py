@@ -0,0 +1,66 @@
+import pytest
+
+from src.core.errors import ContractViolationError
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+from src.core.trace.columnar_runner_tracer import ColumnarRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from tests.conftest import DummyEvent
+
+
+def record_all(tracer, steps):
+    for producer_id, timestamp, event in steps:
+        tracer.record_step(producer_id=producer_id, timestamp=timestamp, event=event)
+
+
+def make_steps():
+    steps = []
+    for timestamp in range(10):
+        producer_id = f"producer_{timestamp % 3}"
+        if timestamp % 2:
+            event = CounterNumber(timestamp, producer_id, value=timestamp)
+        else:
+            event = RandomNumber(timestamp, producer_id, value=timestamp / 10)
+        steps.append((producer_id, timestamp, event))
+    steps.append(("other", 10, DummyEvent(timestamp=99, producer_id="dummy")))
+    return steps
+
+
+def test_get_trace_matches_simple_tracer():
+    columnar, simple = ColumnarRunnerTracer(), SimpleRunnerTracer()
+    steps = make_steps()
+    record_all(columnar, steps)
+    record_all(simple, steps)
+
+    assert columnar.get_trace() == simple.get_trace()
+    assert list(columnar.view()) == simple.get_trace()
+    assert columnar.producer_ids == ["producer_0", "producer_1", "producer_2", "other"]
+
+
+def test_slice_by_timestamp_is_lazy_range():
+    tracer = ColumnarRunnerTracer()
+    record_all(tracer, make_steps())
+
+    view = tracer.slice_by_timestamp(3, 7)
+
+    assert len(view) == 4
+    assert [entry.timestamp for entry in view] == [3, 4, 5, 6]
+    assert view[-1].event == RandomNumber(6, "producer_0", value=0.6)
+    assert [entry.timestamp for entry in view[1:3]] == [4, 5]
+    with view.timestamps() as timestamps:
+        assert timestamps.tolist() == [3, 4, 5, 6]
+
+    tracer.record_step("p", 11, CounterNumber(11, "p", value=0))
+    assert len(tracer) == 12
+
+
+def test_slice_requires_ordered_trace():
+    tracer = ColumnarRunnerTracer()
+    tracer.record_step("p", 5, CounterNumber(5, "p", value=0))
+    tracer.record_step("p", 1, CounterNumber(1, "p", value=1))
+
+    with pytest.raises(ContractViolationError):
+        tracer.slice_by_timestamp(0, 10)
+
+    tracer.truncate(1)
+    assert [entry.timestamp for entry in tracer.slice_by_timestamp(0, 10)] == [5]
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from src.core.errors import ContractViolationError
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.fibonacci_number import FibonacciNumber
+from src.core.trace.file_runner_tracer import FileRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from src.core.trace.trace_segment_reader import TraceSegmentReader
+
+
+def record_all(tracers, count):
+    for timestamp in range(count):
+        producer_id = f"producer_{timestamp % 2}"
+        event_type = CounterNumber if timestamp % 2 else FibonacciNumber
+        event = event_type(timestamp, producer_id, value=timestamp * 7)
+        for tracer in tracers:
+            tracer.record_step(producer_id, timestamp, event)
+
+
+def test_trace_round_trips_through_segments(tmp_path):
+    tracer = FileRunnerTracer(tmp_path, flush_every=4, segment_size=256)
+    expected = SimpleRunnerTracer()
+    record_all([tracer, expected], 50)
+
+    assert tracer.get_trace() == expected.get_trace()
+    assert len(list(tmp_path.iterdir())) > 1
+    tracer.close()
+
+
+def test_reader_range_query_and_reopen(tmp_path):
+    tracer = FileRunnerTracer(tmp_path, flush_every=8)
+    record_all([tracer], 20)
+    tracer.close()
+
+    with TraceSegmentReader(tmp_path) as reader:
+        entries = list(reader.read_range(5, 9))
+        assert len(reader) == 20
+    assert [entry.timestamp for entry in entries] == [5, 6, 7, 8]
+    assert entries[0].event == CounterNumber(5, "producer_1", value=35)
+
+
+def test_reader_range_query_on_unsorted_trace_raises_eagerly(tmp_path):
+    tracer = FileRunnerTracer(tmp_path)
+    tracer.record_step("p", 2, CounterNumber(2, "p", value=2))
+    tracer.record_step("p", 1, CounterNumber(1, "p", value=1))
+    tracer.close()
+
+    with TraceSegmentReader(tmp_path) as reader:
+        with pytest.raises(ContractViolationError):
+            reader.read_range(0, 3)
+
+
+def test_reader_ignores_truncated_record(tmp_path):
+    tracer = FileRunnerTracer(tmp_path)
+    record_all([tracer], 3)
+    tracer.close()
+
+    segment = next(tmp_path.iterdir())
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    with TraceSegmentReader(tmp_path) as reader:
+        assert [entry.timestamp for entry in reader] == [0, 1]
+
+
+def test_iter_since_only_reads_new_records(tmp_path):
+    tracer = FileRunnerTracer(tmp_path, flush_every=1000, segment_size=256)
+    record_all([tracer], 10)
+    assert [entry.timestamp for entry in tracer.iter_since(0)] == list(range(10))
+
+    record_all([tracer], 30)
+    entries = list(tracer.iter_since(10))
+    assert [entry.timestamp for entry in entries] == list(range(30))
+    assert len(list(tmp_path.iterdir())) > 1
+    tracer.close()
+
+    assert len(list(tracer.iter_since(35))) == 5
+    with TraceSegmentReader(tmp_path) as reader:
+        with pytest.raises(ValueError):
+            reader.iter_since(-1)
+
+
+@pytest.mark.asyncio
+async def test_follow_sees_flushed_records_until_close(tmp_path):
+    tracer = FileRunnerTracer(tmp_path, flush_every=4)
+    followed = []
+
+    async def follow():
+        async for entry in tracer.follow():
+            followed.append(entry.timestamp)
+
+    task = asyncio.create_task(follow())
+    record_all([tracer], 6)
+    await asyncio.sleep(0)
+    assert followed == [0, 1, 2, 3]
+
+    # Truncating ends the follower, its offset no longer matches the trace
+    tracer.truncate(2)
+    await asyncio.wait_for(task, 1)
+    assert followed == [0, 1, 2, 3]
+
+    task = asyncio.create_task(follow())
+    record_all([tracer], 3)
+    tracer.close()
+    await asyncio.wait_for(task, 1)
+    assert followed == [0, 1, 2, 3, 0, 1, 0, 1, 2]
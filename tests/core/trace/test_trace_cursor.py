@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.core.trace.columnar_runner_tracer import ColumnarRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from tests.core.trace.test_columnar_runner_tracer import make_steps, record_all
+
+TRACERS = [SimpleRunnerTracer, ColumnarRunnerTracer]
+
+
+@pytest.mark.parametrize("tracer_type", TRACERS)
+def test_iter_since_reads_only_new_steps(tracer_type):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps[:4])
+
+    seen = list(tracer.iter_since(0))
+    record_all(tracer, steps[4:])
+    new = list(tracer.iter_since(len(seen)))
+
+    assert seen + new == tracer.get_trace()
+    assert list(tracer.iter_since(len(steps) + 3)) == []
+    with pytest.raises(ValueError):
+        tracer.iter_since(-1)
+
+
+@pytest.mark.parametrize("tracer_type", TRACERS)
+def test_iter_since_includes_steps_recorded_while_iterating(tracer_type):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps[:1])
+
+    read = []
+    for entry in tracer.iter_since(0):
+        read.append(entry)
+        if len(read) < len(steps):
+            record_all(tracer, [steps[len(read)]])
+
+    assert read == tracer.get_trace()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tracer_type", TRACERS)
+async def test_follow_yields_steps_as_they_are_recorded(tracer_type):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps[:3])
+    followed = []
+
+    async def follow():
+        async for entry in tracer.follow(offset=1):
+            followed.append(entry)
+            if len(followed) == len(steps) - 1:
+                return
+
+    task = asyncio.create_task(follow())
+    await asyncio.sleep(0)
+    assert len(followed) == 2
+
+    for step in steps[3:]:
+        record_all(tracer, [step])
+        await asyncio.sleep(0)
+    await asyncio.wait_for(task, 1)
+
+    assert followed == tracer.get_trace()[1:]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tracer_type", TRACERS)
+async def test_truncate_ends_active_followers(tracer_type):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps[:3])
+    recorded = tracer.get_trace()
+    followed = []
+
+    async def follow():
+        async for entry in tracer.follow():
+            followed.append(entry)
+
+    task = asyncio.create_task(follow())
+    await asyncio.sleep(0)
+    tracer.truncate(1)
+    record_all(tracer, steps[3:])
+    await asyncio.wait_for(task, 1)
+
+    assert followed == recorded
@@ -0,0 +1,88 @@
+import pytest
+
+from src.core.contracts.event import Event
+from src.core.errors import ContractViolationError
+from src.core.events.counter.counter_number import CounterNumber
+from src.core.events.counter.random_number_generator import RandomNumber
+from src.core.trace.columnar_runner_tracer import ColumnarRunnerTracer
+from src.core.trace.simple_runner_tracer import SimpleRunnerTracer
+from tests.core.trace.test_columnar_runner_tracer import make_steps, record_all
+
+TRACERS = [SimpleRunnerTracer, ColumnarRunnerTracer]
+
+
+def expected(steps, producer_id=None, start=None, end=None, event_type=None):
+    return [
+        (producer, timestamp)
+        for producer, timestamp, event in steps
+        if (producer_id is None or producer == producer_id)
+        and (start is None or timestamp >= start)
+        and (end is None or timestamp < end)
+        and (event_type is None or isinstance(event, event_type))
+    ]
+
+
+def keys(entries):
+    return [(entry.producer_id, entry.timestamp) for entry in entries]
+
+
+@pytest.mark.parametrize("tracer_type", TRACERS)
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"producer_id": "producer_1"},
+        {"start": 3, "end": 8},
+        {"producer_id": "producer_0", "start": 2},
+        {"event_type": CounterNumber},
+        {"event_type": RandomNumber, "producer_id": "producer_2", "end": 9},
+        {"event_type": Event, "start": 9},
+        {"producer_id": "missing"},
+        {"start": 8, "end": 3},
+    ],
+)
+def test_query_matches_filtered_scan(tracer_type, filters):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps)
+
+    assert keys(tracer.query(**filters)) == expected(steps, **filters)
+
+
+@pytest.mark.parametrize("tracer_type", TRACERS)
+def test_query_follows_truncation(tracer_type):
+    tracer = tracer_type()
+    steps = make_steps()
+    record_all(tracer, steps)
+    tracer.truncate(5)
+    record_all(tracer, [("producer_1", 20, CounterNumber(20, "producer_1", value=1))])
+
+    assert keys(tracer.query(producer_id="producer_1")) == [
+        ("producer_1", 1),
+        ("producer_1", 4),
+        ("producer_1", 20),
+    ]
+    assert keys(tracer.query(event_type=CounterNumber, start=2)) == [
+        ("producer_0", 3),
+        ("producer_1", 20),
+    ]
+
+
+@pytest.mark.parametrize("tracer_type", TRACERS)
+def test_time_query_on_unsorted_trace_raises(tracer_type):
+    tracer = tracer_type()
+    record_all(
+        tracer,
+        [
+            ("a", 5, CounterNumber(5, "a", value=0)),
+            ("a", 1, CounterNumber(1, "a", value=1)),
+        ],
+    )
+
+    assert keys(tracer.query(producer_id="a")) == [("a", 5), ("a", 1)]
+    with pytest.raises(ContractViolationError):
+        tracer.query(start=0)
+
+    # Truncating back to the sorted prefix makes time queries valid again
+    tracer.truncate(1)
+    assert keys(tracer.query(start=0)) == [("a", 5)]
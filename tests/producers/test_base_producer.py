@@ -1,9 +1,14 @@
+import copy
+
 import pytest
 
 from src.core.contracts.event import Event
 from src.core.errors import InvalidLifecycleError
 from src.core.time.simple_clock import SimpleClock
 from src.producers.base.base_producer import BaseProducer
+from src.producers.examples.counter_producer import CounterProducer
+from src.producers.examples.fibonacci_producer import FibonacciProducer
+from src.producers.examples.random_producer import SeededRandomProducer
 from tests.conftest import DummyEvent
 
 
@@ -46,3 +51,36 @@ def test_producer_finishes():
 
     with pytest.raises(InvalidLifecycleError):
         producer.step(timestamp=2)
+
+
+def test_step_many_default_stops_when_finished():
+    producer = DummyProducer(SimpleClock())
+    producer.start()
+
+    events = producer.step_many(start_timestamp=5, n=10)
+
+    assert [event.timestamp for event in events] == [5, 6]
+    assert producer.is_finished()
+    with pytest.raises(InvalidLifecycleError):
+        producer.step_many(start_timestamp=7, n=1)
+
+
+@pytest.mark.parametrize(
+    "make_producer",
+    [
+        lambda clock: CounterProducer(clock=clock, limit=7),
+        lambda clock: FibonacciProducer(clock=clock, limit=7),
+        lambda clock: SeededRandomProducer(clock=clock, limit=7, seed=3),
+    ],
+)
+def test_step_many_matches_single_steps(make_producer):
+    producer = make_producer(SimpleClock().as_read_only())
+    twin = copy.deepcopy(producer)
+    producer.start()
+    twin.start()
+
+    expected = [twin.step(timestamp) for timestamp in range(7)]
+    events = producer.step_many(0, 4) + producer.step_many(4, 4)
+
+    assert events == expected
+    assert producer.is_finished()
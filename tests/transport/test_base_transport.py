@@ -1,8 +1,11 @@
 import pytest
 
+from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.core.contracts.consumer import Consumer
+from src.core.contracts.event import Event
 from src.core.errors import InvalidEventError, InvalidLifecycleError
 from src.transport.base.base_transport import BaseTransport
-from tests.conftest import DummyConsumer
+from tests.conftest import DummyConsumer, DummyEvent
 
 
 def test_subscribe_adds_consumer(dummy_consumer):
@@ -66,3 +69,97 @@ async def test_publish_without_consumers_raises(dummy_event):
     await transport.start()
     with pytest.raises(InvalidLifecycleError):
         await transport.publish(dummy_event)
+
+
+@pytest.mark.asyncio
+async def test_publish_many_delivers_in_order(dummy_consumer):
+    transport = BaseTransport()
+    transport.subscribe(dummy_consumer)
+    await transport.start()
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(5)]
+    await transport.publish_many(events)
+    assert dummy_consumer.received_events == events
+
+
+@pytest.mark.asyncio
+async def test_publish_many_invalid_event_raises(dummy_consumer, dummy_event):
+    transport = BaseTransport()
+    transport.subscribe(dummy_consumer)
+    await transport.start()
+    with pytest.raises(InvalidEventError):
+        await transport.publish_many([dummy_event, "not an event"])  # type: ignore
+
+
+class DummyAsyncConsumer(AsynchronousConsumer):
+    def __init__(self):
+        self.received_events = []
+
+    async def _handle(self, event: Event) -> None:
+        self.received_events.append(event)
+
+
+def test_dispatch_plan_groups_consumers(dummy_consumer):
+    transport = BaseTransport()
+    async_consumer = DummyAsyncConsumer()
+    transport.subscribe(dummy_consumer)
+    transport.subscribe(async_consumer)
+    assert transport._plan.sync_consumers == (dummy_consumer,)
+    assert transport._plan.async_consumers == (async_consumer,)
+
+    transport.unsubscribe(async_consumer)
+    assert transport._plan.async_consumers == ()
+
+
+class InlineConsumer(Consumer):
+    """Consumer implementing the contract directly, without SynchronousConsumer."""
+
+    def __init__(self):
+        self.received_events = []
+
+    @property
+    def is_synchronous(self) -> bool:
+        return True
+
+    def handle_event(self, event: Event) -> None:
+        self.received_events.append(event)
+
+    def handle_events(self, events) -> None:
+        self.received_events.extend(events)
+
+    @property
+    def consumer_id(self) -> str:
+        return "inline"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_plan_classifies_consumers_through_contract(dummy_event):
+    transport = BaseTransport()
+    async_consumer = DummyAsyncConsumer()
+    inline_consumer = InlineConsumer()
+    transport.subscribe(async_consumer)
+    transport.subscribe(inline_consumer)
+    assert transport._plan.sync_consumers == (inline_consumer,)
+    assert transport._plan.async_consumers == (async_consumer,)
+
+    await transport.start()
+    await transport.publish(dummy_event)
+    await transport.publish_many([dummy_event])
+    assert inline_consumer.received_events == [dummy_event, dummy_event]
+    assert async_consumer.received_events == [dummy_event, dummy_event]
+
+
+@pytest.mark.asyncio
+async def test_publish_mixed_consumers(dummy_consumer, dummy_event):
+    transport = BaseTransport()
+    async_consumers = [DummyAsyncConsumer(), DummyAsyncConsumer()]
+    transport.subscribe(dummy_consumer)
+    for consumer in async_consumers:
+        transport.subscribe(consumer)
+    await transport.start()
+
+    await transport.publish(dummy_event)
+    await transport.publish_many([dummy_event])
+
+    assert dummy_consumer.received_events == [dummy_event, dummy_event]
+    for consumer in async_consumers:
+        assert consumer.received_events == [dummy_event, dummy_event]
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.errors import InvalidLifecycleError
+from src.transport.in_memory.fan_out_transport import FanOutTransport
+from src.transport.in_memory.overflow_policy import OverflowPolicy
+from tests.conftest import DummyConsumer, DummyEvent
+
+
+class GatedConsumer(AsynchronousConsumer):
+    """Consumer that holds every event until its gate is opened."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.received_events = []
+
+    async def _handle(self, event: Event) -> None:
+        await self.gate.wait()
+        self.received_events.append(event)
+
+
+async def _wait_for_delivery(transport, consumer):
+    for _ in range(100):
+        if transport.lane_stats(consumer).lag == 0:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("Lane did not drain.")
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_delay_fast_consumer():
+    transport = FanOutTransport()
+    fast = DummyConsumer()
+    slow = GatedConsumer()
+    transport.subscribe(fast)
+    transport.subscribe(slow)
+    await transport.start()
+
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(5)]
+    await transport.publish_many(events)
+    await _wait_for_delivery(transport, fast)
+
+    assert fast.received_events == events
+    assert slow.received_events == []
+    assert transport.lane_stats(slow).lag == 5
+
+    slow.gate.set()
+    await transport.shutdown()
+    assert slow.received_events == events
+    assert [stats.delivered_events for stats in transport.stats()] == [5, 5]
+
+
+@pytest.mark.asyncio
+async def test_lanes_apply_their_own_overflow_policy():
+    transport = FanOutTransport()
+    lossless = DummyConsumer()
+    live = GatedConsumer()
+    transport.subscribe(lossless, overflow_policy=OverflowPolicy.BLOCK)
+    transport.subscribe(
+        live, capacity=2, batch_size=1, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    await transport.start()
+
+    for i in range(6):
+        await transport.publish(DummyEvent(timestamp=i, producer_id="p"))
+    await _wait_for_delivery(transport, lossless)
+    live.gate.set()
+    await transport.shutdown()
+
+    assert [event.timestamp for event in lossless.received_events] == list(range(6))
+    stats = transport.lane_stats(live)
+    assert stats.dropped_events == stats.published_events - stats.delivered_events
+    assert stats.dropped_events > 0
+    assert live.received_events[-1].timestamp == 5
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_keeps_receiving_while_slow_lane_is_full():
+    transport = FanOutTransport()
+    slow = GatedConsumer()
+    fast = DummyConsumer()
+    transport.subscribe(slow, capacity=2, batch_size=1)
+    transport.subscribe(fast)
+    await transport.start()
+
+    for i in range(20):
+        await asyncio.wait_for(
+            transport.publish(DummyEvent(timestamp=i, producer_id="p")), 1
+        )
+        await _wait_for_delivery(transport, fast)
+        assert len(fast.received_events) == i + 1
+
+    assert transport.lane_stats(slow).dropped_events > 0
+    slow.gate.set()
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_lane_waits_after_other_lanes_got_the_event():
+    transport = FanOutTransport()
+    slow = GatedConsumer()
+    fast = DummyConsumer()
+    transport.subscribe(slow, capacity=1, overflow_policy=OverflowPolicy.BLOCK)
+    transport.subscribe(fast)
+    await transport.start()
+
+    await transport.publish(DummyEvent(timestamp=0, producer_id="p"))
+    await asyncio.sleep(0)
+    await transport.publish(DummyEvent(timestamp=1, producer_id="p"))
+    blocked = asyncio.create_task(
+        transport.publish(DummyEvent(timestamp=2, producer_id="p"))
+    )
+    await _wait_for_delivery(transport, fast)
+    assert not blocked.done()
+    assert [event.timestamp for event in fast.received_events] == [0, 1, 2]
+
+    slow.gate.set()
+    await blocked
+    await transport.shutdown()
+    assert [event.timestamp for event in slow.received_events] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_start_raises(dummy_consumer):
+    transport = FanOutTransport()
+    transport.subscribe(dummy_consumer)
+    await transport.start()
+    with pytest.raises(InvalidLifecycleError):
+        transport.subscribe(DummyConsumer())
+    with pytest.raises(InvalidLifecycleError):
+        transport.unsubscribe(dummy_consumer)
+    await transport.shutdown()
+
+
+def test_unsubscribe_removes_lane(dummy_consumer):
+    transport = FanOutTransport()
+    transport.subscribe(dummy_consumer)
+    transport.unsubscribe(dummy_consumer)
+    assert transport.stats() == []
+    with pytest.raises(InvalidLifecycleError):
+        transport.lane_stats(dummy_consumer)
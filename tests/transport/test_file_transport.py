@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from src.consumers.base.asynchronous_consumer import AsynchronousConsumer
+from src.core.contracts.event import Event
+from src.core.errors import InvalidLifecycleError
+from src.core.events.counter.counter_number import CounterNumber
+from src.transport.file.file_log_reader import FileLogReader
+from src.transport.file.file_transport import FileTransport
+from tests.conftest import DummyConsumer, DummyEvent
+
+
+class GatedConsumer(AsynchronousConsumer):
+    """Consumer that holds every event until its gate is opened."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.received_events = []
+
+    async def _handle(self, event: Event) -> None:
+        await self.gate.wait()
+        self.received_events.append(event)
+
+
+def counter_events(start, stop):
+    return [
+        CounterNumber(timestamp=i, producer_id="CounterProducer_0", value=i)
+        for i in range(start, stop)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_events_are_logged_and_delivered_in_order(tmp_path):
+    consumer = DummyConsumer()
+    transport = FileTransport(tmp_path, fsync_every=10, segment_size=256)
+    transport.subscribe(consumer)
+    await transport.start()
+
+    events = counter_events(0, 50)
+    for event in events[:5]:
+        await transport.publish(event)
+    for start in range(5, 50, 15):
+        await transport.publish_many(events[start : start + 15])
+        await transport.flush()
+    await transport.shutdown()
+
+    assert consumer.received_events == events
+    assert transport.committed_events == 50
+    assert len(list(tmp_path.iterdir())) > 1
+    with FileLogReader(tmp_path) as reader:
+        assert reader.read() == events
+
+
+@pytest.mark.asyncio
+async def test_publish_does_not_wait_for_sync_and_commits_in_groups(tmp_path):
+    transport = FileTransport(tmp_path, fsync_every=100, fsync_interval=10)
+    await transport.start()
+
+    for event in counter_events(0, 250):
+        await transport.publish(event)
+    assert transport.published_events == 250
+
+    await transport.flush()
+    assert transport.pending_events == 0
+    assert transport.syncs <= 3
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_delay_commits(tmp_path):
+    consumer = GatedConsumer()
+    transport = FileTransport(tmp_path, fsync_every=1, capacity=2)
+    transport.subscribe(consumer)
+    await transport.start()
+
+    events = counter_events(0, 20)
+    for event in events:
+        await asyncio.wait_for(transport.publish(event), 1)
+    for _ in range(100):
+        if transport.committed_events == 20:
+            break
+        await asyncio.sleep(0.01)
+
+    assert transport.committed_events == 20
+    assert transport.delivered_events == 0
+    with FileLogReader(tmp_path) as reader:
+        assert reader.read() == events
+
+    consumer.gate.set()
+    await transport.flush()
+    assert transport.delivered_events == 20
+    assert consumer.received_events == events
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_interval_commits_without_flush(tmp_path):
+    transport = FileTransport(tmp_path, fsync_interval=0.01)
+    await transport.start()
+    await transport.publish(DummyEvent(timestamp=1, producer_id="p"))
+
+    for _ in range(100):
+        if transport.committed_events:
+            break
+        await asyncio.sleep(0.01)
+    assert transport.committed_events == 1
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_reader_tails_from_offset_across_reopened_log(tmp_path):
+    transport = FileTransport(tmp_path, fsync_every=4)
+    await transport.start()
+    await transport.publish_many(counter_events(0, 10))
+    await transport.shutdown()
+
+    reopened = FileTransport(tmp_path, fsync_every=4)
+    assert reopened.end_offset == 10
+    await reopened.start()
+
+    reader = FileLogReader(tmp_path, offset=8, poll_interval=0.01)
+    tailed = []
+
+    async def tail():
+        async for event in reader.tail():
+            tailed.append(event.timestamp)
+            if len(tailed) == 6:
+                return
+
+    task = asyncio.create_task(tail())
+    await reopened.publish_many(counter_events(10, 14))
+    await reopened.flush()
+    await asyncio.wait_for(task, 1)
+    await reopened.shutdown()
+
+    assert tailed == [8, 9, 10, 11, 12, 13]
+    assert reader.offset == 14
+    reader.close()
+
+
+@pytest.mark.asyncio
+async def test_commit_failure_is_raised_on_next_publish(tmp_path, monkeypatch):
+    transport = FileTransport(tmp_path)
+    await transport.start()
+
+    def fail(data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(transport, "_write_and_sync", fail)
+    await transport.publish(DummyEvent(timestamp=1, producer_id="p"))
+    with pytest.raises(OSError):
+        await transport.flush()
+    with pytest.raises(OSError):
+        await transport.publish(DummyEvent(timestamp=2, producer_id="p"))
+
+
+@pytest.mark.asyncio
+async def test_publish_requires_running_transport(tmp_path):
+    transport = FileTransport(tmp_path)
+    with pytest.raises(InvalidLifecycleError):
+        await transport.publish(DummyEvent(timestamp=1, producer_id="p"))
+
+
+def test_invalid_settings_raise(tmp_path):
+    with pytest.raises(ValueError):
+        FileTransport(tmp_path, fsync_every=0)
+    with pytest.raises(ValueError):
+        FileTransport(tmp_path, capacity=10, fsync_every=100)
+    with pytest.raises(ValueError):
+        FileLogReader(tmp_path, offset=-1)
@@ -2,7 +2,8 @@ import pytest
 
 from src.core.errors import InvalidEventError, InvalidLifecycleError
 from src.transport.in_memory.in_memory_transport import InMemoryTransport
-from tests.conftest import DummyConsumer
+from src.transport.in_memory.overflow_policy import OverflowPolicy
+from tests.conftest import DummyConsumer, DummyEvent
 
 
 def test_subscribe_adds_consumer(dummy_consumer):
@@ -78,3 +79,96 @@ async def test_shutdown_cleans_up_workers(dummy_consumer, dummy_event):
     await transport.publish(dummy_event)
     await transport.shutdown()
     assert len(transport._tasks) == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_many_delivers_in_order(dummy_consumer):
+    transport = InMemoryTransport(batch_size=4)
+    transport.subscribe(dummy_consumer)
+    await transport.start()
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(10)]
+    await transport.publish_many(events)
+    await transport.shutdown()
+    assert dummy_consumer.received_events == events
+
+
+@pytest.mark.asyncio
+async def test_publish_many_without_consumers_raises(dummy_event):
+    transport = InMemoryTransport()
+    await transport.start()
+    with pytest.raises(InvalidLifecycleError):
+        await transport.publish_many([dummy_event])
+
+
+async def _publish_over_capacity(transport, consumer, events):
+    # Workers only start draining once publish_many yields, which the lossy policies never do
+    transport.subscribe(consumer)
+    await transport.start()
+    await transport.publish_many(events)
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_is_lossless(dummy_consumer):
+    transport = InMemoryTransport(capacity=2)
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(10)]
+    await _publish_over_capacity(transport, dummy_consumer, events)
+    assert dummy_consumer.received_events == events
+    assert transport.dropped_events == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_policy(dummy_consumer):
+    transport = InMemoryTransport(
+        capacity=3, overflow_policy=OverflowPolicy.DROP_NEWEST
+    )
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(10)]
+    await _publish_over_capacity(transport, dummy_consumer, events)
+    assert dummy_consumer.received_events == events[:3]
+    assert transport.dropped_events == 7
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy(dummy_consumer):
+    transport = InMemoryTransport(
+        capacity=3, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(10)]
+    await _publish_over_capacity(transport, dummy_consumer, events)
+    assert dummy_consumer.received_events == events[-3:]
+    assert transport.dropped_events == 7
+
+
+@pytest.mark.asyncio
+async def test_sample_policy(dummy_consumer):
+    transport = InMemoryTransport(
+        capacity=2, overflow_policy=OverflowPolicy.SAMPLE, sample_every=3
+    )
+    events = [DummyEvent(timestamp=i, producer_id="p") for i in range(11)]
+    await _publish_over_capacity(transport, dummy_consumer, events)
+    # Overflowing events 2..10: the 3rd and 6th (timestamps 4 and 7) and 9th (10) are kept
+    assert [event.timestamp for event in dummy_consumer.received_events] == [7, 10]
+    assert transport.dropped_events == 9
+
+
+@pytest.mark.asyncio
+async def test_coalesce_by_producer_policy(dummy_consumer):
+    transport = InMemoryTransport(
+        capacity=2, overflow_policy=OverflowPolicy.COALESCE_BY_PRODUCER
+    )
+    events = [
+        DummyEvent(timestamp=0, producer_id="a"),
+        DummyEvent(timestamp=1, producer_id="b"),
+        DummyEvent(timestamp=2, producer_id="a"),
+        DummyEvent(timestamp=3, producer_id="c"),
+        DummyEvent(timestamp=4, producer_id="b"),
+    ]
+    await _publish_over_capacity(transport, dummy_consumer, events)
+    assert [event.timestamp for event in dummy_consumer.received_events] == [2, 4]
+    assert transport.coalesced_events == 2
+    assert transport.dropped_events == 1
+
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        InMemoryTransport(capacity=0)
@@ -0,0 +1,113 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from src.consumers.base.synchronous_consumer import SynchronousConsumer
+from src.core.errors import InvalidEventError, InvalidLifecycleError
+from src.core.events.counter.counter_number import CounterNumber
+from src.transport.shared_memory.shared_memory_transport import SharedMemoryTransport
+from tests.conftest import DummyConsumer, DummyEvent
+
+
+class ReportingConsumer(SynchronousConsumer):
+    def __init__(self, queue):
+        self.queue = queue
+
+    def _handle(self, event):
+        self.queue.put([(os.getpid(), event.timestamp, event.value)])
+
+
+def counter_events(count):
+    return [
+        CounterNumber(timestamp=i, producer_id="CounterProducer_0", value=i * 3)
+        for i in range(count)
+    ]
+
+
+def collect(queue, count):
+    received = []
+    while len(received) < count:
+        received.extend(queue.get(timeout=10))
+    return received
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+async def test_every_consumer_process_receives_every_event(start_method):
+    context = multiprocessing.get_context(start_method)
+    queues = [context.Queue(), context.Queue()]
+    transport = SharedMemoryTransport(slots=16, batch_size=5, start_method=start_method)
+    for queue in queues:
+        transport.subscribe(ReportingConsumer(queue))
+    await transport.start()
+
+    events = counter_events(100)
+    await transport.publish(events[0])
+    await transport.publish_many(events[1:])
+    await transport.shutdown()
+
+    assert transport.published_events == 100
+    for queue in queues:
+        received = collect(queue, 100)
+        assert [(ts, value) for _, ts, value in received] == [
+            (event.timestamp, event.value) for event in events
+        ]
+        assert {pid for pid, _, _ in received} != {os.getpid()}
+
+
+@pytest.mark.asyncio
+async def test_unencodable_events_are_rejected():
+    transport = SharedMemoryTransport(slots=4, slot_size=16, start_method="fork")
+    transport.subscribe(DummyConsumer())
+    await transport.start()
+
+    with pytest.raises(InvalidEventError):
+        await transport.publish(DummyEvent(timestamp=0, producer_id="p"))
+    with pytest.raises(InvalidEventError):
+        await transport.publish(
+            CounterNumber(timestamp=0, producer_id="p" * 32, value=1)
+        )
+    with pytest.raises(InvalidEventError):
+        await transport.publish("not an event")  # type: ignore
+    await transport.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_fixed_once_started():
+    transport = SharedMemoryTransport(slots=4, start_method="fork")
+    consumer = DummyConsumer()
+    transport.subscribe(consumer)
+    await transport.start()
+
+    with pytest.raises(InvalidLifecycleError):
+        transport.subscribe(DummyConsumer())
+    with pytest.raises(InvalidLifecycleError):
+        transport.unsubscribe(consumer)
+    await transport.shutdown()
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        SharedMemoryTransport(slots=0)
+    with pytest.raises(ValueError):
+        SharedMemoryTransport(batch_size=0)
+
+
+class HangingConsumer(SynchronousConsumer):
+    def _handle(self, event):
+        time.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_terminates_hanging_consumer(caplog):
+    transport = SharedMemoryTransport(slots=4, start_method="fork", stop_timeout=0.2)
+    transport.subscribe(HangingConsumer())
+    await transport.start()
+    await transport.publish(counter_events(1)[0])
+
+    started = time.monotonic()
+    await transport.shutdown()
+    assert time.monotonic() - started < 10
+    assert "terminating it" in caplog.text